@@ -1,18 +1,22 @@
-import requests
-import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta, timezone
 from typing import Dict
 import os
+import json
 import time
+import random
+import atexit
 import logging
-from mvrv_scraper import MVRVScraper
-import time
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from mvrv_scraper import MVRVScraper, FileCache, _quit_quietly
+from http_client import get_session, _json_loads
 import re
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 # 🎯 NEW: Import Pi Cycle indicator
 from pi_cycle_indicator import PiCycleTopIndicator
@@ -40,6 +44,130 @@ if os.name == 'nt':  # Windows
 # with:
 # logging.info("SUCCESS: HYBRID BTC: LIVE price from CoinGecko...")
 
+# Price, EMA200, weekly RSI, MVRV and mining cost have no data dependency on each other,
+# so get_btc_data fetches them side by side (Pi Cycle joins as soon as the price is in).
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix='btc-fetch')
+
+# Attempts made after an HTTP 429 before the response is handed back to the caller
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Ceiling in seconds for the jittered exponential backoff used when a 429 has no Retry-After
+MAX_BACKOFF = 60
+
+# (connect, read) seconds for API calls that don't set their own timeout
+REQUEST_TIMEOUT = (5, 10)
+
+# How long a connectivity check result is reused before probing the APIs again
+HEALTHCHECK_TTL = 3600
+
+# CoinGecko refreshes BTC/USD about once a minute, so a quote this young is still current
+LIVE_PRICE_TTL = timedelta(seconds=45)
+
+CCAF_MINING_DATA_URL = "https://ccaf.io/cbnsi/cbeci/mining_map/mining_data"
+CCAF_MINING_COST_XPATH = '//*[@id="wrap-container"]/div[3]/div/div[1]/div[1]/div/div/div[2]/div/div[2]/div/div[2]/h2'
+# Seconds to wait for the CCAF mining cost to render (covers the old 15s page wait + 15s sleep)
+CCAF_LOAD_TIMEOUT = 30
+
+# Strips currency formatting from the CCAF figure; the regex is only needed when text surrounds the number
+_CURRENCY_FORMATTING = str.maketrans('', '', '$, ')
+_NUMBER_RE = re.compile(r'([0-9]+\.?[0-9]*)')
+# Plain decimals only - float() alone would also take '1e5', '50_000', '-70000', 'nan' and 'inf'
+_PLAIN_NUMBER_RE = re.compile(r'[0-9]+(\.[0-9]+)?')
+
+
+def _ccaf_value_rendered(driver):
+    """WebDriverWait condition: the CCAF mining cost element once its text holds a number, else False"""
+    for element in driver.find_elements(By.XPATH, CCAF_MINING_COST_XPATH):
+        if _NUMBER_RE.search(element.text.strip().translate(_CURRENCY_FORMATTING)):
+            return element
+    return False
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` requests per `per` seconds.
+    Callers only wait when the bucket is empty, instead of sleeping unconditionally.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.capacity = float(rate)
+        self._fill_rate = rate / per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self._fill_rate)
+            time.sleep(wait)
+
+    def block_for(self, seconds: float) -> None:
+        """Drain the bucket and hold every caller back for `seconds` (e.g. after a 429)"""
+        with self._lock:
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _ema_update(ema: float, closes, period: int) -> float:
+    """Advance an EMA (pandas ewm span=period, adjust=False) over `closes`"""
+    alpha = 2.0 / (period + 1)
+    for price in closes:
+        ema = alpha * price + (1 - alpha) * ema
+    return ema
+
+
+def _wilder_update(avg_gain: float, avg_loss: float, prev_close: float, closes, period: int):
+    """
+    Advance Wilder's average gain/loss over `closes`, starting from `prev_close`.
+    Diff, gain/loss split and smoothing happen in one pass with no intermediate arrays.
+    """
+    alpha = 1.0 / period
+    decay = 1 - alpha
+    for price in closes:
+        delta = price - prev_close
+        prev_close = price
+        if delta > 0:
+            avg_gain = alpha * delta + decay * avg_gain
+            avg_loss = decay * avg_loss
+        else:
+            avg_gain = decay * avg_gain
+            avg_loss = decay * avg_loss - alpha * delta
+    return avg_gain, avg_loss
+
+
+def _wilder_averages(prices, period: int):
+    """Wilder's average gain/loss over a whole price series, seeded with its first change"""
+    values = np.asarray(prices, dtype=np.float64).tolist()
+    first_delta = values[1] - values[0]
+    return _wilder_update(max(first_delta, 0.0), max(-first_delta, 0.0), values[1], values[2:], period)
+
+
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        # Only gains: RS is infinite (RSI 100); a flat series has no defined RSI
+        return 100.0 if avg_gain > 0 else float('nan')
+
+    rs = avg_gain / avg_loss
+    return float(100 - (100 / (1 + rs)))
+
+
+def _retry_after_seconds(response, default: float) -> float:
+    """Seconds to back off after a 429, from Retry-After when the server sends one"""
+    try:
+        return max(float(response.headers.get('Retry-After')), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
 class HybridBTCCollector:
     """
     🎯 HYBRID BTC Collector: CoinGecko Live Prices + Polygon Historical Data + Pi Cycle
@@ -51,7 +179,12 @@ class HybridBTCCollector:
     Fallback: Polygon yesterday close (when CoinGecko fails)
     """
 
-    def __init__(self, api_key: str = None):
+    # Warm Chrome driver shared by every collector for the CCAF scrape, started on first use
+    _ccaf_driver = None
+    _ccaf_options = None
+    _ccaf_lock = threading.Lock()
+
+    def __init__(self, api_key: str = None, cache_dir: str = '.cache'):
         self.api_key = api_key or os.getenv('POLYGON_API_KEY')
         if not self.api_key:
             raise ValueError(
@@ -59,126 +192,177 @@ class HybridBTCCollector:
 
         self.api_key = self.api_key.strip()
         self.base_url = "https://api.polygon.io"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BTC-Monitor-Hybrid/1.0'
-        })
+        self.session = get_session()
+
+        # Per-host rate limits: Polygon free tier allows 5 req/min, CoinGecko ~30 req/min
+        self._polygon_limiter = TokenBucket(5, 60)
+        self._coingecko_limiter = TokenBucket(30, 60)
+
+        self._health = None
+        self._health_checked_at = 0.0
+
+        # EMA200, weekly RSI and historical closes change at most once a day
+        self.cache_dir = cache_dir
+        self._cache = FileCache(cache_dir, timedelta(hours=24))
+        # Live quotes are shared between collectors and back-to-back runs for LIVE_PRICE_TTL
+        self._price_cache = FileCache(cache_dir, LIVE_PRICE_TTL)
 
         # Initialize MVRV scraper
-        self.mvrv_scraper = MVRVScraper()
+        self.mvrv_scraper = MVRVScraper(session=self.session)
 
         # 🎯 NEW: Initialize Pi Cycle indicator
-        self.pi_cycle_indicator = PiCycleTopIndicator(polygon_api_key=self.api_key)
+        self.pi_cycle_indicator = PiCycleTopIndicator(polygon_api_key=self.api_key, session=self.session,
+                                                      http_get=self._polygon_get)
 
     def get_btc_data(self) -> Dict:
         """
         🎯 ENHANCED: Get complete BTC data: Live price + Historical indicators + MVRV + Pi Cycle + Mining Cost
         Returns dict with: price, weekly_rsi, ema_200, mvrv, pi_cycle, mining_cost, price_source
         """
+        # One collection, one timestamp - success and failure results report the same moment
+        timestamp = datetime.now(timezone.utc).isoformat()
         try:
             logging.info("🎯 Starting ENHANCED HYBRID BTC data collection with Pi Cycle + Mining Cost...")
 
-            # 🎯 Get LIVE BTC price from CoinGecko (or fallback to Polygon yesterday)
-            price_result = self.get_live_btc_price_with_fallback()
-            current_price = price_result['price']
-            price_source = price_result['source']
-            price_note = price_result['note']
-
-            # 🎯 ENHANCED LOGGING: Clear indication of what's happening
-            if price_source == 'coingecko':
-                logging.info(f"🟢 HYBRID BTC: LIVE price from CoinGecko: ${current_price:,.2f}")
-                logging.info(f"   📡 {price_note}")
-                logging.info(f"   🎯 SUCCESS: Using real-time market data!")
-            elif price_source == 'polygon_yesterday':
-                logging.warning(f"🟡 HYBRID BTC: Yesterday close from Polygon: ${current_price:,.2f}")
-                logging.warning(f"   📡 {price_note}")
-                logging.warning(f"   ⚠️ FALLBACK: CoinGecko failed, using 1-day old data")
-            elif price_source == 'polygon_2day_old':
-                logging.error(f"🔴 HYBRID BTC: 2-day old close from Polygon: ${current_price:,.2f}")
-                logging.error(f"   📡 {price_note}")
-                logging.error(f"   🚨 STALE FALLBACK: Using 2-day old data - check APIs!")
-            else:
-                logging.warning(f"❓ HYBRID BTC: Unknown source '{price_source}': ${current_price:,.2f}")
-
-            # Add delay to respect rate limits
-            time.sleep(15)
-
-            # Get daily data for EMA200 calculation (Polygon historical - works on free tier)
-            daily_ema_200 = self.get_daily_ema_200()
-            logging.info(f"✅ EMA200 collected: ${daily_ema_200:,.2f}")
-
-            # Add delay to respect rate limits
-            time.sleep(15)
-
-            # Get weekly data for RSI calculation (Polygon historical - works on free tier)
-            weekly_rsi = self.get_weekly_rsi()
-            logging.info(f"✅ Weekly RSI collected: {weekly_rsi:.1f}")
-
-            # Get MVRV from TradingView scraper
-            logging.info("Collecting MVRV data from TradingView...")
-            mvrv_value = self.mvrv_scraper.get_mvrv_value(verbose=False)
-            logging.info(f"✅ MVRV collected: {mvrv_value:.2f}")
-
-            # 🎯 NEW: Get Pi Cycle Top indicator data
-            logging.info("🥧 Collecting Pi Cycle Top indicator data...")
-            pi_cycle_data = self.pi_cycle_indicator.get_pi_cycle_analysis(current_btc_price=current_price)
-
-            # 🎯 DEBUG: Log Pi Cycle collection status
-            if pi_cycle_data.get('success'):
-                proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
-                gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
-                logging.info(f"✅ Pi Cycle collected: {proximity_level} ({gap_percentage:.1f}% gap)")
-            else:
-                logging.warning(f"⚠️ Pi Cycle collection failed: {pi_cycle_data.get('error', 'Unknown error')}")
-
-            # 🎯 NEW: Get Mining Cost data
-            logging.info("⛏️ Collecting Bitcoin mining cost data...")
-            mining_cost_data = self.get_mining_cost_data()
-
-            if mining_cost_data.get('success'):
-                mining_cost = mining_cost_data.get('mining_cost', 'N/A')
-                data_date = mining_cost_data.get('data_date', 'Unknown')
-                logging.info(f"✅ Mining Cost collected: ${mining_cost:,.0f} (Date: {data_date})")
-            else:
-                mining_cost = 'N/A'
-                data_date = 'N/A'
-                logging.warning(f"⚠️ Mining Cost collection failed: {mining_cost_data.get('error', 'Unknown error')}")
-
-            # 🎯 FINAL STATUS LOG
-            logging.info(f"📊 Complete BTC indicators: EMA200=${daily_ema_200:,.2f}, "
-                         f"Weekly RSI={weekly_rsi:.1f}, MVRV={mvrv_value:.2f}, "
-                         f"Pi Cycle={pi_cycle_data.get('signal_status', {}).get('proximity_level', 'FAILED')}, "
-                         f"Mining Cost=${mining_cost if mining_cost != 'N/A' else 'N/A'}")
-
-            result = {
-                'success': True,
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'price': current_price,
-                'price_source': price_source,
-                'price_note': price_note,
-                'ema_200': daily_ema_200,
-                'weekly_rsi': weekly_rsi,
-                'mvrv': mvrv_value,
-                'pi_cycle': pi_cycle_data,  # 🎯 NEW: Include Pi Cycle data
-                'mining_cost': mining_cost,  # 🎯 NEW: Include Mining Cost
-                'mining_cost_date': data_date,  # 🎯 NEW: Include data date
-                'source': f'{price_source} + polygon_historical + tradingview + pi_cycle + macromicro'
+            # Independent network fetches run concurrently; results are consumed in order below
+            futures = {
+                'price': _FETCH_EXECUTOR.submit(self.get_live_btc_price_with_fallback),
+                'ema_200': _FETCH_EXECUTOR.submit(self.get_daily_ema_200),
+                'weekly_rsi': _FETCH_EXECUTOR.submit(self.get_weekly_rsi),
+                'mvrv': _FETCH_EXECUTOR.submit(self.mvrv_scraper.get_mvrv_value, verbose=False),
+                'mining_cost': _FETCH_EXECUTOR.submit(self.get_mining_cost_data),
             }
-
-            logging.info(f"🎉 Complete ENHANCED HYBRID BTC data collected successfully with Pi Cycle + Mining Cost!")
-            return result
+            try:
+                return self._assemble_btc_data(futures, timestamp)
+            finally:
+                # No-op for finished fetches; drops queued ones after an early failure
+                for future in futures.values():
+                    future.cancel()
 
         except Exception as e:
-            logging.error(f"Error collecting enhanced BTC data: {str(e)}")
+            logging.error("Error collecting enhanced BTC data: %s", e)
             return {
                 'success': False,
                 'error': str(e),
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': timestamp,
                 'pi_cycle': {'success': False, 'error': f'Collection failed: {str(e)}'},  # 🎯 Include failed Pi Cycle
                 'mining_cost': 'N/A',  # 🎯 Include failed Mining Cost
                 'mining_cost_date': 'N/A'
             }
 
+    def _assemble_btc_data(self, futures: Dict, timestamp: str) -> Dict:
+        """
+        Combine the concurrent fetches from get_btc_data, starting Pi Cycle once the price is known.
+        Exceptions raised by any fetch propagate to the caller.
+        """
+        # 🎯 Get LIVE BTC price from CoinGecko (or fallback to Polygon yesterday)
+        price_result = futures['price'].result()
+        current_price = price_result['price']
+        price_source = price_result['source']
+        price_note = price_result['note']
+
+        # Pi Cycle only needs the price, so start it before waiting on the slower fetches
+        futures['pi_cycle'] = _FETCH_EXECUTOR.submit(
+            self.pi_cycle_indicator.get_pi_cycle_analysis, current_btc_price=current_price)
+
+        # 🎯 ENHANCED LOGGING: Clear indication of what's happening
+        if price_source == 'coingecko':
+            logging.info("🟢 HYBRID BTC: LIVE price from CoinGecko: $%.2f", current_price)
+            logging.info("   📡 %s", price_note)
+            logging.info("   🎯 SUCCESS: Using real-time market data!")
+        elif price_source == 'polygon_yesterday':
+            logging.warning("🟡 HYBRID BTC: Yesterday close from Polygon: $%.2f", current_price)
+            logging.warning("   📡 %s", price_note)
+            logging.warning("   ⚠️ FALLBACK: CoinGecko failed, using 1-day old data")
+        elif price_source == 'polygon_2day_old':
+            logging.error("🔴 HYBRID BTC: 2-day old close from Polygon: $%.2f", current_price)
+            logging.error("   📡 %s", price_note)
+            logging.error("   🚨 STALE FALLBACK: Using 2-day old data - check APIs!")
+        else:
+            logging.warning("❓ HYBRID BTC: Unknown source '%s': $%.2f", price_source, current_price)
+
+        # Get daily data for EMA200 calculation (Polygon historical - works on free tier)
+        daily_ema_200 = futures['ema_200'].result()
+        logging.info("✅ EMA200 collected: $%.2f", daily_ema_200)
+
+        # Get weekly data for RSI calculation (Polygon historical - works on free tier)
+        weekly_rsi = futures['weekly_rsi'].result()
+        logging.info("✅ Weekly RSI collected: %.1f", weekly_rsi)
+
+        # Get MVRV from TradingView scraper
+        logging.info("Waiting for MVRV data from TradingView...")
+        mvrv_value = futures['mvrv'].result()
+        logging.info("✅ MVRV collected: %.2f", mvrv_value)
+
+        # 🎯 NEW: Get Pi Cycle Top indicator data
+        logging.info("🥧 Waiting for Pi Cycle Top indicator data...")
+        pi_cycle_data = futures['pi_cycle'].result()
+
+        # 🎯 DEBUG: Log Pi Cycle collection status
+        if pi_cycle_data.get('success'):
+            proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
+            gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
+            logging.info("✅ Pi Cycle collected: %s (%.1f%% gap)", proximity_level, gap_percentage)
+        else:
+            logging.warning("⚠️ Pi Cycle collection failed: %s", pi_cycle_data.get('error', 'Unknown error'))
+
+        # 🎯 NEW: Get Mining Cost data
+        logging.info("⛏️ Waiting for Bitcoin mining cost data...")
+        mining_cost_data = futures['mining_cost'].result()
+
+        if mining_cost_data.get('success'):
+            mining_cost = mining_cost_data.get('mining_cost', 'N/A')
+            data_date = mining_cost_data.get('data_date', 'Unknown')
+            logging.info("✅ Mining Cost collected: $%.0f (Date: %s)", mining_cost, data_date)
+        else:
+            mining_cost = 'N/A'
+            data_date = 'N/A'
+            logging.warning("⚠️ Mining Cost collection failed: %s", mining_cost_data.get('error', 'Unknown error'))
+
+        # 🎯 FINAL STATUS LOG
+        logging.info("📊 Complete BTC indicators: EMA200=$%.2f, Weekly RSI=%.1f, MVRV=%.2f, "
+                     "Pi Cycle=%s, Mining Cost=$%s",
+                     daily_ema_200, weekly_rsi, mvrv_value,
+                     pi_cycle_data.get('signal_status', {}).get('proximity_level', 'FAILED'), mining_cost)
+
+        result = {
+            'success': True,
+            'timestamp': timestamp,
+            'price': current_price,
+            'price_source': price_source,
+            'price_note': price_note,
+            'ema_200': daily_ema_200,
+            'weekly_rsi': weekly_rsi,
+            'mvrv': mvrv_value,
+            'pi_cycle': pi_cycle_data,  # 🎯 NEW: Include Pi Cycle data
+            'mining_cost': mining_cost,  # 🎯 NEW: Include Mining Cost
+            'mining_cost_date': data_date,  # 🎯 NEW: Include data date
+            'source': f'{price_source} + polygon_historical + tradingview + pi_cycle + macromicro'
+        }
+
+        logging.info("🎉 Complete ENHANCED HYBRID BTC data collected successfully with Pi Cycle + Mining Cost!")
+        return result
+
+    def _rate_limited_get(self, limiter: TokenBucket, url: str, **kwargs):
+        """GET through `limiter`, backing off and retrying on HTTP 429"""
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            limiter.acquire()
+            response = self.session.get(url, **kwargs)
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            # Full jitter keeps threads throttled together from retrying in lockstep
+            delay = _retry_after_seconds(response, default=random.uniform(0, min(MAX_BACKOFF, 2 ** attempt)))
+            logging.warning("⏳ Rate limited by %s, retrying in %.1fs", url.split('/')[2], delay)
+            limiter.block_for(delay)
+
+    def _polygon_get(self, url: str, **kwargs):
+        return self._rate_limited_get(self._polygon_limiter, url, **kwargs)
+
+    def _coingecko_get(self, url: str, **kwargs):
+        return self._rate_limited_get(self._coingecko_limiter, url, **kwargs)
+
     def get_live_btc_price_with_fallback(self) -> Dict:
         """
         🎯 PRIMARY: Get live BTC price from CoinGecko
@@ -187,24 +371,27 @@ class HybridBTCCollector:
 
         # Method 1: CoinGecko Live Price (BEST - Real-time, Free, No API key)
         try:
-            logging.info("🥒 Attempting CoinGecko live price collection...")
-            url = "https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                'ids': 'bitcoin',
-                'vs_currencies': 'usd',
-                'include_last_updated_at': 'true'
-            }
+            quote = self._price_cache.get('coingecko_btc_usd')
+            if quote is None:
+                logging.info("🥒 Attempting CoinGecko live price collection...")
+                url = "https://api.coingecko.com/api/v3/simple/price"
+                params = {
+                    'ids': 'bitcoin',
+                    'vs_currencies': 'usd',
+                    'include_last_updated_at': 'true'
+                }
 
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+                response = self._coingecko_get(url, params=params, timeout=10)
+                response.raise_for_status()
+
+                quote = _json_loads(response.content)['bitcoin']
+                self._price_cache.set('coingecko_btc_usd', quote)
 
-            data = response.json()
-            price = data['bitcoin']['usd']
-            last_updated = data['bitcoin'].get('last_updated_at', 0)
+            price = quote['usd']
+            last_updated = quote.get('last_updated_at', 0)
 
             if last_updated:
-                updated_time = datetime.fromtimestamp(last_updated)
-                age_seconds = (datetime.now() - updated_time).total_seconds()
+                age_seconds = time.time() - last_updated
 
                 if age_seconds < 300:  # Less than 5 minutes old
                     note = f"🟢 LIVE PRICE (updated {age_seconds:.0f}s ago)"
@@ -213,7 +400,7 @@ class HybridBTCCollector:
             else:
                 note = "🟢 LIVE PRICE"
 
-            logging.info(f"✅ CoinGecko live BTC price: ${price:,.2f} - {note}")
+            logging.info("✅ CoinGecko live BTC price: $%.2f - %s", price, note)
 
             return {
                 'price': price,
@@ -223,27 +410,25 @@ class HybridBTCCollector:
             }
 
         except Exception as e:
-            logging.error(f"❌ CoinGecko price collection failed: {str(e)}")
+            logging.error("❌ CoinGecko price collection failed: %s", e)
 
         # Method 2: Polygon Yesterday Close (FALLBACK - Free tier compatible)
+        # Method 3: 2 days ago (final fallback) - both come back from a single aggregates request
         logging.warning("🚨 CoinGecko failed, falling back to Polygon yesterday close")
 
-        try:
-            yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-            url = f"{self.base_url}/v1/open-close/crypto/BTC/USD/{yesterday}"
-
-            logging.info(f"🟠 Attempting Polygon yesterday close for {yesterday}...")
-            response = self.session.get(url, params={'apikey': self.api_key})
-            response.raise_for_status()
+        today = datetime.now()
+        yesterday = (today - timedelta(days=1)).strftime('%Y-%m-%d')
+        two_days_ago = (today - timedelta(days=2)).strftime('%Y-%m-%d')
 
-            data = response.json()
-            if data.get('status') == 'OK' and 'close' in data:
-                price = data['close']
+        try:
+            logging.info("🟠 Attempting Polygon closes for %s / %s...", yesterday, two_days_ago)
+            day, price = self._get_latest_polygon_close(yesterday, two_days_ago)
 
+            if day == yesterday:
                 # 🚨 CLEAR VISUAL INDICATOR for yesterday's price
                 note = f"🔴 YESTERDAY CLOSE ({yesterday}) - NOT LIVE!"
 
-                logging.warning(f"⚠️ Using Polygon yesterday close: ${price:,.2f} ({yesterday})")
+                logging.warning("⚠️ Using Polygon yesterday close: $%.2f (%s)", price, yesterday)
 
                 return {
                     'price': price,
@@ -253,26 +438,11 @@ class HybridBTCCollector:
                     'date': yesterday
                 }
 
-        except Exception as e:
-            logging.error(f"❌ Polygon yesterday close also failed: {str(e)}")
-
-        # Method 3: Try 2 days ago (final fallback)
-        try:
-            two_days_ago = (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d')
-            url = f"{self.base_url}/v1/open-close/crypto/BTC/USD/{two_days_ago}"
-
-            logging.warning(f"🚨 Attempting Polygon 2-day old close for {two_days_ago}...")
-            response = self.session.get(url, params={'apikey': self.api_key})
-            response.raise_for_status()
-
-            data = response.json()
-            if data.get('status') == 'OK' and 'close' in data:
-                price = data['close']
-
+            if day == two_days_ago:
                 # 🚨 EVEN MORE PROMINENT WARNING for 2-day old price
                 note = f"🔴 2-DAY OLD CLOSE ({two_days_ago}) - VERY STALE!"
 
-                logging.error(f"🚨 Using 2-day old Polygon close: ${price:,.2f} ({two_days_ago})")
+                logging.error("🚨 Using 2-day old Polygon close: $%.2f (%s)", price, two_days_ago)
 
                 return {
                     'price': price,
@@ -283,72 +453,179 @@ class HybridBTCCollector:
                 }
 
         except Exception as e:
-            logging.error(f"❌ All price collection methods failed: {str(e)}")
+            logging.error("❌ All price collection methods failed: %s", e)
 
         raise Exception("Could not get BTC price from any source (CoinGecko + Polygon fallbacks)")
 
+    def _get_latest_polygon_close(self, yesterday: str, two_days_ago: str):
+        """
+        (day, close) for the newest Polygon daily bar between `two_days_ago` and `yesterday`
+        (YYYY-MM-DD), or (None, None). One request covers both days; closed days never
+        change, so every returned close is cached and a cached yesterday skips the request.
+        """
+        cached = self._cache.get(f"polygon_close_{yesterday}")
+        if cached is not None:
+            return yesterday, cached
+
+        bars = self._fetch_btc_aggregates('day', datetime.strptime(two_days_ago, '%Y-%m-%d'),
+                                          datetime.strptime(yesterday, '%Y-%m-%d'), 2, sort='desc')
+        latest = (None, None)
+        for bar in bars:
+            day = datetime.fromtimestamp(bar['t'] / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+            self._cache.set(f"polygon_close_{day}", bar['c'])
+            if latest[0] is None or day > latest[0]:
+                latest = (day, bar['c'])
+        return latest
+
+    def _state_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}_state.json")
+
+    def _load_indicator_state(self, name: str, max_gap: timedelta, end_date: datetime):
+        """
+        Saved recurrence state for an indicator, or None if missing, unreadable or
+        more than `max_gap` behind `end_date` (then a full history fetch is cheaper)
+        """
+        try:
+            with open(self._state_path(name)) as f:
+                state = json.load(f)
+            last_bar = datetime.fromtimestamp(state['last_t'] / 1000, tz=timezone.utc)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if end_date.date() - last_bar.date() > max_gap:
+            return None
+        state['last_bar'] = last_bar
+        return state
+
+    def _save_indicator_state(self, name: str, state: Dict) -> None:
+        """Persist recurrence state atomically; failures only cost a full fetch next time"""
+        path = self._state_path(name)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning("Could not save %s state: %s", name, e)
+
+    def _fetch_btc_aggregates(self, timespan: str, start_date: datetime, end_date: datetime, limit: int,
+                              sort: str = 'asc') -> list:
+        """X:BTCUSD bars for [start_date, end_date] in `sort` order; empty list when Polygon has none"""
+        url = f"{self.base_url}/v2/aggs/ticker/X:BTCUSD/range/1/{timespan}/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
+
+        # Ascending order is what the EMA/RSI recurrences assume; limit caps the payload at the window size
+        response = self._polygon_get(url, params={'apikey': self.api_key, 'sort': sort, 'limit': limit})
+        response.raise_for_status()
+
+        data = _json_loads(response.content)
+
+        if data.get('status') not in ['OK', 'DELAYED']:
+            raise Exception(f"API returned status: {data.get('status', 'unknown')}")
+
+        return data.get('results') or []
+
+    @staticmethod
+    def _bars_after(bars: list, last_t: int) -> list:
+        return [bar for bar in bars if bar.get('t', 0) > last_t]
+
     def get_daily_ema_200(self) -> float:
-        """Get daily EMA200 for BTC using Polygon free tier (WORKS - Historical data)"""
+        """
+        Get daily EMA200 for BTC using Polygon free tier (WORKS - Historical data)
+        After the first full fetch, only bars newer than the saved EMA state are requested.
+        """
+        cached = self._cache.get('ema_200')
+        if cached is not None:
+            logging.info("Daily EMA200 from cache: $%.2f", cached)
+            return cached
+
         try:
             end_date = datetime.now() - timedelta(days=2)
-            start_date = end_date - timedelta(days=450)
+            state = self._load_indicator_state('ema_200', timedelta(days=30), end_date)
 
-            url = f"{self.base_url}/v2/aggs/ticker/X:BTCUSD/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-
-            response = self.session.get(url, params={'apikey': self.api_key})
-            response.raise_for_status()
+            if state:
+                bars = self._bars_after(
+                    self._fetch_btc_aggregates('day', state['last_bar'], end_date, 460), state['last_t'])
+                ema_200 = float(_ema_update(state['ema'], [bar['c'] for bar in bars], 200))
+                logging.info("Daily EMA200 updated: $%.2f (%s new days since last run)", ema_200, len(bars))
+            else:
+                # 450 days leaves the seed bar ~1% of the EMA200 weight; fewer bars visibly skew the result
+                start_date = end_date - timedelta(days=450)
+                bars = self._fetch_btc_aggregates('day', start_date, end_date, 460)
 
-            data = response.json()
+                if not bars:
+                    raise Exception("No results in API response")
 
-            if data.get('status') not in ['OK', 'DELAYED']:
-                raise Exception(f"API returned status: {data.get('status', 'unknown')}")
+                closes = np.fromiter((bar['c'] for bar in bars), dtype=np.float64, count=len(bars))
 
-            if 'results' not in data or not data['results']:
-                raise Exception("No results in API response")
+                if len(closes) < 200:
+                    raise Exception(f"Insufficient data for EMA200: only {len(closes)} days available")
 
-            closes = [bar['c'] for bar in data['results']]
+                ema_200 = self.calculate_ema(closes, 200)
+                logging.info("Daily EMA200 calculated: $%.2f (using %s days of data)", ema_200, len(closes))
 
-            if len(closes) < 200:
-                raise Exception(f"Insufficient data for EMA200: only {len(closes)} days available")
+            last_t = bars[-1].get('t') if bars else state['last_t']
+            if last_t is not None:
+                self._save_indicator_state('ema_200', {'last_t': last_t, 'ema': ema_200})
 
-            ema_200 = self.calculate_ema(closes, 200)
-            logging.info(f"Daily EMA200 calculated: ${ema_200:.2f} (using {len(closes)} days of data)")
+            self._cache.set('ema_200', ema_200)
             return ema_200
 
         except Exception as e:
-            logging.error(f"Error calculating daily EMA200: {str(e)}")
+            logging.error("Error calculating daily EMA200: %s", e)
             raise Exception(f"Could not calculate daily EMA200: {str(e)}")
 
     def get_weekly_rsi(self) -> float:
-        """Get weekly RSI for BTC using Polygon free tier (WORKS - Historical data)"""
+        """
+        Get weekly RSI for BTC using Polygon free tier (WORKS - Historical data)
+        After the first full fetch, only bars newer than the saved Wilder state are requested.
+        """
+        cached = self._cache.get('weekly_rsi')
+        if cached is not None:
+            logging.info("Weekly RSI from cache: %.1f", cached)
+            return cached
+
         try:
             end_date = datetime.now() - timedelta(days=7)
-            start_date = end_date - timedelta(days=800)
-
-            url = f"{self.base_url}/v2/aggs/ticker/X:BTCUSD/range/1/week/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-
-            response = self.session.get(url, params={'apikey': self.api_key})
-            response.raise_for_status()
+            state = self._load_indicator_state('weekly_rsi', timedelta(weeks=8), end_date)
+
+            if state:
+                bars = self._bars_after(
+                    self._fetch_btc_aggregates('week', state['last_bar'], end_date, 120), state['last_t'])
+                closes = [state['last_close']] + [bar['c'] for bar in bars]
+                avg_gain, avg_loss = _wilder_update(state['avg_gain'], state['avg_loss'], closes[0], closes[1:], 14)
+                rsi = _rsi_from_averages(avg_gain, avg_loss)
+                logging.info("Weekly RSI updated: %.1f (%s new weeks since last run)", rsi, len(bars))
+            else:
+                start_date = end_date - timedelta(days=800)
+                bars = self._fetch_btc_aggregates('week', start_date, end_date, 120)
 
-            data = response.json()
+                if not bars:
+                    raise Exception("No results in weekly API response")
 
-            if data.get('status') not in ['OK', 'DELAYED']:
-                raise Exception(f"API returned status: {data.get('status', 'unknown')}")
+                closes = np.fromiter((bar['c'] for bar in bars), dtype=np.float64, count=len(bars))
 
-            if 'results' not in data or not data['results']:
-                raise Exception("No results in weekly API response")
+                if len(closes) < 30:
+                    raise Exception(f"Insufficient weekly data for RSI: only {len(closes)} weeks available")
 
-            closes = [bar['c'] for bar in data['results']]
+                avg_gain, avg_loss = _wilder_averages(closes, 14)
+                rsi = _rsi_from_averages(avg_gain, avg_loss)
+                logging.info("Weekly RSI calculated: %.1f (using %s weeks of data)", rsi, len(closes))
 
-            if len(closes) < 30:
-                raise Exception(f"Insufficient weekly data for RSI: only {len(closes)} weeks available")
+            last_t = bars[-1].get('t') if bars else state['last_t']
+            if last_t is not None:
+                self._save_indicator_state('weekly_rsi', {
+                    'last_t': last_t,
+                    'last_close': float(closes[-1]),
+                    'avg_gain': avg_gain,
+                    'avg_loss': avg_loss
+                })
 
-            rsi = self.calculate_rsi(closes, 14)
-            logging.info(f"Weekly RSI calculated: {rsi:.1f} (using {len(closes)} weeks of data)")
+            self._cache.set('weekly_rsi', rsi)
             return rsi
 
         except Exception as e:
-            logging.error(f"Error calculating weekly RSI: {str(e)}")
+            logging.error("Error calculating weekly RSI: %s", e)
             raise Exception(f"Could not calculate weekly RSI: {str(e)}")
 
     def calculate_ema(self, prices: list, period: int) -> float:
@@ -356,47 +633,35 @@ class HybridBTCCollector:
         if len(prices) < period:
             raise ValueError(f"Not enough data points. Need {period}, got {len(prices)}")
 
-        df = pd.Series(prices)
-        ema = df.ewm(span=period, adjust=False).mean()
-        return float(ema.iloc[-1])
+        # Same recurrence as pandas ewm(span=period, adjust=False), seeded with the first price
+        values = np.asarray(prices, dtype=np.float64).tolist()
+        return float(_ema_update(values[0], values[1:], period))
 
     def calculate_rsi(self, prices: list, period: int = 14) -> float:
         """Calculate Relative Strength Index using STANDARD Wilder's method"""
         if len(prices) < period + 1:
             raise ValueError(f"Not enough data points for RSI. Need {period + 1}, got {len(prices)}")
 
-        prices_series = pd.Series(prices)
-        delta = prices_series.diff().dropna()
-
-        gains = delta.where(delta > 0, 0)
-        losses = -delta.where(delta < 0, 0)
-
         # ✅ FIX: Use Wilder's exponential smoothing instead of simple average
-        avg_gain = gains.ewm(alpha=1 / period, adjust=False).mean()
-        avg_loss = losses.ewm(alpha=1 / period, adjust=False).mean()
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return float(rsi.iloc[-1])
+        return _rsi_from_averages(*_wilder_averages(prices, period))
 
     def test_api_connection(self) -> bool:
         """Test if Polygon API connection is working"""
         try:
             url = f"{self.base_url}/v3/reference/tickers/X:BTCUSD"
-            response = self.session.get(url, params={'apikey': self.api_key})
+            response = self._polygon_get(url, params={'apikey': self.api_key})
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             if data.get('status') == 'OK':
                 logging.info("Polygon API connection test successful")
                 return True
             else:
-                logging.error(f"API test failed: {data}")
+                logging.error("API test failed: %s", data)
                 return False
 
         except Exception as e:
-            logging.error(f"API connection test failed: {str(e)}")
+            logging.error("API connection test failed: %s", e)
             return False
 
     def test_coingecko_connection(self) -> bool:
@@ -405,31 +670,40 @@ class HybridBTCCollector:
             url = "https://api.coingecko.com/api/v3/simple/price"
             params = {'ids': 'bitcoin', 'vs_currencies': 'usd'}
 
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._coingecko_get(url, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             if 'bitcoin' in data and 'usd' in data['bitcoin']:
                 price = data['bitcoin']['usd']
-                logging.info(f"CoinGecko connection test successful - BTC: ${price:,.2f}")
+                logging.info("CoinGecko connection test successful - BTC: $%.2f", price)
                 return True
             else:
                 logging.error("CoinGecko test failed: Invalid response format")
                 return False
 
         except Exception as e:
-            logging.error(f"CoinGecko connection test failed: {str(e)}")
+            logging.error("CoinGecko connection test failed: %s", e)
             return False
 
-    def get_mining_cost_data(self) -> Dict:
+    def check_connections(self, max_age: float = HEALTHCHECK_TTL) -> Dict:
         """
-        Get Bitcoin average mining cost from CCAF (Cambridge Centre for Alternative Finance)
-        Returns dict with mining_cost and data_date, or N/A values if failed
+        Probe Polygon and CoinGecko side by side; a result younger than `max_age` seconds is reused
+        Returns dict with: polygon, coingecko (bool each)
         """
-        driver = None
-        try:
-            logging.info("⛏️ Collecting Bitcoin mining cost from CCAF...")
-
+        if self._health is not None and time.monotonic() - self._health_checked_at < max_age:
+            return dict(self._health)
+
+        polygon = _FETCH_EXECUTOR.submit(self.test_api_connection)
+        coingecko = _FETCH_EXECUTOR.submit(self.test_coingecko_connection)
+        self._health = {'polygon': polygon.result(), 'coingecko': coingecko.result()}
+        self._health_checked_at = time.monotonic()
+        return dict(self._health)
+
+    @classmethod
+    def _ccaf_chrome_options(cls) -> Options:
+        """Headless Chrome options for the CCAF mining data page, built once per process"""
+        if cls._ccaf_options is None:
             chrome_options = Options()
             chrome_options.add_argument('--headless')
             chrome_options.add_argument('--no-sandbox')
@@ -438,59 +712,95 @@ class HybridBTCCollector:
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
 
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get("https://ccaf.io/cbnsi/cbeci/mining_map/mining_data")
+            # Only the rendered figure matters - return at DOMContentLoaded and skip images/extensions
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_argument('--disable-extensions')
+            cls._ccaf_options = chrome_options
+        return cls._ccaf_options
+
+    def _get_ccaf_driver(self):
+        """Return the warm CCAF Chrome driver, starting Chrome only on first use or after a failure"""
+        cls = type(self)
+        if cls._ccaf_driver is None:
+            cls._ccaf_driver = webdriver.Chrome(options=self._ccaf_chrome_options())
+        return cls._ccaf_driver
+
+    @classmethod
+    def close_ccaf_driver(cls) -> None:
+        """Quit the shared CCAF driver (also run at interpreter exit)"""
+        with cls._ccaf_lock:
+            driver, cls._ccaf_driver = cls._ccaf_driver, None
+        if driver is not None:
+            _quit_quietly(driver)
 
-            # Wait for page to load
-            WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(15)  # Additional wait for dynamic content
-
-            # Extract mining cost value using CCAF XPath
+    def get_mining_cost_data(self) -> Dict:
+        """
+        Get Bitcoin average mining cost from CCAF (Cambridge Centre for Alternative Finance)
+        Returns dict with mining_cost and data_date, or N/A values if failed
+        """
+        # One Chrome drives every CCAF scrape; the lock keeps concurrent callers off the same tab
+        with self._ccaf_lock:
             try:
-                mining_cost_element = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH,
-                                                    '//*[@id="wrap-container"]/div[3]/div/div[1]/div[1]/div/div/div[2]/div/div[2]/div/div[2]/h2'))
-                )
-                mining_cost_text = mining_cost_element.text.strip()
-                logging.info(f"📊 Raw CCAF mining cost text: '{mining_cost_text}'")
+                logging.info("⛏️ Collecting Bitcoin mining cost from CCAF...")
 
-                # Parse the value - remove commas, dollar signs, etc.
-                clean_text = mining_cost_text.replace(',', '').replace('$', '').replace(' ', '')
+                driver = self._get_ccaf_driver()
+                driver.get(CCAF_MINING_DATA_URL)
 
-                # Extract numeric value
-                value_match = re.search(r'([0-9]+\.?[0-9]*)', clean_text)
-                if value_match:
-                    mining_cost = float(value_match.group(1))
+                # Extract mining cost value using CCAF XPath - waits until the dynamic content has filled in
+                # a number (the node exists empty or with a placeholder first, especially with eager loading)
+                try:
+                    mining_cost_element = WebDriverWait(driver, CCAF_LOAD_TIMEOUT).until(_ccaf_value_rendered)
+                    mining_cost_text = mining_cost_element.text.strip()
+                    logging.info("📊 Raw CCAF mining cost text: '%s'", mining_cost_text)
+
+                    # Parse the value - remove commas, dollar signs, etc.
+                    clean_text = mining_cost_text.translate(_CURRENCY_FORMATTING)
+
+                    # Usually a bare number by now; otherwise extract the first number from the text
+                    if _PLAIN_NUMBER_RE.fullmatch(clean_text):
+                        mining_cost = float(clean_text)
+                    else:
+                        value_match = _NUMBER_RE.search(clean_text)
+                        if not value_match:
+                            logging.warning("⚠️ Could not parse numeric value from CCAF: '%s'", mining_cost_text)
+                            return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': 'Could not parse value'}
+                        mining_cost = float(value_match.group(1))
 
                     # Validate range (10,000 to 1,500,000)
                     if 10000 <= mining_cost <= 1500000:
-                        logging.info(f"✅ Valid CCAF mining cost extracted: ${mining_cost:,.0f}")
+                        logging.info("✅ Valid CCAF mining cost extracted: $%.0f", mining_cost)
                     else:
-                        logging.warning(f"⚠️ CCAF mining cost out of valid range: ${mining_cost:,.0f}")
+                        logging.warning("⚠️ CCAF mining cost out of valid range: $%.0f", mining_cost)
                         return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': 'Value out of range'}
-                else:
-                    logging.warning(f"⚠️ Could not parse numeric value from CCAF: '{mining_cost_text}'")
-                    return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': 'Could not parse value'}
+
+                except Exception as e:
+                    logging.error("❌ Failed to extract CCAF mining cost: %s", e)
+                    return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': 'Element not found'}
+
+                return {
+                    'mining_cost': mining_cost,
+                    'data_date': 'CCAF Data',  # Static label since no date extraction needed
+                    'success': True
+                }
 
             except Exception as e:
-                logging.error(f"❌ Failed to extract CCAF mining cost: {str(e)}")
-                return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': 'Element not found'}
+                logging.error("❌ CCAF mining cost collection failed: %s", e)
+                # The browser may be wedged or gone - start a fresh one next time
+                driver, type(self)._ccaf_driver = type(self)._ccaf_driver, None
+                if driver is not None:
+                    _quit_quietly(driver)
+                return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': str(e)}
 
-            # Small delay to be respectful to the server
-            time.sleep(2)
 
-            return {
-                'mining_cost': mining_cost,
-                'data_date': 'CCAF Data',  # Static label since no date extraction needed
-                'success': True
-            }
+atexit.register(HybridBTCCollector.close_ccaf_driver)
+
+
+@lru_cache(maxsize=1)
+def _get_btc_collector() -> HybridBTCCollector:
+    """Process-wide BTC collector, so repeated AssetDataCollector instances skip re-initialization"""
+    return HybridBTCCollector()
 
-        except Exception as e:
-            logging.error(f"❌ CCAF mining cost collection failed: {str(e)}")
-            return {'mining_cost': 'N/A', 'data_date': 'CCAF Data', 'error': str(e)}
-        finally:
-            if driver:
-                driver.quit()
 
 # Updated AssetDataCollector class for integration
 class HybridAssetDataCollector:
@@ -498,22 +808,36 @@ class HybridAssetDataCollector:
     🎯 ENHANCED HYBRID Asset collector: CoinGecko live prices + Polygon historical + TradingView MVRV + Pi Cycle
     """
 
-    def __init__(self):
+    def __init__(self, *, preflight: bool = False):
+        """
+        Construction makes no API calls; API errors surface from the first real fetch.
+        Pass preflight=True to run healthcheck() up front (e.g. when debugging credentials).
+        """
         self.btc_collector = None
         try:
-            self.btc_collector = HybridBTCCollector()
+            self.btc_collector = _get_btc_collector()
+        except Exception as e:
+            logging.error("Failed to initialize hybrid BTC collector: %s", e)
+
+        if preflight:
+            self.healthcheck()
 
-            # Test both APIs
-            polygon_ok = self.btc_collector.test_api_connection()
-            coingecko_ok = self.btc_collector.test_coingecko_connection()
+    def healthcheck(self) -> Dict:
+        """
+        Probe Polygon and CoinGecko connectivity on demand (concurrently, at most once per HEALTHCHECK_TTL).
+        Kept out of __init__ so regular runs don't spend a Polygon request (5/min quota) on it.
+        """
+        if self.btc_collector is None:
+            return {'polygon': False, 'coingecko': False}
 
-            if not polygon_ok:
-                logging.warning("Polygon API connection test failed during initialization")
-            if not coingecko_ok:
-                logging.warning("CoinGecko API connection test failed during initialization")
+        status = self.btc_collector.check_connections()
 
-        except Exception as e:
-            logging.error(f"Failed to initialize hybrid BTC collector: {str(e)}")
+        if not status['polygon']:
+            logging.warning("Polygon API connection test failed")
+        if not status['coingecko']:
+            logging.warning("CoinGecko API connection test failed")
+
+        return status
 
     def collect_asset_data(self, asset: str, config: Dict) -> Dict:
         """Main method to collect data for an asset"""
@@ -526,7 +850,7 @@ class HybridAssetDataCollector:
                 return {'success': False, 'error': f'Unknown asset: {asset}'}
 
         except Exception as e:
-            logging.error(f'Error collecting data for {asset}: {str(e)}')
+            logging.error('Error collecting data for %s: %s', asset, e)
             return {'success': False, 'error': str(e)}
 
     def _collect_btc_data_hybrid(self) -> Dict:
@@ -569,7 +893,7 @@ class HybridAssetDataCollector:
                 if mining_cost != 'N/A' and mining_cost > 0:
                     price_cost_ratio = round(hybrid_data.get('price', 0) / mining_cost, 2)
                     btc_data['indicators']['price_cost_ratio'] = price_cost_ratio
-                    logging.info(f"💰 Price/Cost Ratio calculated: {price_cost_ratio}")
+                    logging.info("💰 Price/Cost Ratio calculated: %s", price_cost_ratio)
                 else:
                     btc_data['indicators']['price_cost_ratio'] = 'N/A'
                     logging.warning("⚠️ Could not calculate Price/Cost Ratio")
@@ -583,10 +907,9 @@ class HybridAssetDataCollector:
                 if pi_cycle_success:
                     proximity_level = btc_data['pi_cycle'].get('signal_status', {}).get('proximity_level', 'UNKNOWN')
                     gap_percentage = btc_data['pi_cycle'].get('current_values', {}).get('gap_percentage', 0)
-                    logging.info(f"🎯 Pi Cycle data persisted: {proximity_level} ({gap_percentage:.1f}% gap)")
+                    logging.info("🎯 Pi Cycle data persisted: %s (%.1f%% gap)", proximity_level, gap_percentage)
                 else:
-                    logging.warning(
-                        f"⚠️ Pi Cycle data failed to persist: {btc_data['pi_cycle'].get('error', 'Unknown')}")
+                    logging.warning("⚠️ Pi Cycle data failed to persist: %s", btc_data['pi_cycle'].get('error', 'Unknown'))
 
             else:
                 btc_data['error'] = hybrid_data.get('error', 'Unknown hybrid API error')
@@ -594,7 +917,7 @@ class HybridAssetDataCollector:
                 btc_data['indicators']['mining_cost'] = 'N/A'
                 btc_data['indicators']['mining_cost_date'] = 'N/A'
                 btc_data['indicators']['price_cost_ratio'] = 'N/A'
-                logging.error(f'Hybrid API error: {btc_data["error"]}')
+                logging.error('Hybrid API error: %s', btc_data["error"])
 
         except Exception as e:
             btc_data['error'] = str(e)
@@ -602,7 +925,7 @@ class HybridAssetDataCollector:
             btc_data['indicators']['mining_cost'] = 'N/A'
             btc_data['indicators']['mining_cost_date'] = 'N/A'
             btc_data['indicators']['price_cost_ratio'] = 'N/A'
-            logging.error(f'Error collecting enhanced hybrid BTC data: {str(e)}')
+            logging.error('Error collecting enhanced hybrid BTC data: %s', e)
 
         return btc_data
 
@@ -2,23 +2,47 @@
 
 import time
 import io
+import atexit
+import threading
 import base64
 import os
+import math
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from PIL import Image
 from datetime import datetime
 
 
+# Number of resource timing entries recorded since the last call, clearing the buffer so it never fills up
+_DRAIN_RESOURCE_TIMINGS = """
+performance.setResourceTimingBufferSize(100000);
+const count = performance.getEntriesByType('resource').length;
+performance.clearResourceTimings();
+return count;
+"""
+
+
 class BitcoinLawsScraper:
     """
     Bitcoin Laws scraper with HIGH QUALITY output for Imgur hosting
     """
 
+    # Upper bound in seconds on waiting for the map's network traffic to stop
+    SETTLE_TIMEOUT = 45
+    # Seconds without a new network request before the page counts as settled
+    QUIET_PERIOD = 3
+    # Final pause after the resize nudge so the map can repaint
+    REPAINT_DELAY = 2
+
+    # Warm Chrome driver shared by every capture in the process, started on first use
+    _driver = None
+    _driver_lock = threading.Lock()
+
     def __init__(self):
         self.target_url = "https://bitcoinlaws.io"
 
@@ -31,45 +55,124 @@ class BitcoinLawsScraper:
             output_width: Final width (default: 800 - high quality for external hosting)
             output_height: Final height (default: 600 - high quality for external hosting)
         """
-        driver = None
-        try:
-            # Setup Chrome
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-            driver = webdriver.Chrome(options=chrome_options)
+        # One Chrome serves every capture; the lock keeps concurrent callers off the same tab
+        with self._driver_lock:
+            try:
+                driver = self._get_driver()
+
+                # Load page with patient timing (a warm browser serves repeat loads from its HTTP cache)
+                driver.get(self.target_url)
+                WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                WebDriverWait(driver, 20).until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+                # Wait for fonts and the map's tile/data requests instead of sleeping a fixed 50s
+                self._wait_until_settled(driver)
+                driver.execute_script("window.dispatchEvent(new Event('resize')); window.scrollTo(0, 0);")
+                time.sleep(self.REPAINT_DELAY)
+
+                # Chrome encodes only the cropped region, so the capture maps onto the whole 1200x900 reference
+                region_bytes = self._capture_region(driver, crop_coords)
+                return self._process_image(region_bytes, (0, 0, 1200, 900), output_width, output_height)
+
+            except Exception as e:
+                logging.error(f"Capture failed: {e}")
+                # The browser may be wedged or gone - start a fresh one next time
+                self._discard_driver()
+                return None
+
+    @staticmethod
+    def _chrome_options():
+        """Headless Chrome options for the Bitcoin Laws map"""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        return chrome_options
+
+    @classmethod
+    def _get_driver(cls):
+        """Return the warm Chrome driver, starting and sizing it only on first use or after a failure"""
+        if cls._driver is None:
+            driver = webdriver.Chrome(options=cls._chrome_options())
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             driver.set_window_size(2000, 1500)
+            cls._driver = driver
+        return cls._driver
+
+    @classmethod
+    def _discard_driver(cls):
+        """Quit the shared driver (if any), ignoring errors from a browser that is already gone"""
+        driver, cls._driver = cls._driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
 
-            # Load page with patient timing
-            driver.get(self.target_url)
-            WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            WebDriverWait(driver, 20).until(lambda d: d.execute_script("return document.readyState") == "complete")
+    @classmethod
+    def close(cls):
+        """Quit the shared Chrome driver (also run at interpreter exit)"""
+        with cls._driver_lock:
+            cls._discard_driver()
 
-            # Patient waits
-            time.sleep(20)
-            for _ in range(3):
-                driver.execute_script("window.dispatchEvent(new Event('resize')); window.scrollTo(0, 0);")
-                time.sleep(5)
-            time.sleep(15)
+    def _capture_region(self, driver, crop_coords):
+        """
+        Screenshot just the crop region as a near-lossless JPEG via CDP, mapping the
+        1200x900 reference coordinates onto the page's actual viewport (CSS pixels)
+        """
+        viewport_width, viewport_height = driver.execute_script("return [window.innerWidth, window.innerHeight]")
+        scale_x = viewport_width / 1200.0
+        scale_y = viewport_height / 900.0
+
+        left, top, right, bottom = crop_coords
+        left, top, right, bottom = max(0, left), max(0, top), min(1200, right), min(900, bottom)
+        clip = {
+            'x': left * scale_x,
+            'y': top * scale_y,
+            'width': (right - left) * scale_x,
+            'height': (bottom - top) * scale_y,
+            'scale': 1
+        }
+
+        screenshot = driver.execute_cdp_cmd('Page.captureScreenshot', {
+            'format': 'jpeg',
+            'quality': 95,
+            'clip': clip,
+            'captureBeyondViewport': False
+        })
+        return base64.b64decode(screenshot['data'])
+
+    def _wait_until_settled(self, driver):
+        """
+        Block until web fonts are loaded and no network request has finished for QUIET_PERIOD seconds.
+        A page that never goes quiet (e.g. polling widgets) is captured anyway after SETTLE_TIMEOUT.
+        """
+        last = {'since': time.monotonic()}
 
-            # Process screenshot
-            screenshot_png = driver.get_screenshot_as_png()
-            return self._process_image(screenshot_png, crop_coords, output_width, output_height)
+        def network_quiet(d):
+            # Drain the resource timing buffer on every poll: Chrome stops recording once it holds 250
+            # entries, so a plain running count would stall there on a heavy page and look settled
+            new_entries = d.execute_script(_DRAIN_RESOURCE_TIMINGS)
+            now = time.monotonic()
+            if new_entries:
+                last['since'] = now
+            return now - last['since'] >= self.QUIET_PERIOD
 
-        except Exception as e:
-            logging.error(f"Capture failed: {e}")
-            return None
-        finally:
-            if driver:
-                driver.quit()
+        try:
+            WebDriverWait(driver, 15).until(lambda d: d.execute_script("return document.fonts.status") == "loaded")
+        except TimeoutException:
+            # A stalled web font must not skip the network wait below
+            logging.warning("Bitcoin Laws fonts still loading after 15s, waiting for the network anyway")
+
+        try:
+            WebDriverWait(driver, self.SETTLE_TIMEOUT, poll_frequency=0.5).until(network_quiet)
+        except TimeoutException:
+            logging.warning("Bitcoin Laws page still busy after %ss, capturing anyway", self.SETTLE_TIMEOUT)
 
     def _process_image(self, screenshot_bytes, crop_coords, output_width, output_height):
         """
@@ -77,16 +180,22 @@ class BitcoinLawsScraper:
         """
         try:
             image = Image.open(io.BytesIO(screenshot_bytes))
-
-            # Step 1: Resize to 1200x900 reference
-            image = image.resize((1200, 900), Image.Resampling.LANCZOS)
-
-            # Step 2: Crop using coordinates
             left, top, right, bottom = crop_coords
-            image = image.crop((max(0, left), max(0, top), min(1200, right), min(900, bottom)))
 
-            # Step 3: Resize to final dimensions (HIGH QUALITY)
-            image = image.resize((output_width, output_height), Image.Resampling.LANCZOS)
+            # JPEG only (no-op for PNG): let libjpeg decode at 1/2, 1/4 or 1/8 scale as long as the
+            # cropped region still has at least output_width x output_height pixels
+            crop_width = max(1, min(1200, right) - max(0, left))
+            crop_height = max(1, min(900, bottom) - max(0, top))
+            image.draft('RGB', (math.ceil(output_width * 1200 / crop_width),
+                                math.ceil(output_height * 900 / crop_height)))
+
+            # Steps 1-3: Map the crop from the 1200x900 reference onto the screenshot and resample
+            # just that region to the final size in one LANCZOS pass (no intermediate 1200x900 image)
+            scale_x = image.width / 1200.0
+            scale_y = image.height / 900.0
+            box = (max(0, left) * scale_x, max(0, top) * scale_y,
+                   min(1200, right) * scale_x, min(900, bottom) * scale_y)
+            image = image.resize((output_width, output_height), Image.Resampling.LANCZOS, box=box)
 
             # Step 4: Minimal compression for external hosting
             if image.mode in ('RGBA', 'LA', 'P'):
@@ -114,6 +223,9 @@ class BitcoinLawsScraper:
             return None
 
 
+atexit.register(BitcoinLawsScraper.close)
+
+
 def capture_bitcoin_laws_screenshot(crop_coords=(260, 218, 890, 760), verbose=False):
     """
     🎯 HIGH QUALITY: Updated function for Imgur hosting with larger, higher quality images
@@ -4,10 +4,54 @@ Handles Bitcoin buy/sell signal analysis and state management
 """
 
 import logging
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from typing import Dict, Optional, Tuple
+from azure.common import AzureHttpError, AzureMissingResourceHttpError
+from azure.cosmosdb.table.models import Entity
 from data_storage import DataStorage
 
+# Shared by all analyzers: overlaps the state read with signal computation and
+# lets the state write finish in the background
+_STATE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='btc-signal-state')
+
+_WEAKENING_PREDICTION = "One parameter no longer met - signal may turn off if continues >30 days"
+
+# Display status for an active signal, keyed by (active, both_conditions_met, signal_type)
+_STATUS_TABLE = {
+    (True, True, 'SELL'): {
+        'status': 'active',
+        'message': "SELL SIGNAL ACTIVE",
+        'emoji': "🔴",
+        'prediction': "Top is likely to be reached within 1-3 months"
+    },
+    (True, True, 'BUY'): {
+        'status': 'active',
+        'message': "BUY SIGNAL ACTIVE",
+        'emoji': "🟢",
+        'prediction': "Bottom is likely to be in 4-6 months"
+    },
+    (True, False, 'SELL'): {
+        'status': 'weakening',
+        'message': "SELL SIGNAL WEAKENING",
+        'emoji': "🟡",
+        'prediction': _WEAKENING_PREDICTION
+    },
+    (True, False, 'BUY'): {
+        'status': 'weakening',
+        'message': "BUY SIGNAL WEAKENING",
+        'emoji': "🟡",
+        'prediction': _WEAKENING_PREDICTION
+    },
+}
+
+_NO_SIGNAL_STATUS = {
+    'status': 'none',
+    'message': "",
+    'emoji': "",
+    'prediction': ""
+}
+
 
 class BTCAnalyzer:
     """
@@ -16,6 +60,12 @@ class BTCAnalyzer:
 
     def __init__(self, storage: DataStorage = None):
         self.storage = storage or DataStorage()
+        self._signal_state_etag = None
+        self._pending_save = None
+
+        # Signal state changes at most once a day, so reuse it within the same UTC date
+        self._state_cache = None
+        self._state_cache_date = None
 
     def analyze_btc_signals(self, btc_data: Dict) -> Dict:
         """
@@ -28,6 +78,15 @@ class BTCAnalyzer:
             Dictionary with complete signal analysis
         """
         try:
+            # Make sure a previous background save has landed before reading again
+            self._wait_for_pending_save()
+
+            # One clock reading for the whole analysis
+            now = datetime.now(timezone.utc)
+
+            # Start the storage read while the signal conditions are computed
+            state_future = _STATE_EXECUTOR.submit(self._get_signal_state, now)
+
             # Extract BTC metrics
             price = btc_data.get('price', 0)
             indicators = btc_data.get('indicators', {})
@@ -43,16 +102,18 @@ class BTCAnalyzer:
             signal_conditions = self._calculate_signal_conditions(weekly_rsi, mvrv, is_bull_market)
 
             # Get and update signal state
-            current_date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            signal_state = self._get_signal_state()
+            current_date = now.strftime('%Y-%m-%d')
+            signal_state = state_future.result()
             updated_state = self._update_signal_state(
                 signal_state,
                 signal_conditions,
-                current_date
+                current_date,
+                now
             )
 
-            # Save updated state
-            self._save_signal_state(updated_state)
+            # Save updated state only when something actually changed
+            if updated_state != signal_state:
+                self._pending_save = _STATE_EXECUTOR.submit(self._save_signal_state, updated_state)
 
             # Determine overall signal status
             signal_status = self._determine_signal_status(updated_state, signal_conditions)
@@ -70,7 +131,7 @@ class BTCAnalyzer:
                 'signal_conditions': signal_conditions,
                 'signal_state': updated_state,
                 'signal_status': signal_status,
-                'analysis_timestamp': datetime.now(timezone.utc).isoformat()
+                'analysis_timestamp': now.isoformat()
             }
 
         except Exception as e:
@@ -136,38 +197,54 @@ class BTCAnalyzer:
             'market_type': 'bull' if is_bull_market else 'bear'
         }
 
-    def _get_signal_state(self) -> Dict:
-        """Get current signal state from storage"""
+    def _get_signal_state(self, now: datetime = None) -> Dict:
+        """Get current signal state from storage (cached for the current UTC date)"""
         try:
             if not self.storage.table_service:
                 return self._get_default_signal_state()
 
-            # Query for signal state
-            entities = self.storage.table_service.query_entities(
-                'systemhealth',
-                filter="PartitionKey eq 'SIGNAL_STATE' and RowKey eq 'CURRENT'"
-            )
-
-            for entity in entities:
-                return {
-                    'active': getattr(entity, 'active', False),
-                    'signal_type': getattr(entity, 'signal_type', ''),
-                    'start_date': getattr(entity, 'start_date', ''),
-                    'end_date': getattr(entity, 'end_date', ''),
-                    'conditions_failing_since': getattr(entity, 'conditions_failing_since', ''),
-                    'last_updated': getattr(entity, 'last_updated', ''),
-                    'days_active': self._calculate_days_active(
-                        getattr(entity, 'start_date', ''),
-                        getattr(entity, 'end_date', '')
-                    )
-                }
-
-            return self._get_default_signal_state()
+            today = (now or datetime.now(timezone.utc)).strftime('%Y-%m-%d')
+            if self._state_cache is not None and self._state_cache_date == today:
+                return dict(self._state_cache)
+
+            # Point read of the single signal state row
+            try:
+                entity = self.storage.table_service.get_entity(
+                    'systemhealth', 'SIGNAL_STATE', 'CURRENT'
+                )
+            except AzureMissingResourceHttpError:
+                self._signal_state_etag = None
+                state = self._get_default_signal_state()
+                self._cache_signal_state(state, today)
+                return state
+
+            self._signal_state_etag = getattr(entity, 'etag', None)
+
+            state = {
+                'active': getattr(entity, 'active', False),
+                'signal_type': getattr(entity, 'signal_type', ''),
+                'start_date': getattr(entity, 'start_date', ''),
+                'end_date': getattr(entity, 'end_date', ''),
+                'conditions_failing_since': getattr(entity, 'conditions_failing_since', ''),
+                'last_updated': getattr(entity, 'last_updated', ''),
+                'days_active': self._calculate_days_active(
+                    getattr(entity, 'start_date', ''),
+                    getattr(entity, 'end_date', ''),
+                    now
+                )
+            }
+            self._cache_signal_state(state, today)
+            return state
 
         except Exception as e:
             logging.error(f"Error getting signal state: {str(e)}")
             return self._get_default_signal_state()
 
+    def _cache_signal_state(self, signal_state: Dict, date_str: str) -> None:
+        """Remember signal state for reuse until the UTC date rolls over"""
+        self._state_cache = dict(signal_state)
+        self._state_cache_date = date_str
+
     def _get_default_signal_state(self) -> Dict:
         """Get default signal state"""
         return {
@@ -180,77 +257,95 @@ class BTCAnalyzer:
             'days_active': 0
         }
 
-    def _update_signal_state(self, current_state: Dict, signal_conditions: Dict, current_date: str) -> Dict:
-        """Update signal state based on current conditions"""
+    def _update_signal_state(self, current_state: Dict, signal_conditions: Dict, current_date: str,
+                             now: datetime = None) -> Dict:
+        """
+        Update signal state based on current conditions
+
+        Returns a new state dict; current_state is left untouched so the caller
+        can tell whether anything changed.
+        """
 
-        updated_state = current_state.copy()
-        updated_state['last_updated'] = current_date
+        active = current_state['active']
+        state_signal_type = current_state['signal_type']
+        start_date = current_state['start_date']
+        end_date = current_state['end_date']
+        failing_since_str = current_state['conditions_failing_since']
+        days_active = current_state.get('days_active')
 
         both_conditions_met = signal_conditions['both_conditions_met']
         signal_type = signal_conditions['signal_type']
 
         if both_conditions_met:
             # Both conditions met
-            if not updated_state['active']:
+            if not active:
                 # Signal is turning ON
-                updated_state['active'] = True
-                updated_state['signal_type'] = signal_type
-                updated_state['start_date'] = current_date
-                updated_state['end_date'] = ''
-                updated_state['conditions_failing_since'] = ''
+                active = True
+                state_signal_type = signal_type
+                start_date = current_date
+                end_date = ''
+                failing_since_str = ''
+                days_active = 0
                 logging.info(f"🚨 {signal_type} signal activated on {current_date}")
             else:
                 # Signal remains active, clear any failing conditions
-                if updated_state['conditions_failing_since']:
+                if failing_since_str:
                     logging.info(f"✅ {signal_type} signal conditions restored")
-                updated_state['conditions_failing_since'] = ''
+                failing_since_str = ''
         else:
             # At least one condition not met
-            if updated_state['active']:
+            if active:
                 # Signal was active, now conditions are failing
-                if not updated_state['conditions_failing_since']:
+                if not failing_since_str:
                     # First day of failing conditions
-                    updated_state['conditions_failing_since'] = current_date
+                    failing_since_str = current_date
                     logging.info(
-                        f"⚠️ {updated_state['signal_type']} signal weakening - conditions failing since {current_date}")
+                        f"⚠️ {state_signal_type} signal weakening - conditions failing since {current_date}")
                 else:
                     # Check if failing for more than 30 days
-                    failing_since = datetime.strptime(updated_state['conditions_failing_since'], '%Y-%m-%d')
-                    current_dt = datetime.strptime(current_date, '%Y-%m-%d')
+                    failing_since = date.fromisoformat(failing_since_str)
+                    current_dt = date.fromisoformat(current_date)
                     days_failing = (current_dt - failing_since).days
 
                     if days_failing > 30:
                         # Turn signal OFF
-                        updated_state['active'] = False
-                        updated_state['end_date'] = current_date
-                        updated_state['conditions_failing_since'] = ''
+                        active = False
+                        end_date = current_date
+                        failing_since_str = ''
+                        days_active = self._calculate_days_active(start_date, current_date)
                         logging.info(
-                            f"🔴 {updated_state['signal_type']} signal deactivated after {days_failing} days of failing conditions")
+                            f"🔴 {state_signal_type} signal deactivated after {days_failing} days of failing conditions")
 
-        # Update days active
-        updated_state['days_active'] = self._calculate_days_active(
-            updated_state['start_date'],
-            updated_state['end_date']
-        )
+        # Days active only changes on a transition; otherwise keep the value computed on read
+        if days_active is None:
+            days_active = self._calculate_days_active(start_date, end_date, now)
 
-        return updated_state
+        return {
+            'active': active,
+            'signal_type': state_signal_type,
+            'start_date': start_date,
+            'end_date': end_date,
+            'conditions_failing_since': failing_since_str,
+            'last_updated': current_date,
+            'days_active': days_active
+        }
 
-    def _calculate_days_active(self, start_date: str, end_date: str) -> int:
+    def _calculate_days_active(self, start_date: str, end_date: str, now: datetime = None) -> int:
         """Calculate how many days a signal has been active"""
         if not start_date:
             return 0
 
         try:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            start_dt = date.fromisoformat(start_date)
 
             if end_date:
                 # Signal ended
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+                end_dt = date.fromisoformat(end_date)
                 return (end_dt - start_dt).days
             else:
                 # Signal still active
-                current_dt = datetime.now(timezone.utc)
-                return (current_dt - start_dt.replace(tzinfo=timezone.utc)).days
+                current_dt = (now or datetime.now(timezone.utc)).date()
+                return (current_dt - start_dt).days
 
         except Exception as e:
             logging.error(f"Error calculating days active: {str(e)}")
@@ -263,8 +358,6 @@ class BTCAnalyzer:
                 logging.warning("No storage service available - signal state not persisted")
                 return
 
-            from azure.cosmosdb.table.models import Entity
-
             entity = Entity()
             entity.PartitionKey = 'SIGNAL_STATE'
             entity.RowKey = 'CURRENT'
@@ -276,61 +369,72 @@ class BTCAnalyzer:
             entity.last_updated = signal_state['last_updated']
             entity.days_active = signal_state['days_active']
 
-            self.storage.table_service.insert_or_replace_entity('systemhealth', entity)
+            if self._signal_state_etag:
+                # Only overwrite the row we read; a concurrent writer makes this fail fast
+                etag = self.storage.table_service.merge_entity(
+                    'systemhealth', entity, if_match=self._signal_state_etag
+                )
+            else:
+                etag = self.storage.table_service.insert_or_replace_entity('systemhealth', entity)
+
+            self._signal_state_etag = etag
+            self._cache_signal_state(signal_state, signal_state['last_updated'])
+
+        except AzureHttpError as e:
+            self._signal_state_etag = None
+            self._state_cache = None
+            if e.status_code == 412:
+                logging.warning("Signal state changed by another writer - skipping save")
+            else:
+                logging.error(f"Error saving signal state: {str(e)}")
 
         except Exception as e:
+            self._state_cache = None
             logging.error(f"Error saving signal state: {str(e)}")
 
     def _determine_signal_status(self, signal_state: Dict, signal_conditions: Dict) -> Dict:
         """Determine the overall signal status for display"""
 
         if signal_state['active']:
-            if signal_conditions['both_conditions_met']:
-                # Signal active and conditions still met
-                status = 'active'
-                message = f"{signal_state['signal_type']} SIGNAL ACTIVE"
-                emoji = "🔴" if signal_state['signal_type'] == 'SELL' else "🟢"
-
-                # Calculate timing prediction
-                if signal_state['signal_type'] == 'SELL':
-                    prediction = "Top is likely to be reached within 1-3 months"
-                else:
-                    prediction = "Bottom is likely to be in 4-6 months"
-
-            else:
-                # Signal active but conditions weakening
-                status = 'weakening'
-                message = f"{signal_state['signal_type']} SIGNAL WEAKENING"
-                emoji = "🟡"
-                prediction = "One parameter no longer met - signal may turn off if continues >30 days"
-
+            conditions_met = signal_conditions['both_conditions_met']
+            signal_type = signal_state['signal_type']
+            base = _STATUS_TABLE.get((True, conditions_met, signal_type))
+            if base is None:
+                # Unknown type: keep the old non-SELL branch result (BUY styling), labelled with the actual type
+                logging.warning(f"Unexpected active signal type: {signal_type!r}")
+                base = {
+                    **_STATUS_TABLE[(True, conditions_met, 'BUY')],
+                    'message': f"{signal_type} SIGNAL {'ACTIVE' if conditions_met else 'WEAKENING'}"
+                }
         elif signal_state['end_date']:
             # Signal recently turned off
-            status = 'recently_off'
-            message = f"{signal_state['signal_type']} SIGNAL OFF"
-            emoji = "🟡"
-            prediction = f"Was active: {signal_state['start_date']} to {signal_state['end_date']}"
-
+            base = {
+                'status': 'recently_off',
+                'message': f"{signal_state['signal_type']} SIGNAL OFF",
+                'emoji': "🟡",
+                'prediction': f"Was active: {signal_state['start_date']} to {signal_state['end_date']}"
+            }
         else:
-            # No signal
-            status = 'none'
-            message = ""
-            emoji = ""
-            prediction = ""
+            base = _NO_SIGNAL_STATUS
 
         return {
-            'status': status,
-            'message': message,
-            'emoji': emoji,
-            'prediction': prediction,
+            **base,
             'days_active': signal_state.get('days_active', 0),
             'start_date': signal_state.get('start_date', ''),
             'end_date': signal_state.get('end_date', '')
         }
 
+    def _wait_for_pending_save(self) -> None:
+        """Block until the background save from the last analysis has landed"""
+        if self._pending_save is not None:
+            self._pending_save.result()
+            self._pending_save = None
+
     def get_signal_history(self, days: int = 90) -> Dict:
         """Get historical signal data for analysis"""
         try:
+            self._wait_for_pending_save()
+
             if not self.storage.table_service:
                 return {'error': 'Storage not available'}
 
@@ -351,6 +455,9 @@ class BTCAnalyzer:
     def reset_signal_state(self) -> bool:
         """Reset signal state (for testing/maintenance)"""
         try:
+            # A late background save would otherwise write the old state back over the reset
+            self._wait_for_pending_save()
+
             default_state = self._get_default_signal_state()
             default_state['last_updated'] = datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
@@ -6,12 +6,47 @@ from azure.cosmosdb.table.tableservice import TableService
 from azure.cosmosdb.table.models import Entity
 import os
 import json
+import math
+import numbers
 from datetime import datetime, timedelta
 import logging
 from typing import Dict, List, Optional, Any
 import pandas as pd
 from azure.common import AzureException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _finite(value: Any) -> Any:
+    """Copy of value with NaN/Infinity numbers replaced by None, recursing into dicts, lists and tuples"""
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if isinstance(value, numbers.Real) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _to_json(value: Any) -> str:
+    """
+    Serialize to a JSON string, using orjson when it is installed.
+    NaN/Infinity are stored as null on both paths (orjson can't emit them), so the output never
+    depends on whether orjson is present and is always valid JSON.
+    """
+    value = _finite(value)
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            # Anything orjson refuses goes through the stdlib encoder as before
+            pass
+    return json.dumps(value)
+
+
 class DataStorage:
     def __init__(self):
         self.account_name = os.getenv('AZURE_STORAGE_ACCOUNT')
@@ -79,11 +114,11 @@ class DataStorage:
                     
                     # Store indicators as JSON string
                     indicators = asset_data.get('indicators', {})
-                    entity.indicators = json.dumps(indicators) if indicators else '{}'
+                    entity.indicators = _to_json(indicators) if indicators else '{}'
                     
                     # Store metadata
                     metadata = asset_data.get('metadata', {})
-                    entity.metadata = json.dumps(metadata) if metadata else '{}'
+                    entity.metadata = _to_json(metadata) if metadata else '{}'
                     
                     # Store individual indicator values for easier querying
                     for indicator, value in indicators.items():
@@ -121,7 +156,7 @@ class DataStorage:
             entity.collection_success = False
             entity.error_message = asset_data.get('error', 'Unknown error')
             entity.indicators = '{}'
-            entity.metadata = json.dumps({'error_details': asset_data.get('error', 'Unknown error')})
+            entity.metadata = _to_json({'error_details': asset_data.get('error', 'Unknown error')})
             
             self.table_service.insert_or_replace_entity(self.table_name, entity)
             
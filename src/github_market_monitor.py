@@ -7,9 +7,10 @@ Includes the new True Inflation Rate and Monetary Reality insights + Pi Cycle To
 import os
 import sys
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-import traceback
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, NamedTuple, Tuple
 
 # Add current directory to path so we can import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -22,6 +23,51 @@ from mstr_analyzer import collect_mstr_data_with_retry
 from bitcoin_laws_scraper import capture_bitcoin_laws_screenshot
 from monetary_analyzer import MonetaryAnalyzer
 
+# Runs the monetary fetch, storage and asset collectors whose dependencies are met
+_COLLECTION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='market-monitor')
+
+
+class AssetSpec(NamedTuple):
+    """One step of the asset collection plan"""
+    name: str
+    deps: Tuple[str, ...]
+    fn: Callable[[Dict[str, Dict]], Dict]  # receives the results collected so far
+
+# Assets to monitor - read-only so it is built once per process and safe to share
+ASSETS_CONFIG = MappingProxyType({
+    'BTC': MappingProxyType({
+        'type': 'crypto',
+        'sources': ('polygon', 'tradingview_mvrv', 'pi_cycle')  # 🎯 Updated to include Pi Cycle
+    }),
+    'MSTR': MappingProxyType({
+        'type': 'stock',
+        'sources': ('ballistic', 'volatility')
+    })
+})
+
+# BTC indicator alerts: (indicator, condition, alert type, message formatter, severity)
+_BTC_ALERT_RULES = (
+    ('mvrv', lambda v: v > 3.0, 'mvrv_high', "BTC MVRV is high at {:.2f} - potential sell signal".format, 'medium'),
+    ('mvrv', lambda v: v < 1.0, 'mvrv_low', "BTC MVRV is low at {:.2f} - potential buy opportunity".format, 'medium'),
+    ('weekly_rsi', lambda v: v > 70, 'rsi_overbought', "BTC Weekly RSI is overbought at {:.1f}".format, 'medium'),
+    ('weekly_rsi', lambda v: v < 30, 'rsi_oversold', "BTC Weekly RSI is oversold at {:.1f}".format, 'medium'),
+)
+
+# MSTR model deviation alerts: (condition, alert type, message formatter, severity)
+# Formatters take (abs deviation %, actual price, model price)
+_MSTR_DEVIATION_RULES = (
+    (lambda d: d >= 25, 'mstr_overvalued', "MSTR is {:.1f}% overvalued (${:.2f} vs ${:.2f})".format, 'high'),
+    (lambda d: d <= -20, 'mstr_undervalued', "MSTR is {:.1f}% undervalued (${:.2f} vs ${:.2f})".format, 'medium'),
+)
+
+# High-confidence MSTR options strategies that raise an alert: strategy -> (alert type, message formatter)
+_MSTR_OPTIONS_ALERTS = {
+    'long_calls': ('mstr_bullish_options', "High confidence bullish options signal: {}".format),
+    'moderate_bullish': ('mstr_bullish_options', "High confidence bullish options signal: {}".format),
+    'long_puts': ('mstr_bearish_options', "High confidence bearish options signal: {}".format),
+    'moderate_bearish': ('mstr_bearish_options', "High confidence bearish options signal: {}".format),
+}
+
 
 def setup_logging():
     """Setup enhanced logging for GitHub Actions"""
@@ -42,6 +88,9 @@ def main():
     logging.info('🚀 Enhanced GitHub Actions Market Monitor started at %s', datetime.utcnow())
     logging.info('✨ Now includes True Inflation Rate, Monetary Reality insights, and Pi Cycle Top Indicator!')
 
+    notification_handler = None
+    store_future = None
+
     try:
         # Initialize components (enhanced notification handler has our new features)
         collector = AssetDataCollector()
@@ -49,55 +98,21 @@ def main():
         data_storage = DataStorage()
         monetary_analyzer = MonetaryAnalyzer(storage=data_storage)
 
-        # Define assets to monitor
-        assets_config = {
-            'BTC': {
-                'type': 'crypto',
-                'sources': ['polygon', 'tradingview_mvrv', 'pi_cycle']  # 🎯 Updated to include Pi Cycle
-            },
-            'MSTR': {
-                'type': 'stock',
-                'sources': ['ballistic', 'volatility']
-            }
-        }
-
-        # Collect data for all assets
-        logging.info(f'📊 Collecting data for assets: {list(assets_config.keys())}')
-        collected_data = {}
-
-        for asset, config in assets_config.items():
-            logging.info(f'🔄 Processing {asset}...')
-
-            if asset == 'BTC':
-                asset_data = collector.collect_asset_data(asset, config)
-                
-                # 🎯 DEBUG: Log Pi Cycle data presence in collected data
-                pi_cycle_data = asset_data.get('pi_cycle', {})
-                if pi_cycle_data.get('success'):
-                    proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
-                    gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
-                    logging.info(f"🎯 BTC Pi Cycle collected: {proximity_level} ({gap_percentage:.1f}% gap)")
-                else:
-                    logging.warning(f"⚠️ BTC Pi Cycle collection issue: {pi_cycle_data.get('error', 'No Pi Cycle data')}")
-                    
-            elif asset == 'MSTR':
-                btc_price = None
-                if 'BTC' in collected_data and collected_data['BTC'].get('success'):
-                    btc_price = collected_data['BTC'].get('price', 95000)
-                else:
-                    btc_price = 95000
-
-                logging.info(f'📈 Collecting MSTR data with retry mechanism using BTC price: ${btc_price:,.2f}')
-                asset_data = collect_mstr_data_with_retry(btc_price, max_attempts=3)
-            else:
-                asset_data = {'success': False, 'error': f'Unknown asset: {asset}'}
+        # Monetary data is independent of the assets, so fetch it in the background
+        # while BTC and MSTR (which needs the BTC price) are collected
+        logging.info("🏦 Collecting enhanced monetary policy data in background...")
+        monetary_future = _COLLECTION_EXECUTOR.submit(monetary_analyzer.get_monetary_analysis)
 
-            collected_data[asset] = asset_data
-            logging.info(f'{asset} collection result: {"✅ SUCCESS" if asset_data.get("success") else "❌ FAILED"}')
+        # Collect data for all assets - each collector runs as soon as its dependencies are in
+        logging.info(f'📊 Collecting data for assets: {list(ASSETS_CONFIG.keys())}')
+        collection_plan = [
+            AssetSpec(name='BTC', deps=(), fn=lambda ctx: _collect_btc_data(collector, ASSETS_CONFIG['BTC'])),
+            AssetSpec(name='MSTR', deps=('BTC',), fn=_collect_mstr_data),
+        ]
+        collected_data = run_collection_plan(collection_plan)
 
         # 🎯 ENHANCED: Collect monetary analysis with new features
-        logging.info("🏦 Collecting enhanced monetary policy data...")
-        monetary_data = monetary_analyzer.get_monetary_analysis()
+        monetary_data = monetary_future.result()
 
         if monetary_data.get('success'):
             data_date = monetary_data.get('data_date', 'Unknown')
@@ -135,9 +150,9 @@ def main():
         processed_data = process_asset_data_enhanced(collected_data)  # 🎯 Use enhanced function
         processed_data['monetary'] = monetary_data
 
-        # Store data
+        # Store data in the background; the report does not depend on it
         logging.info('💾 Storing processed data')
-        data_storage.store_daily_data(processed_data)
+        store_future = _COLLECTION_EXECUTOR.submit(data_storage.store_daily_data, processed_data)
 
         # 🎯 ENHANCED: Check if we should send the report (with monetary validation)
         should_send_report = should_send_daily_report_enhanced(
@@ -168,65 +183,157 @@ def main():
                 logging.info(f'✨ Report includes Pi Cycle Top Indicator: {proximity_level} ({gap_percentage:.1f}% gap)')
             else:
                 logging.warning(f'⚠️ Pi Cycle not included in report: {btc_pi_cycle.get("error", "No data")}')
-            
+
             logging.info('✅ Enhanced Market Monitor completed successfully')
             return True
         else:
             logging.warning(f'📧 Report not sent: {should_send_report["reason"]}')
             
-            # 🎯 ENHANCED: Include monetary status in error report
-            monetary_status = "✅ SUCCESS" if monetary_data.get('success') else "❌ FAILED"
-            if monetary_data.get('success') and monetary_data.get('true_inflation_rate'):
-                monetary_status += f" (True Inflation: {monetary_data['true_inflation_rate']:.1f}%)"
-            
-            # 🎯 NEW: Include Pi Cycle status in error report
-            btc_data = collected_data.get('BTC', {})
-            pi_cycle_status = "❌ NOT COLLECTED"
-            if btc_data.get('success'):
-                pi_cycle_data = btc_data.get('pi_cycle', {})
-                if pi_cycle_data.get('success'):
-                    proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
-                    gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
-                    pi_cycle_status = f"✅ SUCCESS ({proximity_level} - {gap_percentage:.1f}% gap)"
-                else:
-                    pi_cycle_status = f"❌ FAILED ({pi_cycle_data.get('error', 'Unknown error')})"
-            
-            error_message = f"""
-Enhanced GitHub Actions Daily Report - Component Status
-
-Reason: {should_send_report['reason']}
-
-COMPONENT STATUS:
-- BTC: {'✅ SUCCESS' if collected_data.get('BTC', {}).get('success') else '❌ FAILED'}
-- MSTR: {'✅ SUCCESS' if collected_data.get('MSTR', {}).get('success') else '❌ FAILED'}  
-- Bitcoin Laws Screenshot: {'✅ SUCCESS' if bitcoin_laws_screenshot else '❌ FAILED'}
-- Monetary Data: {monetary_status}
-- Pi Cycle Indicator: {pi_cycle_status}
-
-ENHANCED FEATURES STATUS:
-- True Inflation Rate: {'✅ CALCULATED' if monetary_data.get('true_inflation_rate') else '❌ NOT AVAILABLE'}
-- Monetary Reality Insight: {'✅ READY' if monetary_data.get('true_inflation_rate') else '❌ REQUIRES TRUE INFLATION DATA'}
-- Pi Cycle Top Indicator: {pi_cycle_status}
-
-DETAILS:
-{should_send_report.get('details', 'No additional details')}
-            """
+            error_message = _format_failure_report(
+                should_send_report, collected_data, bitcoin_laws_screenshot, monetary_data
+            )
             notification_handler.send_error_notification(error_message)
             logging.info('📧 Enhanced error notification sent instead of daily report')
             return False
 
     except Exception as e:
-        logging.error(f'❌ Critical error in enhanced market monitor: {str(e)}')
-        logging.error(traceback.format_exc())
+        logging.exception('❌ Critical error in enhanced market monitor: %s', e)
 
         try:
-            error_handler = EnhancedNotificationHandler()
+            # Reuse the handler built for the report unless it was never constructed
+            error_handler = notification_handler or EnhancedNotificationHandler()
             error_handler.send_error_notification(f"Enhanced GitHub Actions Error: {str(e)}")
         except Exception as error_ex:
             logging.error(f'❌ Failed to send error notification: {str(error_ex)}')
         
         return False
 
+    finally:
+        # Join the background write on every path so a storage failure is never lost
+        if store_future is not None:
+            _wait_for_storage(store_future)
+
+
+def run_collection_plan(plan: List[AssetSpec]) -> Dict[str, Dict]:
+    """
+    Run the asset collectors, submitting each one once all of its dependencies have
+    finished (successfully or not). Results are keyed by asset in completion order.
+    """
+    pending = {spec.name: spec for spec in plan}
+    running = {}
+    collected_data = {}
+
+    while pending or running:
+        ready = [spec for spec in pending.values() if all(dep in collected_data for dep in spec.deps)]
+        for spec in ready:
+            logging.info(f'🔄 Processing {spec.name}...')
+            del pending[spec.name]
+            running[_COLLECTION_EXECUTOR.submit(spec.fn, dict(collected_data))] = spec.name
+
+        if not running:
+            # Whatever is left waits on assets that are not part of the plan
+            for spec in pending.values():
+                missing = [dep for dep in spec.deps if dep not in collected_data]
+                collected_data[spec.name] = {'success': False, 'error': f'Unresolved dependencies: {missing}'}
+            break
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            asset = running.pop(future)
+            try:
+                asset_data = future.result()
+            except Exception as e:
+                logging.error(f'❌ {asset} collection raised: {str(e)}')
+                asset_data = {'success': False, 'error': str(e)}
+
+            collected_data[asset] = asset_data
+            logging.info(f'{asset} collection result: {"✅ SUCCESS" if asset_data.get("success") else "❌ FAILED"}')
+
+    return collected_data
+
+
+def _collect_btc_data(collector, config: Dict) -> Dict:
+    """Collect BTC data and log whether the Pi Cycle indicator came with it"""
+    asset_data = collector.collect_asset_data('BTC', config)
+
+    # 🎯 DEBUG: Log Pi Cycle data presence in collected data
+    pi_cycle_data = asset_data.get('pi_cycle', {})
+    if pi_cycle_data.get('success'):
+        proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
+        gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
+        logging.info(f"🎯 BTC Pi Cycle collected: {proximity_level} ({gap_percentage:.1f}% gap)")
+    else:
+        logging.warning(f"⚠️ BTC Pi Cycle collection issue: {pi_cycle_data.get('error', 'No Pi Cycle data')}")
+
+    return asset_data
+
+
+def _collect_mstr_data(collected_data: Dict[str, Dict]) -> Dict:
+    """Collect MSTR data, modelled off the collected BTC price (95000 when BTC failed)"""
+    btc_data = collected_data.get('BTC') or {}
+    btc_price = btc_data.get('price', 95000) if btc_data.get('success') else 95000
+
+    logging.info(f'📈 Collecting MSTR data with retry mechanism using BTC price: ${btc_price:,.2f}')
+    return collect_mstr_data_with_retry(btc_price, max_attempts=3)
+
+
+def _format_failure_report(should_send_report: Dict, collected_data: Dict,
+                           bitcoin_laws_screenshot: str, monetary_data: Dict) -> str:
+    """Build the component status message sent when the daily report is skipped"""
+    btc_ok = '✅ SUCCESS' if (collected_data.get('BTC') or {}).get('success') else '❌ FAILED'
+    mstr_ok = '✅ SUCCESS' if (collected_data.get('MSTR') or {}).get('success') else '❌ FAILED'
+    screenshot_ok = '✅ SUCCESS' if bitcoin_laws_screenshot else '❌ FAILED'
+    true_inflation = monetary_data.get('true_inflation_rate')
+
+    # 🎯 ENHANCED: Include monetary status in error report
+    monetary_status = "✅ SUCCESS" if monetary_data.get('success') else "❌ FAILED"
+    if monetary_data.get('success') and true_inflation:
+        monetary_status += f" (True Inflation: {true_inflation:.1f}%)"
+
+    # 🎯 NEW: Include Pi Cycle status in error report
+    btc_data = collected_data.get('BTC') or {}
+    pi_cycle_status = "❌ NOT COLLECTED"
+    if btc_data.get('success'):
+        pi_cycle_data = btc_data.get('pi_cycle', {})
+        if pi_cycle_data.get('success'):
+            proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
+            gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
+            pi_cycle_status = f"✅ SUCCESS ({proximity_level} - {gap_percentage:.1f}% gap)"
+        else:
+            pi_cycle_status = f"❌ FAILED ({pi_cycle_data.get('error', 'Unknown error')})"
+
+    lines = [
+        "",
+        "Enhanced GitHub Actions Daily Report - Component Status",
+        "",
+        f"Reason: {should_send_report['reason']}",
+        "",
+        "COMPONENT STATUS:",
+        f"- BTC: {btc_ok}",
+        f"- MSTR: {mstr_ok}",
+        f"- Bitcoin Laws Screenshot: {screenshot_ok}",
+        f"- Monetary Data: {monetary_status}",
+        f"- Pi Cycle Indicator: {pi_cycle_status}",
+        "",
+        "ENHANCED FEATURES STATUS:",
+        f"- True Inflation Rate: {'✅ CALCULATED' if true_inflation else '❌ NOT AVAILABLE'}",
+        f"- Monetary Reality Insight: {'✅ READY' if true_inflation else '❌ REQUIRES TRUE INFLATION DATA'}",
+        f"- Pi Cycle Top Indicator: {pi_cycle_status}",
+        "",
+        "DETAILS:",
+        should_send_report.get('details', 'No additional details'),
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _wait_for_storage(store_future) -> None:
+    """Wait for the background data storage write and log its outcome"""
+    try:
+        store_future.result()
+    except Exception as e:
+        logging.error(f'❌ Background data storage failed: {str(e)}')
+
 
 # =============================================================================
 # ENHANCED FUNCTIONS (Updated to better handle new monetary features + Pi Cycle)
@@ -238,10 +345,8 @@ def should_send_daily_report_enhanced(processed_data: Dict, collected_data: Dict
     Enhanced report sending logic with improved monetary data validation + Pi Cycle
     """
     try:
-        # Core component checks (unchanged)
-        btc_success = collected_data.get('BTC', {}).get('success', False)
-        mstr_success = collected_data.get('MSTR', {}).get('success', False)
-        screenshot_success = bool(bitcoin_laws_screenshot and len(bitcoin_laws_screenshot) > 100)
+        btc = collected_data.get('BTC') or {}
+        btc_success = btc.get('success', False)
 
         # 🎯 ENHANCED: More detailed monetary data validation
         monetary_success = monetary_data.get('success', False) if monetary_data else False
@@ -257,8 +362,7 @@ def should_send_daily_report_enhanced(processed_data: Dict, collected_data: Dict
         pi_cycle_status = "not_collected"
         
         if btc_success:
-            btc_data = collected_data.get('BTC', {})
-            pi_cycle_data = btc_data.get('pi_cycle', {})
+            pi_cycle_data = btc.get('pi_cycle', {})
             pi_cycle_success = pi_cycle_data.get('success', False)
             
             if pi_cycle_success:
@@ -268,15 +372,8 @@ def should_send_daily_report_enhanced(processed_data: Dict, collected_data: Dict
             else:
                 pi_cycle_status = f"failed_{pi_cycle_data.get('error', 'unknown')}"
 
-        # Validate data quality
-        btc_data_quality = validate_btc_data_quality_enhanced(processed_data.get('assets', {}).get('BTC', {}))
-        mstr_data_quality = validate_mstr_data_quality(collected_data.get('MSTR', {}))
-
-        # Core components must succeed
-        core_components_ready = (
-                btc_success and btc_data_quality['is_valid'] and
-                mstr_success and mstr_data_quality['is_valid']
-                # screenshot_success
+        core_components_ready, failed_components = _evaluate_core_components(
+            processed_data, collected_data, bitcoin_laws_screenshot
         )
 
         if core_components_ready:
@@ -321,22 +418,6 @@ def should_send_daily_report_enhanced(processed_data: Dict, collected_data: Dict
                         'details': f'Monetary error: {monetary_data.get("error", "Unknown") if monetary_data else "Not attempted"}. Pi Cycle status: {pi_cycle_status}'
                     }
         else:
-            # Determine what failed
-            failed_components = []
-
-            if not btc_success:
-                failed_components.append("BTC collection failed")
-            elif not btc_data_quality['is_valid']:
-                failed_components.append(f"BTC data quality issues: {'; '.join(btc_data_quality['issues'])}")
-
-            if not mstr_success:
-                failed_components.append("MSTR collection failed")
-            elif not mstr_data_quality['is_valid']:
-                failed_components.append(f"MSTR data quality issues: {'; '.join(mstr_data_quality['issues'])}")
-
-            if not screenshot_success:
-                failed_components.append("Bitcoin Laws screenshot failed/empty")
-
             return {
                 'send': False,
                 'reason': 'Core components failed - cannot send report',
@@ -352,6 +433,100 @@ def should_send_daily_report_enhanced(processed_data: Dict, collected_data: Dict
         }
 
 
+def _evaluate_core_components(processed_data: Dict, collected_data: Dict,
+                              bitcoin_laws_screenshot: str = "") -> Tuple[bool, List[str]]:
+    """
+    Shared core readiness check for the daily report
+
+    Returns (ready, failed_components); failed_components is only filled in when
+    the core components are not ready.
+    """
+    btc = collected_data.get('BTC') or {}
+    mstr = collected_data.get('MSTR') or {}
+    processed_btc = (processed_data.get('assets') or {}).get('BTC') or {}
+
+    btc_success = btc.get('success', False)
+    mstr_success = mstr.get('success', False)
+    screenshot_success = bool(bitcoin_laws_screenshot and len(bitcoin_laws_screenshot) > 100)
+
+    # Core components must succeed - the quick checks gate, issue lists are only built on failure
+    btc_valid = btc_success and is_btc_data_valid(processed_btc)
+    mstr_valid = mstr_success and is_mstr_data_valid(mstr)
+
+    if btc_valid and mstr_valid:  # screenshot_success
+        return True, []
+
+    # Determine what failed
+    failed_components = []
+
+    if not btc_success:
+        failed_components.append("BTC collection failed")
+    elif not btc_valid:
+        btc_data_quality = validate_btc_data_quality_enhanced(processed_btc)
+        failed_components.append(f"BTC data quality issues: {'; '.join(btc_data_quality['issues'])}")
+
+    if not mstr_success:
+        failed_components.append("MSTR collection failed")
+    elif not mstr_valid:
+        mstr_data_quality = validate_mstr_data_quality(mstr)
+        failed_components.append(f"MSTR data quality issues: {'; '.join(mstr_data_quality['issues'])}")
+
+    if not screenshot_success:
+        failed_components.append("Bitcoin Laws screenshot failed/empty")
+
+    return False, failed_components
+
+
+def is_btc_data_valid(btc_data: Dict) -> bool:
+    """
+    Quick pass/fail version of validate_btc_data_quality_enhanced for report gating.
+    Applies the same checks but stops at the first failure without building issues.
+    """
+    try:
+        indicators = btc_data.get('indicators') or {}
+        if not ('error' not in btc_data and
+                10000 <= (btc_data.get('price') or 0) <= 1000000 and
+                0 < (indicators.get('mvrv') or 0) <= 10 and
+                0 < (indicators.get('weekly_rsi') or 0) <= 100 and
+                1000 <= (indicators.get('ema_200') or 0) <= 500000):
+            return False
+
+        # Pi Cycle only counts against the data when it claims success
+        pi_cycle_data = btc_data.get('pi_cycle', {})
+        if not pi_cycle_data.get('success'):
+            return True
+        current_values = pi_cycle_data.get('current_values', {})
+        gap_percentage = current_values.get('gap_percentage')
+        return (current_values.get('ma_111', 0) > 0 and current_values.get('ma_350_x2', 0) > 0 and
+                gap_percentage is not None and abs(gap_percentage) <= 100)
+
+    except Exception:
+        return False
+
+
+def is_mstr_data_valid(mstr_data: Dict) -> bool:
+    """
+    Quick pass/fail version of validate_mstr_data_quality for report gating.
+    Applies the same checks but stops at the first failure without building issues.
+    """
+    try:
+        indicators = mstr_data.get('indicators') or {}
+        deviation_pct = indicators.get('deviation_pct')
+        if not (mstr_data.get('success') and
+                10 <= (mstr_data.get('price') or 0) <= 10000 and
+                1 < (indicators.get('model_price') or 0) < 10000 and
+                deviation_pct is not None and abs(deviation_pct) <= 200 and
+                10 <= indicators.get('iv', 0) <= 500):
+            return False
+
+        analysis = mstr_data.get('analysis', {})
+        return not (analysis and 'options_strategy' in analysis and
+                    not analysis['options_strategy'].get('primary_strategy'))
+
+    except Exception:
+        return False
+
+
 def validate_btc_data_quality_enhanced(btc_data: Dict) -> Dict:
     """🎯 ENHANCED BTC data quality validation including Pi Cycle"""
     issues = []
@@ -361,30 +536,26 @@ def validate_btc_data_quality_enhanced(btc_data: Dict) -> Dict:
             issues.append(f"BTC has error: {btc_data['error']}")
             return {'is_valid': False, 'issues': issues}
 
-        # Check price
-        price = btc_data.get('price', 0)
-        if not price or price <= 0:
-            issues.append(f"Invalid price: {price}")
-        elif price < 10000 or price > 1000000:  # Sanity check
+        # Check price - without a price nothing else is worth checking
+        if not (price := btc_data.get('price', 0)) or price <= 0:
+            return {'is_valid': False, 'issues': [f"Invalid price: {price}"]}
+        if price < 10000 or price > 1000000:  # Sanity check
             issues.append(f"Price outside reasonable range: ${price:,.2f}")
 
         # Check indicators
-        indicators = btc_data.get('indicators', {})
+        indicators = btc_data.get('indicators') or {}
 
-        mvrv = indicators.get('mvrv', 0)
-        if not mvrv or mvrv <= 0:
+        if not (mvrv := indicators.get('mvrv', 0)) or mvrv <= 0:
             issues.append(f"Invalid MVRV: {mvrv}")
         elif mvrv > 10:  # Sanity check
             issues.append(f"MVRV unusually high: {mvrv}")
 
-        weekly_rsi = indicators.get('weekly_rsi', 0)
-        if not weekly_rsi or weekly_rsi <= 0:
+        if not (weekly_rsi := indicators.get('weekly_rsi', 0)) or weekly_rsi <= 0:
             issues.append(f"Invalid Weekly RSI: {weekly_rsi}")
         elif weekly_rsi > 100:  # Sanity check
             issues.append(f"Weekly RSI above 100: {weekly_rsi}")
 
-        ema_200 = indicators.get('ema_200', 0)
-        if not ema_200 or ema_200 <= 0:
+        if not (ema_200 := indicators.get('ema_200', 0)) or ema_200 <= 0:
             issues.append(f"Invalid EMA 200: {ema_200}")
         elif ema_200 < 1000 or ema_200 > 500000:  # Sanity check
             issues.append(f"EMA 200 outside reasonable range: ${ema_200:,.2f}")
@@ -427,31 +598,27 @@ def validate_mstr_data_quality(mstr_data: Dict) -> Dict:
             issues.append(f"Collection failed: {mstr_data.get('error', 'Unknown error')}")
             return {'is_valid': False, 'issues': issues}
 
-        # Check price
-        price = mstr_data.get('price', 0)
-        if not price or price <= 0:
-            issues.append(f"Invalid price: {price}")
-        elif price < 10 or price > 10000:  # Sanity check for MSTR
+        # Check price - without a price nothing else is worth checking
+        if not (price := mstr_data.get('price', 0)) or price <= 0:
+            return {'is_valid': False, 'issues': [f"Invalid price: {price}"]}
+        if price < 10 or price > 10000:  # Sanity check for MSTR
             issues.append(f"MSTR price outside reasonable range: ${price:.2f}")
 
         # Check indicators
-        indicators = mstr_data.get('indicators', {})
+        indicators = mstr_data.get('indicators') or {}
 
-        model_price = indicators.get('model_price', 0)
-        if not model_price or model_price <= 0:
+        if not (model_price := indicators.get('model_price', 0)) or model_price <= 0:
             issues.append(f"Invalid model price: {model_price}")
         elif not (1 < model_price < 10000):
             issues.append(f"Model price outside reasonable range: ${model_price:.2f}")
 
-        deviation_pct = indicators.get('deviation_pct', None)
-        if deviation_pct is None:
+        if (deviation_pct := indicators.get('deviation_pct')) is None:
             issues.append("Missing deviation percentage")
         elif abs(deviation_pct) > 200:  # Sanity check
             issues.append(f"Deviation percentage seems extreme: {deviation_pct:.1f}%")
 
         # IV validation - enhanced
-        iv = indicators.get('iv', 0)
-        if iv == 0:
+        if (iv := indicators.get('iv', 0)) == 0:
             issues.append("Missing main IV (Implied Volatility) data")
         elif iv < 10 or iv > 500:  # Sanity check for IV
             issues.append(f"IV outside reasonable range: {iv:.1f}%")
@@ -470,10 +637,63 @@ def validate_mstr_data_quality(mstr_data: Dict) -> Dict:
         return {'is_valid': False, 'issues': [f"Validation error: {str(e)}"]}
 
 
+def _build_asset_entry(data: Dict, default_type: str = 'unknown') -> Dict:
+    """Base processed entry shared by every successfully collected asset"""
+    return {
+        'type': data.get('type', default_type),
+        'price': data.get('price', 0),
+        'indicators': data.get('indicators', {}),
+        'metadata': data.get('metadata', {}),
+        'last_updated': data.get('timestamp')
+    }
+
+
+def _build_btc_entry(data: Dict, summary: Dict) -> Dict:
+    """BTC entry - 🎯 ENHANCED: Preserve Pi Cycle data with debug logging"""
+    pi_cycle_data = data.get('pi_cycle', {})
+
+    entry = _build_asset_entry(data, 'crypto')
+    entry['pi_cycle'] = pi_cycle_data  # 🎯 CRITICAL: Preserve Pi Cycle data
+
+    # 🎯 DEBUG: Log Pi Cycle data preservation
+    if pi_cycle_data.get('success'):
+        proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
+        gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
+        logging.info(f"🎯 Pi Cycle data preserved in processed_data: {proximity_level} ({gap_percentage:.1f}% gap)")
+        summary['pi_cycle_available'] = True
+    else:
+        logging.warning(f"⚠️ Pi Cycle data not preserved: {pi_cycle_data.get('error', 'No data')}")
+
+    return entry
+
+
+def _build_mstr_entry(data: Dict, summary: Dict) -> Dict:
+    """MSTR entry including the enhanced analysis with options strategy"""
+    analysis = data.get('analysis', {})
+    # 🎯 ENHANCED: Track if options strategy is available
+    has_options_strategy = bool(analysis.get('options_strategy'))
+    if has_options_strategy:
+        summary['enhanced_features_available'] = True
+
+    entry = _build_asset_entry(data, 'stock')
+    entry['analysis'] = analysis
+    entry['attempts_made'] = data.get('attempts_made', 1)
+    entry['has_options_strategy'] = has_options_strategy
+    return entry
+
+
+# Per-asset processed entry builders; unknown assets get the base entry
+_ASSET_BUILDERS = {
+    'BTC': _build_btc_entry,
+    'MSTR': _build_mstr_entry,
+}
+
+
 def process_asset_data_enhanced(collected_data: Dict) -> Dict:
     """🎯 ENHANCED asset data processing with Pi Cycle preservation"""
+    now_iso = datetime.utcnow().isoformat()
     processed = {
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': now_iso,
         'assets': {},
         'summary': {
             'total_assets': len(collected_data),
@@ -488,59 +708,14 @@ def process_asset_data_enhanced(collected_data: Dict) -> Dict:
         if data.get('success', False):
             processed['summary']['successful_collections'] += 1
 
-            if asset == 'BTC':
-                # 🎯 ENHANCED: Preserve Pi Cycle data with debug logging
-                pi_cycle_data = data.get('pi_cycle', {})
-                
-                processed['assets'][asset] = {
-                    'type': data.get('type', 'crypto'),
-                    'price': data.get('price', 0),
-                    'indicators': data.get('indicators', {}),
-                    'metadata': data.get('metadata', {}),
-                    'last_updated': data.get('timestamp'),
-                    'pi_cycle': pi_cycle_data  # 🎯 CRITICAL: Preserve Pi Cycle data
-                }
-                
-                # 🎯 DEBUG: Log Pi Cycle data preservation
-                if pi_cycle_data.get('success'):
-                    proximity_level = pi_cycle_data.get('signal_status', {}).get('proximity_level', 'UNKNOWN')
-                    gap_percentage = pi_cycle_data.get('current_values', {}).get('gap_percentage', 0)
-                    logging.info(f"🎯 Pi Cycle data preserved in processed_data: {proximity_level} ({gap_percentage:.1f}% gap)")
-                    processed['summary']['pi_cycle_available'] = True
-                else:
-                    logging.warning(f"⚠️ Pi Cycle data not preserved: {pi_cycle_data.get('error', 'No data')}")
-                    
-            elif asset == 'MSTR':
-                analysis = data.get('analysis', {})
-                # 🎯 ENHANCED: Track if options strategy is available
-                has_options_strategy = bool(analysis.get('options_strategy'))
-                if has_options_strategy:
-                    processed['summary']['enhanced_features_available'] = True
-                
-                processed['assets'][asset] = {
-                    'type': data.get('type', 'stock'),
-                    'price': data.get('price', 0),
-                    'indicators': data.get('indicators', {}),
-                    'analysis': analysis,  # Include enhanced MSTR analysis with options strategy
-                    'metadata': data.get('metadata', {}),
-                    'last_updated': data.get('timestamp'),
-                    'attempts_made': data.get('attempts_made', 1),
-                    'has_options_strategy': has_options_strategy
-                }
-            else:
-                processed['assets'][asset] = {
-                    'type': data.get('type', 'unknown'),
-                    'price': data.get('price', 0),
-                    'indicators': data.get('indicators', {}),
-                    'metadata': data.get('metadata', {}),
-                    'last_updated': data.get('timestamp')
-                }
+            builder = _ASSET_BUILDERS.get(asset)
+            processed['assets'][asset] = builder(data, processed['summary']) if builder else _build_asset_entry(data)
         else:
             processed['summary']['failed_collections'] += 1
             processed['assets'][asset] = {
                 'type': data.get('type', 'unknown'),
                 'error': data.get('error', 'Unknown error'),
-                'last_updated': datetime.utcnow().isoformat(),
+                'last_updated': now_iso,
                 'attempts_made': data.get('attempts_made', 1),
                 'pi_cycle': data.get('pi_cycle', {'success': False, 'error': 'Asset collection failed'}) if asset == 'BTC' else None  # 🎯 Preserve failed Pi Cycle
             }
@@ -591,44 +766,14 @@ def generate_alerts(data: Dict, storage: DataStorage) -> List[Dict]:
 
 def generate_btc_alerts_enhanced(btc_data: Dict, storage: DataStorage) -> List[Dict]:
     """🎯 ENHANCED Bitcoin-specific alerts including Pi Cycle"""
-    alerts = []
     indicators = btc_data.get('indicators', {})
 
-    # MVRV alerts
-    mvrv = indicators.get('mvrv')
-    if mvrv:
-        if mvrv > 3.0:
-            alerts.append({
-                'type': 'mvrv_high',
-                'asset': 'BTC',
-                'message': f"BTC MVRV is high at {mvrv:.2f} - potential sell signal",
-                'severity': 'medium'
-            })
-        elif mvrv < 1.0:
-            alerts.append({
-                'type': 'mvrv_low',
-                'asset': 'BTC',
-                'message': f"BTC MVRV is low at {mvrv:.2f} - potential buy opportunity",
-                'severity': 'medium'
-            })
-
-    # RSI alerts
-    rsi = indicators.get('weekly_rsi')
-    if rsi:
-        if rsi > 70:
-            alerts.append({
-                'type': 'rsi_overbought',
-                'asset': 'BTC',
-                'message': f"BTC Weekly RSI is overbought at {rsi:.1f}",
-                'severity': 'medium'
-            })
-        elif rsi < 30:
-            alerts.append({
-                'type': 'rsi_oversold',
-                'asset': 'BTC',
-                'message': f"BTC Weekly RSI is oversold at {rsi:.1f}",
-                'severity': 'medium'
-            })
+    # MVRV and RSI alerts
+    alerts = [
+        {'type': alert_type, 'asset': 'BTC', 'message': format_message(value), 'severity': severity}
+        for field, condition, alert_type, format_message, severity in _BTC_ALERT_RULES
+        if (value := indicators.get(field)) and condition(value)
+    ]
 
     # 🎯 NEW: Pi Cycle alerts
     pi_cycle_data = btc_data.get('pi_cycle', {})
@@ -665,48 +810,34 @@ def generate_btc_alerts_enhanced(btc_data: Dict, storage: DataStorage) -> List[D
 def generate_mstr_alerts(mstr_data: Dict, storage: DataStorage) -> List[Dict]:
     """Enhanced MSTR-specific alerts with options strategy insights"""
     alerts = []
-    indicators = mstr_data.get('indicators', {})
-    analysis = mstr_data.get('analysis', {})
+    indicators = mstr_data.get('indicators') or {}
 
     # Model price vs actual price alerts
-    model_price = indicators.get('model_price')
+    model_price, deviation_pct = indicators.get('model_price'), indicators.get('deviation_pct')
     actual_price = mstr_data.get('price')
-    deviation_pct = indicators.get('deviation_pct')
 
     if model_price and actual_price and deviation_pct is not None:
-        if deviation_pct >= 25:
-            alerts.append({
-                'type': 'mstr_overvalued',
+        alerts.extend(
+            {
+                'type': alert_type,
                 'asset': 'MSTR',
-                'message': f"MSTR is {deviation_pct:.1f}% overvalued (${actual_price:.2f} vs ${model_price:.2f})",
-                'severity': 'high'
-            })
-        elif deviation_pct <= -20:
-            alerts.append({
-                'type': 'mstr_undervalued',
-                'asset': 'MSTR',
-                'message': f"MSTR is {abs(deviation_pct):.1f}% undervalued (${actual_price:.2f} vs ${model_price:.2f})",
-                'severity': 'medium'
-            })
+                'message': format_message(abs(deviation_pct), actual_price, model_price),
+                'severity': severity
+            }
+            for condition, alert_type, format_message, severity in _MSTR_DEVIATION_RULES
+            if condition(deviation_pct)
+        )
 
     # 🎯 ENHANCED: Options strategy alerts
-    options_strategy = analysis.get('options_strategy', {})
-    if options_strategy:
-        strategy = options_strategy.get('primary_strategy', '')
-        confidence = options_strategy.get('confidence', 'medium')
-        
-        if strategy in ['long_calls', 'moderate_bullish'] and confidence == 'high':
-            alerts.append({
-                'type': 'mstr_bullish_options',
-                'asset': 'MSTR',
-                'message': f"High confidence bullish options signal: {options_strategy.get('message', '')}",
-                'severity': 'medium'
-            })
-        elif strategy in ['long_puts', 'moderate_bearish'] and confidence == 'high':
+    options_strategy = (mstr_data.get('analysis') or {}).get('options_strategy')
+    if options_strategy and options_strategy.get('confidence', 'medium') == 'high':
+        options_alert = _MSTR_OPTIONS_ALERTS.get(options_strategy.get('primary_strategy', ''))
+        if options_alert:
+            alert_type, format_message = options_alert
             alerts.append({
-                'type': 'mstr_bearish_options',
+                'type': alert_type,
                 'asset': 'MSTR',
-                'message': f"High confidence bearish options signal: {options_strategy.get('message', '')}",
+                'message': format_message(options_strategy.get('message', '')),
                 'severity': 'medium'
             })
 
@@ -0,0 +1,74 @@
+# =============================================================================
+# http_client.py - Process-wide pooled HTTP session
+# =============================================================================
+
+import json
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_USER_AGENT = 'BTC-Monitor-Hybrid/1.0'
+
+
+def _json_loads(data):
+    """Decode JSON text or bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(value) -> bytes:
+    """Encode a value as UTF-8 JSON bytes, using orjson when it is installed"""
+    return orjson.dumps(value) if orjson is not None else json.dumps(value).encode()
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose sockets keep urllib3's TCP_NODELAY and add TCP keepalive probes,
+    so pooled connections survive idle gaps instead of being dropped silently by NAT/proxies
+    and costing a fresh TCP+TLS handshake on the next call.
+    """
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ] + ([(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)] if hasattr(socket, 'TCP_KEEPIDLE') else [])
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Process-wide keep-alive session shared by every collector and scraper.
+    urllib3 keeps one connection pool per (scheme, host, port), so Polygon, CoinGecko and
+    TradingView calls each reuse a warm TCP+TLS connection no matter which object makes them.
+    Host-specific headers (e.g. TradingView's Referer) belong on the individual request.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': DEFAULT_USER_AGENT,
+                'Connection': 'keep-alive',
+                # urllib3 lists br/zstd here only when their decoders are installed, so this never over-promises
+                'Accept-Encoding': ACCEPT_ENCODING
+            })
+            # 429s are left to callers' rate limiters so Retry-After also throttles other threads
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+            session.mount('https://', KeepAliveAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+            _session = session
+        return _session
@@ -1,83 +1,343 @@
+import atexit
+import base64
+import os
+import queue
+import random
 import time
 import json
 import re
+from contextlib import contextmanager
+from datetime import timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import requests
+from selenium.common.exceptions import TimeoutException
+from http_client import get_session, _json_loads, _json_dumps
+from lxml import html as lxml_html
+from lxml.etree import ParserError
 from fake_useragent import UserAgent
 
+try:
+    import fcntl
+except ImportError:  # Windows - writes go unlocked
+    fcntl = None
+
+CHART_URL = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
+
+# Used when fake_useragent cannot produce any user agents
+_FALLBACK_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# Element whose presence means the chart legend (and its MVRV value) has rendered
+_LEGEND_SELECTOR = '[data-name="legend-source-item"]'
+
+# Elements that might contain the MVRV value, queried as one selector group
+_MVRV_SELECTORS = [
+    _LEGEND_SELECTOR,
+    '.js-legend-wrapper',
+    '[class*="legend"]',
+    '[class*="price"]',
+    '[data-testid*="price"]',
+    '.chart-markup-table',
+    '[class*="last-value"]'
+]
+_MVRV_COMBINED_SELECTOR = ', '.join(_MVRV_SELECTORS)
+
+# Returns the textContent of every element matching the selector passed as arguments[0]
+_ELEMENT_TEXTS_JS = "return [...document.querySelectorAll(arguments[0])].map(e => e.textContent);"
+
+# URL keywords marking network responses worth searching for MVRV
+_API_URL_KEYWORDS = frozenset({'chart', 'quote', 'mvrv'})
+
+# Legend/last-value nodes located in the parsed page source
+_PAGE_VALUE_XPATH = '//*[@data-name="legend-source-item"] | //*[contains(@class, "last-value")]'
+
+# Decimal numbers in scraped text
+_NUM_RE = re.compile(r'\d+\.\d+')
+
+# MVRV value patterns in the chart page source, as one alternation so the page is scanned once
+_MVRV_PAGE_RE = re.compile(
+    r'(?:"MVRV"[^}]*"value":\s*(?P<v1>\d+\.\d+))'
+    r'|(?:MVRV.*?(?P<v2>\d+\.\d+))'
+    r'|(?:"last":\s*(?P<v3>\d+\.\d+))'
+    r'|(?:"close":\s*(?P<v4>\d+\.\d+))',
+    re.IGNORECASE
+)
+
+# MVRV value patterns in text found inside API JSON payloads
+_MVRV_JSON_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'"mvrv"[^}]*?(\d+\.\d+)',
+    r'MVRV.*?(\d+\.\d+)',
+    r'"value":\s*(\d+\.\d+)',
+    r'"last":\s*(\d+\.\d+)'
+]]
+
+# JSON keys that may hold the MVRV reading, in priority order, each with the text patterns that go with it.
+# Every tier searches the whole payload before the next is tried, so an "mvrv" key anywhere beats a
+# generic "value"/"last" that happens to come first - the same order the original regex pass used.
+_MVRV_KEY_TIERS = [
+    ('mvrv', _MVRV_JSON_PATTERNS[:2]),
+    ('value', _MVRV_JSON_PATTERNS[2:3]),
+    ('last', _MVRV_JSON_PATTERNS[3:]),
+]
+
+
+def _in_range(value):
+    """value as a float if it is a number (or numeric text) in the plausible MVRV range, else None"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) if 0.1 <= value <= 10 else None
+    if isinstance(value, str) and (match := _NUM_RE.search(value)):
+        number = float(match.group())
+        return number if 0.1 <= number <= 10 else None
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            found = _in_range(item)
+            if found is not None:
+                return found
+    return None
+
+
+def _find_keyed_value(obj, key, patterns):
+    """Depth-first search of decoded JSON for an in-range value under `key`, or in text matching `patterns`"""
+    if isinstance(obj, dict):
+        for name, value in obj.items():
+            if isinstance(name, str) and name.lower() == key:
+                found = _in_range(value)
+                if found is not None:
+                    return found
+            found = _find_keyed_value(value, key, patterns)
+            if found is not None:
+                return found
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            found = _find_keyed_value(item, key, patterns)
+            if found is not None:
+                return found
+    elif isinstance(obj, str):
+        # Free text (or JSON embedded in a string) still goes through the patterns
+        for pattern in patterns:
+            for match in pattern.finditer(obj):
+                value = float(match.group(1))
+                if 0.1 <= value <= 10:  # Reasonable MVRV range
+                    return value
+    return None
+
+
+def _walk_for_mvrv(obj):
+    """Search decoded JSON for an MVRV value: any mvrv key first, then value, then last"""
+    for key, patterns in _MVRV_KEY_TIERS:
+        found = _find_keyed_value(obj, key, patterns)
+        if found is not None:
+            return found
+    return None
+
+
+class FileCache:
+    """Small JSON file cache: one file per key per day, entries expire after ttl"""
+
+    def __init__(self, cache_dir: str, ttl: timedelta):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, key: str, ts: float) -> str:
+        return os.path.join(self.cache_dir, f"{key}_{time.strftime('%Y%m%d', time.gmtime(ts))}.json")
+
+    def get(self, key: str):
+        """Return today's cached value for key, or None if missing/expired/unreadable"""
+        now = time.time()
+        try:
+            with open(self._path(key, now)) as f:
+                entry = json.load(f)
+            if now - entry['ts'] <= self.ttl.total_seconds():
+                return entry['value']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def set(self, key: str, value) -> None:
+        """Store value for key under today's file"""
+        now = time.time()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Open without truncating so the lock is held before the old entry is dropped
+            with open(self._path(key, now), 'a+') as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                f.truncate()
+                json.dump({'value': value, 'ts': now}, f)
+        except OSError as e:
+            print(f"Could not write {key} cache: {str(e)}")
+
+
+def _quit_quietly(driver) -> None:
+    """Quit a driver, ignoring errors from a browser that is already gone"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
 
 class MVRVScraper:
-    def __init__(self):
-        self.ua = UserAgent()
+    # Warm Chrome drivers shared by every scraper in the process
+    _driver_pool = queue.Queue(maxsize=2)
+
+    # Seconds to wait for the chart legend before scanning the page as loaded
+    PAGE_LOAD_TIMEOUT = 15
+    # Seconds between checks while waiting on the page or its network log
+    POLL_INTERVAL = 0.25
+
+    def __init__(self, cache_ttl: timedelta = timedelta(hours=12), cache_dir: str = '.cache', session=None):
+        # Draw the user agents up front - each UserAgent().random read is a lookup
+        try:
+            ua = UserAgent()
+            self._ua_pool = [ua.random for _ in range(20)]
+        except Exception as e:
+            print(f"fake_useragent unavailable, using a fixed user agent: {str(e)}")
+            self._ua_pool = [_FALLBACK_USER_AGENT]
+        self._cache = FileCache(cache_dir, cache_ttl)
+
+        # Plain HTTP calls go through the caller's session (default: the process-wide pooled one);
+        # TradingView headers ride per request
+        self.session = session or get_session()
+        self.headers = {
+            'User-Agent': random.choice(self._ua_pool),
+            'Referer': 'https://www.tradingview.com/',
+            'Accept': 'application/json, text/plain, */*'
+        }
+
+    def _chrome_options(self) -> Options:
+        """Headless Chrome options for loading the MVRV chart"""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument(f'--user-agent={random.choice(self._ua_pool)}')
+
+        # Enable logging to capture network requests (used by the API intercept)
+        chrome_options.add_argument('--enable-logging')
+        chrome_options.add_argument('--log-level=0')
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+        # Only the DOM and scripts matter - return at DOMContentLoaded and skip images/CSS
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2
+        })
+        return chrome_options
+
+    def _acquire_driver(self):
+        """Check a warm driver out of the pool, or start Chrome if none is available"""
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                return webdriver.Chrome(options=self._chrome_options())
+
+            try:
+                # Drop the previous page's network events - this also proves the browser is alive
+                driver.get_log('performance')
+                return driver
+            except Exception:
+                _quit_quietly(driver)
+
+    @classmethod
+    def _release_driver(cls, driver) -> None:
+        """Return a driver to the pool, or quit it when the pool is full"""
+        try:
+            cls._driver_pool.put_nowait(driver)
+        except queue.Full:
+            _quit_quietly(driver)
+
+    @classmethod
+    def _drain_pool(cls) -> None:
+        """Quit every pooled driver"""
+        while True:
+            try:
+                driver = cls._driver_pool.get_nowait()
+            except queue.Empty:
+                return
+            _quit_quietly(driver)
+
+    @contextmanager
+    def _get_driver(self):
+        """Check out a Chrome driver with performance logging and load the MVRV chart on it"""
+        driver = self._acquire_driver()
+        try:
+            # Keep response bodies available to Network.getResponseBody
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.get(CHART_URL)
+            try:
+                WebDriverWait(driver, self.PAGE_LOAD_TIMEOUT, poll_frequency=self.POLL_INTERVAL).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _LEGEND_SELECTOR))
+                )
+            except TimeoutException:
+                print(f"MVRV legend not rendered after {self.PAGE_LOAD_TIMEOUT}s, scanning page as loaded")
+            yield driver
+        except Exception:
+            # A driver that failed mid-use is not trusted for the next caller
+            _quit_quietly(driver)
+            raise
+        else:
+            self._release_driver(driver)
+
+    def _scrape_with_driver(self, extract, label: str) -> float:
+        """Run a single extraction against a warm pooled chart driver from _get_driver"""
+        try:
+            with self._get_driver() as driver:
+                return extract(driver)
+        except Exception as e:
+            print(f"Error in {label}: {str(e)}")
+            return None
 
     def scrape_mvrv_method1_selenium_wait(self) -> float:
         """Method 1: Selenium with explicit waits for dynamic content"""
-        driver = None
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument(f'--user-agent={self.ua.random}')
-
-            driver = webdriver.Chrome(options=chrome_options)
-
-            # Try the MVRV specific chart URL
-            url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
-            driver.get(url)
-
-            # Wait longer for JS to load
-            time.sleep(10)
-
-            # Try multiple selectors that might contain MVRV value
-            possible_selectors = [
-                '[data-name="legend-source-item"]',
-                '.js-legend-wrapper',
-                '[class*="legend"]',
-                '[class*="price"]',
-                '[data-testid*="price"]',
-                '.chart-markup-table',
-                '[class*="last-value"]'
-            ]
+        return self._scrape_with_driver(self._extract_via_css, "Method 1")
 
-            for selector in possible_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text
-                        if text and ('mvrv' in text.lower() or re.search(r'\d+\.\d+', text)):
-                            # Extract number from text
-                            numbers = re.findall(r'\d+\.\d+', text)
-                            if numbers:
-                                value = float(numbers[0])
-                                if 0.1 <= value <= 10:  # Reasonable MVRV range
-                                    return value
-                except Exception as e:
-                    continue
+    def scrape_mvrv_method2_api_intercept(self) -> float:
+        """Method 2: Try to intercept TradingView API calls"""
+        return self._scrape_with_driver(self._extract_via_perf_log, "Method 2")
+
+    def scrape_mvrv_method4_execute_js(self) -> float:
+        """Method 4: Execute JavaScript to get data directly"""
+        return self._scrape_with_driver(self._extract_via_js, "Method 4")
+
+    def _extract_via_css(self, driver) -> float:
+        """Read the MVRV value from the legend/price elements or the page source"""
+        try:
+            # Pull the text of every element matching any candidate selector in one round-trip
+            try:
+                texts = driver.execute_script(_ELEMENT_TEXTS_JS, _MVRV_COMBINED_SELECTOR) or []
+                for text in texts:
+                    # Only the first number in each element is the displayed value
+                    if text and (match := _NUM_RE.search(text)):
+                        value = float(match.group())
+                        if 0.1 <= value <= 10:  # Reasonable MVRV range
+                            return value
+            except Exception as e:
+                print(f"Method 1 selector lookup failed: {str(e)}")
 
             # If selectors don't work, try getting page source and parsing
             page_source = driver.page_source
 
-            # Look for MVRV patterns in page source
-            mvrv_patterns = [
-                r'"MVRV"[^}]*"value":\s*(\d+\.\d+)',
-                r'MVRV.*?(\d+\.\d+)',
-                r'"last":\s*(\d+\.\d+)',
-                r'"close":\s*(\d+\.\d+)'
-            ]
+            # Parse the HTML once and read the legend/value nodes directly
+            value = self._extract_from_page_nodes(page_source)
+            if value is not None:
+                return value
 
-            for pattern in mvrv_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                for match in matches:
-                    value = float(match)
-                    if 0.1 <= value <= 10:  # Reasonable MVRV range
-                        return value
+            # Look for MVRV patterns in page source
+            for match in _MVRV_PAGE_RE.finditer(page_source):
+                value = float(next(group for group in match.groups() if group))
+                if 0.1 <= value <= 10:  # Reasonable MVRV range
+                    return value
 
             print("Could not find MVRV value using Method 1")
             return None
@@ -85,58 +345,70 @@ class MVRVScraper:
         except Exception as e:
             print(f"Error in Method 1: {str(e)}")
             return None
-        finally:
-            if driver:
-                driver.quit()
 
-    def scrape_mvrv_method2_api_intercept(self) -> float:
-        """Method 2: Try to intercept TradingView API calls"""
-        driver = None
+    def _extract_from_page_nodes(self, page_source: str) -> float:
+        """Read the first in-range number from the legend/last-value nodes of the page HTML"""
+        try:
+            tree = lxml_html.fromstring(page_source)
+        except (ParserError, ValueError):
+            return None
+
+        for node in tree.xpath(_PAGE_VALUE_XPATH):
+            if match := _NUM_RE.search(node.text_content() or ''):
+                value = float(match.group())
+                if 0.1 <= value <= 10:  # Reasonable MVRV range
+                    return value
+        return None
+
+    def _extract_via_perf_log(self, driver) -> float:
+        """Read the chart/quote JSON responses the page received and look for MVRV in them"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-
-            # Enable logging to capture network requests
-            chrome_options.add_argument('--enable-logging')
-            chrome_options.add_argument('--log-level=0')
-            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-
-            driver = webdriver.Chrome(options=chrome_options)
-
-            url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
-            driver.get(url)
-            time.sleep(8)
-
-            # Get network logs to find API calls
-            logs = driver.get_log('performance')
-
-            for log in logs:
-                message = json.loads(log['message'])
-                if message['message']['method'] == 'Network.responseReceived':
-                    url = message['message']['params']['response']['url']
-                    if 'api' in url.lower() and ('chart' in url.lower() or 'quote' in url.lower()):
-                        # Try to fetch this API directly
-                        try:
-                            response = requests.get(url, headers={'User-Agent': self.ua.random})
-                            if response.status_code == 200:
-                                data = response.json()
+            WebDriverWait(driver, self.PAGE_LOAD_TIMEOUT, poll_frequency=self.POLL_INTERVAL).until(
+                EC.url_contains('tradingview')
+            )
+
+            # Each read drains the log, so keep reading until the page's network goes quiet
+            deadline = time.monotonic() + self.PAGE_LOAD_TIMEOUT
+            seen_traffic = False
+            while time.monotonic() < deadline:
+                logs = driver.get_log('performance')
+                if not logs:
+                    if seen_traffic:
+                        break
+                    time.sleep(self.POLL_INTERVAL)
+                    continue
+                seen_traffic = True
+
+                for log in logs:
+                    # Most entries are other network events - skip them before decoding
+                    raw = log['message']
+                    if '"Network.responseReceived"' not in raw:
+                        continue
+                    message = _json_loads(raw)
+                    if message['message']['method'] == 'Network.responseReceived':
+                        params = message['message']['params']
+                        response = params['response']
+                        url = response['url'].lower()
+                        if 'json' in response.get('mimeType', '') and any(k in url for k in _API_URL_KEYWORDS):
+                            # Read the payload Chrome already received instead of fetching it again
+                            try:
+                                body = driver.execute_cdp_cmd('Network.getResponseBody',
+                                                              {'requestId': params['requestId']})
+                                payload = body['body']
+                                if body.get('base64Encoded'):
+                                    payload = base64.b64decode(payload)
                                 # Parse the JSON for MVRV data
-                                mvrv_value = self._extract_mvrv_from_json(data)
+                                mvrv_value = self._extract_mvrv_from_json(_json_loads(payload))
                                 if mvrv_value:
                                     return mvrv_value
-                        except:
-                            continue
+                            except Exception:
+                                continue
 
             return None
 
         except Exception as e:
             print(f"Error in Method 2: {str(e)}")
             return None
-        finally:
-            if driver:
-                driver.quit()
 
     def scrape_mvrv_method3_direct_api(self) -> float:
         """Method 3: Try common TradingView API endpoints"""
@@ -148,13 +420,6 @@ class MVRVScraper:
                 'https://pine-facade.tradingview.com/pine-facade/translate/'
             ]
 
-            headers = {
-                'User-Agent': self.ua.random,
-                'Referer': 'https://www.tradingview.com/',
-                'Accept': 'application/json, text/plain, */*',
-                'Content-Type': 'application/json'
-            }
-
             # Try scanner API with MVRV query
             scanner_payload = {
                 "filter": [{"left": "name", "operation": "match", "right": "BTC"}],
@@ -166,13 +431,13 @@ class MVRVScraper:
                 "range": [0, 50]
             }
 
-            response = requests.post(api_urls[0],
-                                     json=scanner_payload,
-                                     headers=headers,
-                                     timeout=10)
+            response = self.session.post(api_urls[0],
+                                         data=_json_dumps(scanner_payload),
+                                         headers={**self.headers, 'Content-Type': 'application/json'},
+                                         timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 # Parse for any MVRV-related data
                 mvrv_value = self._extract_mvrv_from_json(data)
                 if mvrv_value:
@@ -184,21 +449,16 @@ class MVRVScraper:
             print(f"Error in Method 3: {str(e)}")
             return None
 
-    def scrape_mvrv_method4_execute_js(self) -> float:
-        """Method 4: Execute JavaScript to get data directly"""
-        driver = None
+    def _extract_via_js(self, driver) -> float:
+        """Run a set of JavaScript probes against the page and parse what they return"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument(f'--user-agent={self.ua.random}')
-
-            driver = webdriver.Chrome(options=chrome_options)
-
-            url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
-            driver.get(url)
-            time.sleep(12)  # Wait for full load
+            # The probes read page-wide objects, so let the document finish loading first
+            try:
+                WebDriverWait(driver, self.PAGE_LOAD_TIMEOUT, poll_frequency=self.POLL_INTERVAL).until(
+                    lambda d: d.execute_script('return document.readyState') == 'complete'
+                )
+            except TimeoutException:
+                pass
 
             # Try different JavaScript approaches to extract data
             js_commands = [
@@ -218,21 +478,14 @@ class MVRVScraper:
                 try:
                     result = driver.execute_script(js_cmd)
                     if result:
-
-                        if isinstance(result, (list, tuple)):
-                            for item in result:
-                                if isinstance(item, str):
-                                    numbers = re.findall(r'\d+\.\d+', item)
-                                    for num_str in numbers:
-                                        num = float(num_str)
-                                        if 0.1 <= num <= 10:  # MVRV range
-                                            return num
-                        elif isinstance(result, str):
-                            numbers = re.findall(r'\d+\.\d+', result)
-                            for num_str in numbers:
-                                num = float(num_str)
-                                if 0.1 <= num <= 10:
-                                    return num
+                        items = result if isinstance(result, (list, tuple)) else [result]
+                        for item in items:
+                            if isinstance(item, str):
+                                # Probe texts mix prices and ratios, so walk the numbers lazily
+                                for match in _NUM_RE.finditer(item):
+                                    num = float(match.group())
+                                    if 0.1 <= num <= 10:  # MVRV range
+                                        return num
                 except Exception as e:
                     continue
 
@@ -241,44 +494,16 @@ class MVRVScraper:
         except Exception as e:
             print(f"Error in Method 4: {str(e)}")
             return None
-        finally:
-            if driver:
-                driver.quit()
 
     def _extract_mvrv_from_json(self, data) -> float:
         """Helper to extract MVRV value from JSON data"""
         if not data:
             return None
 
-        # Convert to string and search for patterns
-        data_str = json.dumps(data) if isinstance(data, dict) else str(data)
-
-        # Look for MVRV patterns
-        patterns = [
-            r'"mvrv"[^}]*?(\d+\.\d+)',
-            r'MVRV.*?(\d+\.\d+)',
-            r'"value":\s*(\d+\.\d+)',
-            r'"last":\s*(\d+\.\d+)'
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, data_str, re.IGNORECASE)
-            for match in matches:
-                value = float(match)
-                if 0.1 <= value <= 10:  # Reasonable MVRV range
-                    return value
-
-        return None
-
-    def get_mvrv_value(self, verbose=False) -> float:
-        """Try all methods to get MVRV value"""
-        methods = [
-            ("Selenium with Wait", self.scrape_mvrv_method1_selenium_wait),
-            ("API Intercept", self.scrape_mvrv_method2_api_intercept),
-            ("Direct API", self.scrape_mvrv_method3_direct_api),
-            ("JavaScript Execution", self.scrape_mvrv_method4_execute_js)
-        ]
+        return _walk_for_mvrv(data)
 
+    def _try_methods_in_order(self, methods, verbose=False):
+        """Run methods one after another and return the first value found"""
         for method_name, method_func in methods:
             if verbose:
                 print(f"\nTrying {method_name}...")
@@ -294,11 +519,52 @@ class MVRVScraper:
                 if verbose:
                     print(f"❌ {method_name} failed: {str(e)}")
 
+        return None
+
+    def _scrape_browser_methods(self, verbose=False) -> float:
+        """Load the chart once and run every browser-based extraction against that page"""
+        try:
+            with self._get_driver() as driver:
+                return self._try_methods_in_order([
+                    ("Selenium with Wait", lambda: self._extract_via_css(driver)),
+                    ("API Intercept", lambda: self._extract_via_perf_log(driver)),
+                    ("JavaScript Execution", lambda: self._extract_via_js(driver))
+                ], verbose)
+        except Exception as e:
+            if verbose:
+                print(f"❌ Could not load the MVRV chart: {str(e)}")
+            return None
+
+    def get_mvrv_value(self, verbose=False) -> float:
+        """Try all methods to get MVRV value - a value scraped earlier today is reused"""
+        cached = self._cache.get("mvrv")
+        if cached is not None:
+            if verbose:
+                print(f"✅ Using cached MVRV = {cached}")
+            return cached
+
+        # HTTP-only methods cost well under a second, so only start Chrome when they miss
+        http_methods = [
+            ("Direct API", self.scrape_mvrv_method3_direct_api)
+        ]
+
+        result = self._try_methods_in_order(http_methods, verbose)
+        if result is None:
+            result = self._scrape_browser_methods(verbose)
+
+        if result is not None:
+            self._cache.set("mvrv", result)
+            return result
+
         if verbose:
             print("\n⚠️ All methods failed, returning fallback value")
         return 2.1  # Fallback value
 
 
+# Quit pooled browsers when the process exits
+atexit.register(MVRVScraper._drain_pool)
+
+
 # Test the scraper
 if __name__ == "__main__":
     scraper = MVRVScraper()
@@ -7,9 +7,13 @@ import numpy as np
 from datetime import datetime, timezone, timedelta
 import logging
 from typing import Dict, Optional, List, Any
-import requests
 import json
 
+from http_client import get_session, _json_loads
+
+# Daily X:BTCUSD bars between two YYYY-MM-DD dates
+DAILY_BARS_URL = "https://api.polygon.io/v2/aggs/ticker/X:BTCUSD/range/1/day/{start}/{end}"
+
 
 class PiCycleTopIndicator:
     """
@@ -32,8 +36,12 @@ class PiCycleTopIndicator:
     - Robust error handling
     """
 
-    def __init__(self, polygon_api_key: str = None):
+    def __init__(self, polygon_api_key: str = None, session=None, http_get=None):
         self.polygon_api_key = polygon_api_key
+        # Shares the caller's warm Polygon connections; standalone use gets the process-wide pooled session
+        self.session = session or get_session()
+        # The collector passes its rate-limited Polygon getter so this request shares its limiter and 429 retries
+        self._http_get = http_get or self.session.get
         self.ma_111_period = 111
         self.ma_350_period = 350
         self.multiplier = 2
@@ -49,7 +57,7 @@ class PiCycleTopIndicator:
             price_data = self._get_historical_btc_prices()
 
             if not price_data or len(price_data) < self.ma_350_period:
-                logging.warning(f"⚠️ Insufficient data for Pi Cycle: {len(price_data) if price_data else 0} days")
+                logging.warning("⚠️ Insufficient data for Pi Cycle: %s days", len(price_data) if price_data else 0)
                 return self._get_fallback_analysis(current_btc_price)
 
             # Calculate analysis
@@ -58,11 +66,11 @@ class PiCycleTopIndicator:
             # CRITICAL: Convert all numpy types to Python types
             safe_analysis = self._ensure_json_serializable(analysis)
 
-            logging.info(f"✅ Pi Cycle analysis complete: {safe_analysis['signal_status']['proximity_level']}")
+            logging.info("✅ Pi Cycle analysis complete: %s", safe_analysis['signal_status']['proximity_level'])
             return safe_analysis
 
         except Exception as e:
-            logging.error(f"❌ Error in Pi Cycle analysis: {str(e)}")
+            logging.error("❌ Error in Pi Cycle analysis: %s", e)
             return self._get_fallback_analysis(current_btc_price, error=str(e))
 
     def _get_historical_btc_prices(self) -> List[float]:
@@ -75,23 +83,25 @@ class PiCycleTopIndicator:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=420)
 
-            url = f"https://api.polygon.io/v2/aggs/ticker/X:BTCUSD/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
+            url = DAILY_BARS_URL.format(start=start_date.strftime('%Y-%m-%d'), end=end_date.strftime('%Y-%m-%d'))
 
-            response = requests.get(url, params={'apikey': self.polygon_api_key}, timeout=15)
+            # Oldest-first, capped just above the 420-day window so the rolling means see every bar once
+            response = self._http_get(url, params={'apikey': self.polygon_api_key, 'sort': 'asc', 'limit': 430},
+                                      timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
 
             if data.get('status') in ['OK', 'DELAYED'] and 'results' in data:
                 prices = [float(bar['c']) for bar in data['results']]  # Ensure Python float
-                logging.info(f"📊 Retrieved {len(prices)} days of BTC price data")
+                logging.info("📊 Retrieved %s days of BTC price data", len(prices))
                 return prices
             else:
                 logging.warning("Polygon API returned no results")
                 return []
 
         except Exception as e:
-            logging.error(f"Error fetching prices: {str(e)}")
+            logging.error("Error fetching prices: %s", e)
             return []
 
     def _calculate_pi_cycle_analysis(self, price_data: List[float], current_btc_price: float = None) -> Dict:
@@ -149,7 +159,7 @@ class PiCycleTopIndicator:
             return result
 
         except Exception as e:
-            logging.error(f"Error calculating Pi Cycle: {str(e)}")
+            logging.error("Error calculating Pi Cycle: %s", e)
             raise
 
     def _determine_signal_status(self, ma_111: float, ma_350_x2: float,
@@ -279,7 +289,7 @@ class PiCycleTopIndicator:
             }
 
         except Exception as e:
-            logging.error(f"Error analyzing trend: {str(e)}")
+            logging.error("Error analyzing trend: %s", e)
             return {
                 'trend': 'error',
                 'trend_description': 'Unable to determine trend',
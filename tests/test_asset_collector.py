@@ -18,11 +18,12 @@ All external dependencies are mocked - no real API calls are made.
 
 import pytest
 import unittest.mock as mock
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, patch, MagicMock, call, PropertyMock
 import pandas as pd
 from datetime import datetime, timezone, timedelta
 import json
 import os
+import time
 import sys
 import logging
 
@@ -37,8 +38,42 @@ from asset_data_collector import (
     HybridBTCCollector,
     HybridAssetDataCollector,
     UpdatedAssetDataCollector,
-    EnhancedPolygonBTCCollector
+    EnhancedPolygonBTCCollector,
+    TokenBucket,
+    _get_btc_collector
 )
+from http_client import get_session
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def json_response(payload=None, status_code=200):
+    """Mock HTTP response whose .content is the JSON encoding of whatever .json() returns"""
+    response = Mock(status_code=status_code)
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload
+    type(response).content = PropertyMock(side_effect=lambda: json.dumps(response.json()).encode())
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_btc_collector_singleton():
+    """Each test builds its own (possibly patched) BTC collector instead of reusing the cached one"""
+    _get_btc_collector.cache_clear()
+    yield
+    _get_btc_collector.cache_clear()
+
+
+@pytest.fixture
+def fake_clock():
+    """Virtual clock: time.sleep advances time.monotonic instantly, so rate limiters never really wait"""
+    clock = [1000.0]
+
+    def advance(seconds):
+        clock[0] += seconds
+
+    with patch('asset_data_collector.time.monotonic', side_effect=lambda: clock[0]), \
+            patch('asset_data_collector.time.sleep', side_effect=advance) as mock_sleep:
+        yield mock_sleep
 
 
 class TestHybridBTCCollector:
@@ -51,14 +86,14 @@ class TestHybridBTCCollector:
             yield
 
     @pytest.fixture
-    def collector(self, mock_env_vars):
+    def collector(self, mock_env_vars, tmp_path):
         """Create a HybridBTCCollector instance for testing"""
         with patch('asset_data_collector.MVRVScraper') as mock_mvrv:
             mock_mvrv_instance = Mock()
             mock_mvrv_instance.get_mvrv_value.return_value = 2.1
             mock_mvrv.return_value = mock_mvrv_instance
 
-            collector = HybridBTCCollector(api_key='test_api_key_123')
+            collector = HybridBTCCollector(api_key='test_api_key_123', cache_dir=str(tmp_path))
             return collector
 
     @pytest.fixture
@@ -83,6 +118,42 @@ class TestHybridBTCCollector:
             assert collector.session is not None
             assert 'User-Agent' in collector.session.headers
 
+    def test_collectors_share_pooled_session(self, mock_env_vars):
+        """Test every collector reuses one keep-alive session with pooled adapters"""
+        with patch('asset_data_collector.MVRVScraper'):
+            first = HybridBTCCollector()
+            second = HybridBTCCollector()
+
+        assert first.session is second.session is get_session()
+
+    def test_collaborators_share_collector_session(self, mock_env_vars, tmp_path):
+        """Test the MVRV scraper and Pi Cycle indicator are handed the collector's session"""
+        session = Mock()
+        with patch('asset_data_collector.get_session', return_value=session), \
+                patch('asset_data_collector.MVRVScraper') as mock_mvrv:
+            collector = HybridBTCCollector(cache_dir=str(tmp_path))
+
+        mock_mvrv.assert_called_once_with(session=session)
+        assert collector.pi_cycle_indicator.session is session
+
+    @patch('asset_data_collector.random.uniform', return_value=0)
+    def test_pi_cycle_request_is_rate_limited(self, mock_uniform, mock_env_vars, tmp_path):
+        """Test the Pi Cycle Polygon request goes through the collector's limiter and retries a 429"""
+        throttled = Mock(status_code=429, headers={})
+        ok = Mock(status_code=200, content=b'{"status": "OK", "results": [{"c": 1.5}, {"c": 2.5}]}')
+        session = Mock()
+        session.get.side_effect = [throttled, ok]
+        with patch('asset_data_collector.get_session', return_value=session), \
+                patch('asset_data_collector.MVRVScraper'):
+            collector = HybridBTCCollector(cache_dir=str(tmp_path))
+        collector._polygon_limiter = Mock(wraps=collector._polygon_limiter)
+
+        prices = collector.pi_cycle_indicator._get_historical_btc_prices()
+
+        assert prices == [1.5, 2.5]
+        assert session.get.call_count == 2
+        assert collector._polygon_limiter.acquire.call_count == 2
+
     def test_initialization_from_env_var(self, mock_env_vars):
         """Test initialization using environment variable"""
         with patch('asset_data_collector.MVRVScraper'):
@@ -122,10 +193,70 @@ class TestHybridBTCCollector:
             assert result['mvrv'] == 2.1
             assert 'timestamp' in result
 
+    def test_get_btc_data_fetches_concurrently(self, collector):
+        """Test price, EMA, RSI and MVRV fetches overlap instead of running back to back"""
+        import threading
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def rendezvous(value):
+            def fetch(*args, **kwargs):
+                barrier.wait()  # Breaks (and fails the test) unless all four run at once
+                return value
+            return fetch
+
+        price_result = {'price': 95000.0, 'source': 'coingecko', 'note': 'live', 'method': 'live_api'}
+
+        with patch.object(collector, 'get_live_btc_price_with_fallback', side_effect=rendezvous(price_result)), \
+                patch.object(collector, 'get_daily_ema_200', side_effect=rendezvous(90000.0)), \
+                patch.object(collector, 'get_weekly_rsi', side_effect=rendezvous(65.5)), \
+                patch.object(collector.mvrv_scraper, 'get_mvrv_value', side_effect=rendezvous(2.1)), \
+                patch.object(collector.pi_cycle_indicator, 'get_pi_cycle_analysis', return_value={'success': False}), \
+                patch.object(collector, 'get_mining_cost_data', return_value={'mining_cost': 'N/A'}), \
+                patch('asset_data_collector.time.sleep') as mock_sleep:
+            result = collector.get_btc_data()
+
+        assert result['success'] is True
+        assert result['ema_200'] == 90000.0
+        assert result['weekly_rsi'] == 65.5
+        assert result['mvrv'] == 2.1
+        mock_sleep.assert_not_called()
+
+    def test_get_btc_data_overlaps_browser_scrapes(self, collector):
+        """Test the MVRV and mining cost scrapes run at the same time and Pi Cycle gets the live price"""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def scrape(value):
+            def run(*args, **kwargs):
+                barrier.wait()  # Breaks unless both browser scrapes are in flight together
+                return value
+            return run
+
+        price_result = {'price': 95000.0, 'source': 'coingecko', 'note': 'live', 'method': 'live_api'}
+
+        with patch.object(collector, 'get_live_btc_price_with_fallback', return_value=price_result), \
+                patch.object(collector, 'get_daily_ema_200', return_value=90000.0), \
+                patch.object(collector, 'get_weekly_rsi', return_value=65.5), \
+                patch.object(collector.mvrv_scraper, 'get_mvrv_value', side_effect=scrape(2.1)), \
+                patch.object(collector, 'get_mining_cost_data',
+                             side_effect=scrape({'success': True, 'mining_cost': 70000.0, 'data_date': 'CCAF Data'})), \
+                patch.object(collector.pi_cycle_indicator, 'get_pi_cycle_analysis',
+                             return_value={'success': False}) as mock_pi_cycle:
+            result = collector.get_btc_data()
+
+        assert result['success'] is True
+        assert result['mvrv'] == 2.1
+        assert result['mining_cost'] == 70000.0
+        mock_pi_cycle.assert_called_once_with(current_btc_price=95000.0)
+
     def test_get_btc_data_error_handling(self, collector):
         """Test error handling in get_btc_data"""
         with patch.object(collector, 'get_live_btc_price_with_fallback',
-                          side_effect=Exception("Network error")):
+                          side_effect=Exception("Network error")), \
+                patch.object(collector, 'get_daily_ema_200', return_value=90000.0), \
+                patch.object(collector, 'get_weekly_rsi', return_value=65.5):
             result = collector.get_btc_data()
 
             assert result['success'] is False
@@ -133,11 +264,11 @@ class TestHybridBTCCollector:
             assert 'Network error' in result['error']
             assert 'timestamp' in result
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
     def test_get_live_btc_price_coingecko_success(self, mock_get, collector):
         """Test successful CoinGecko price collection"""
         # Mock successful CoinGecko response
-        mock_response = Mock()
+        mock_response = json_response()
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {
@@ -155,17 +286,45 @@ class TestHybridBTCCollector:
         assert 'LIVE PRICE' in result['note'] or 'RECENT PRICE' in result['note']
         assert result['method'] == 'live_api'
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
+    def test_live_price_reused_within_ttl(self, mock_get, collector, tmp_path):
+        """Test a fresh CoinGecko quote is shared by the next collector instead of refetched"""
+        mock_get.return_value = json_response({'bitcoin': {'usd': 95000.0}})
+
+        first = collector.get_live_btc_price_with_fallback()
+        second = HybridBTCCollector(api_key='test_key', cache_dir=str(tmp_path)).get_live_btc_price_with_fallback()
+
+        assert first['price'] == second['price'] == 95000.0
+        assert second['source'] == 'coingecko'
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_live_price_refetched_after_ttl(self, mock_get, collector):
+        """Test an expired quote triggers a new CoinGecko call"""
+        mock_get.side_effect = [json_response({'bitcoin': {'usd': 95000.0}}),
+                                json_response({'bitcoin': {'usd': 96000.0}})]
+
+        collector.get_live_btc_price_with_fallback()
+        with patch('mvrv_scraper.time.time', return_value=time.time() + 46):
+            result = collector.get_live_btc_price_with_fallback()
+
+        assert result['price'] == 96000.0
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
     def test_get_live_btc_price_fallback_to_polygon(self, mock_get, collector):
         """Test fallback to Polygon when CoinGecko fails"""
         # First call (CoinGecko) fails
         mock_get.side_effect = [
             Exception("CoinGecko failed"),
-            # Second call (Polygon yesterday) succeeds
-            Mock(status_code=200, json=lambda: {'status': 'OK', 'close': 94000.0})
+            # Second call (Polygon closes for the last two days, newest first) succeeds
+            json_response({'status': 'OK', 'results': [
+                {'t': int(datetime(2024, 1, 14, tzinfo=timezone.utc).timestamp() * 1000), 'c': 94000.0},
+                {'t': int(datetime(2024, 1, 13, tzinfo=timezone.utc).timestamp() * 1000), 'c': 93000.0},
+            ]})
         ]
 
-        with patch('asset_data_collector.datetime') as mock_datetime:
+        with patch('asset_data_collector.datetime', wraps=datetime) as mock_datetime:
             # Mock yesterday's date
             mock_now = datetime(2024, 1, 15, 12, 0, 0)
             mock_datetime.now.return_value = mock_now
@@ -176,8 +335,35 @@ class TestHybridBTCCollector:
             assert result['source'] == 'polygon_yesterday'
             assert 'YESTERDAY CLOSE' in result['note']
             assert result['method'] == 'historical_fallback'
+            assert result['date'] == '2024-01-14'
+
+        # Both fallback days come from one aggregates request
+        assert mock_get.call_count == 2
+        assert '/range/1/day/2024-01-13/2024-01-14' in mock_get.call_args[0][0]
+        assert mock_get.call_args[1]['params']['sort'] == 'desc'
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
+    def test_get_live_btc_price_fallback_to_two_day_old_close(self, mock_get, collector):
+        """Test the 2-day old close is used when Polygon has no bar for yesterday yet"""
+        mock_get.side_effect = [
+            Exception("CoinGecko failed"),
+            json_response({'status': 'OK', 'results': [
+                {'t': int(datetime(2024, 1, 13, tzinfo=timezone.utc).timestamp() * 1000), 'c': 93000.0},
+            ]})
+        ]
+
+        with patch('asset_data_collector.datetime', wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 15, 12, 0, 0)
+
+            result = collector.get_live_btc_price_with_fallback()
+
+        assert result['price'] == 93000.0
+        assert result['source'] == 'polygon_2day_old'
+        assert result['method'] == 'stale_fallback'
+        assert result['date'] == '2024-01-13'
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
     def test_get_live_btc_price_all_methods_fail(self, mock_get, collector):
         """Test when all price collection methods fail"""
         mock_get.side_effect = Exception("All methods failed")
@@ -185,10 +371,10 @@ class TestHybridBTCCollector:
         with pytest.raises(Exception, match="Could not get BTC price from any source"):
             collector.get_live_btc_price_with_fallback()
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
     def test_get_daily_ema_200_success(self, mock_get, collector, sample_polygon_response):
         """Test successful EMA 200 calculation"""
-        mock_response = Mock()
+        mock_response = json_response()
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = sample_polygon_response
@@ -206,10 +392,81 @@ class TestHybridBTCCollector:
         # EMA should be somewhere in the range of our data
         assert 85000 < result < 120000
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
+    def test_aggregate_requests_ask_for_ascending_bounded_bars(self, mock_get, collector):
+        """Test EMA and RSI requests pin bar order and cap the bar count"""
+        mock_get.return_value = json_response({
+            'status': 'OK',
+            'results': [{'c': 90000.0 + i * 100} for i in range(250)]
+        })
+
+        collector.get_daily_ema_200()
+        collector.get_weekly_rsi()
+
+        daily_params, weekly_params = (c.kwargs['params'] for c in mock_get.call_args_list)
+        assert daily_params['sort'] == weekly_params['sort'] == 'asc'
+        assert daily_params['limit'] >= 450
+        assert weekly_params['limit'] >= 800 // 7
+
+    @staticmethod
+    def _daily_bars(count, first_day=datetime(2024, 1, 1, tzinfo=timezone.utc), step=timedelta(days=1)):
+        return [{'c': 90000.0 + 37 * (i % 11) + i * 50, 't': int((first_day + i * step).timestamp() * 1000)}
+                for i in range(count)]
+
+    def test_get_daily_ema_200_updates_incrementally(self, collector):
+        """Test a later run only requests bars after the saved state and matches a full recompute"""
+        bars = self._daily_bars(452)
+
+        with patch.object(collector, '_polygon_get', return_value=json_response({'status': 'OK', 'results': bars[:450]})), \
+                patch('asset_data_collector.datetime', wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 3, 28)
+            collector.get_daily_ema_200()
+
+        with patch.object(collector._cache, 'get', return_value=None), \
+                patch.object(collector, '_polygon_get',
+                             return_value=json_response({'status': 'OK', 'results': bars[449:]})) as mock_get, \
+                patch('asset_data_collector.datetime', wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 3, 30)
+            result = collector.get_daily_ema_200()
+
+        # Fetch starts at the last bar already folded into the state
+        assert '/range/1/day/2025-03-25/' in mock_get.call_args[0][0]
+        assert result == pytest.approx(collector.calculate_ema([bar['c'] for bar in bars], 200), rel=1e-12)
+
+    def test_get_weekly_rsi_updates_incrementally(self, collector):
+        """Test weekly RSI continues Wilder's smoothing from the saved state"""
+        bars = self._daily_bars(116, step=timedelta(weeks=1))
+        # 2024-01-01 + 115 weeks, plus the 7-day lag get_weekly_rsi applies
+        today = datetime(2026, 3, 16) + timedelta(days=8)
+
+        with patch.object(collector, '_polygon_get', return_value=json_response({'status': 'OK', 'results': bars[:114]})), \
+                patch('asset_data_collector.datetime', wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = today - timedelta(weeks=2)
+            collector.get_weekly_rsi()
+
+        with patch.object(collector._cache, 'get', return_value=None), \
+                patch.object(collector, '_polygon_get',
+                             return_value=json_response({'status': 'OK', 'results': bars[113:]})) as mock_get, \
+                patch('asset_data_collector.datetime', wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = today
+            result = collector.get_weekly_rsi()
+
+        assert '/range/1/week/2026-03-02/' in mock_get.call_args[0][0]
+        assert result == pytest.approx(collector.calculate_rsi([bar['c'] for bar in bars], 14), rel=1e-12)
+
+    def test_stale_indicator_state_triggers_full_fetch(self, collector):
+        """Test state older than the allowed gap is ignored"""
+        old_bars = self._daily_bars(250, first_day=datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+        with patch.object(collector, '_polygon_get', return_value=json_response({'status': 'OK', 'results': old_bars})):
+            collector.get_daily_ema_200()
+
+        assert collector._load_indicator_state('ema_200', timedelta(days=30), datetime.now()) is None
+
+    @patch('requests.Session.get')
     def test_get_daily_ema_200_insufficient_data(self, mock_get, collector):
         """Test EMA calculation with insufficient data"""
-        mock_response = Mock()
+        mock_response = json_response()
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {
@@ -221,11 +478,40 @@ class TestHybridBTCCollector:
         with pytest.raises(Exception, match="Insufficient data for EMA200"):
             collector.get_daily_ema_200()
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
+    def test_get_daily_ema_200_served_from_cache(self, mock_get, collector):
+        """Test a second EMA200 lookup on the same day skips the Polygon request"""
+        mock_response = json_response()
+        mock_response.status_code = 200
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {
+            'status': 'OK',
+            'results': [{'c': 90000.0 + i * 100} for i in range(250)]
+        }
+        mock_get.return_value = mock_response
+
+        first = collector.get_daily_ema_200()
+        second = collector.get_daily_ema_200()
+
+        assert second == first
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_polygon_close_served_from_cache(self, mock_get, collector):
+        """Test historical closes are fetched once and then read from the cache"""
+        mock_get.return_value = json_response({'status': 'OK', 'results': [
+            {'t': int(datetime(2024, 1, 14, tzinfo=timezone.utc).timestamp() * 1000), 'c': 94000.0},
+        ]})
+
+        assert collector._get_latest_polygon_close('2024-01-14', '2024-01-13') == ('2024-01-14', 94000.0)
+        assert collector._get_latest_polygon_close('2024-01-14', '2024-01-13') == ('2024-01-14', 94000.0)
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
     def test_get_weekly_rsi_success(self, mock_get, collector):
         """Test successful weekly RSI calculation"""
         # Create mock data with price trend for RSI calculation
-        mock_response = Mock()
+        mock_response = json_response()
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
 
@@ -287,6 +573,33 @@ class TestHybridBTCCollector:
         # With our upward trend, RSI should be > 50
         assert result > 40
 
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_calculate_ema_matches_pandas_ewm(self, collector, seed):
+        """Test the NumPy EMA matches pandas ewm(span, adjust=False)"""
+        import numpy as np
+        prices = (90000 + np.random.default_rng(seed).normal(0, 1500, 450).cumsum()).tolist()
+
+        expected = pd.Series(prices).ewm(span=200, adjust=False).mean().iloc[-1]
+
+        assert collector.calculate_ema(prices, 200) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_calculate_rsi_matches_pandas_wilder(self, collector, seed):
+        """Test the NumPy RSI matches the pandas Wilder's smoothing it replaced"""
+        import numpy as np
+        prices = (90000 + np.random.default_rng(seed).normal(0, 3000, 115).cumsum()).tolist()
+
+        delta = pd.Series(prices).diff().dropna()
+        avg_gain = delta.where(delta > 0, 0).ewm(alpha=1 / 14, adjust=False).mean()
+        avg_loss = (-delta.where(delta < 0, 0)).ewm(alpha=1 / 14, adjust=False).mean()
+        expected = (100 - 100 / (1 + avg_gain / avg_loss)).iloc[-1]
+
+        assert collector.calculate_rsi(prices, 14) == pytest.approx(expected, rel=1e-12)
+
+    def test_calculate_rsi_only_gains(self, collector):
+        """Test a strictly rising series has RSI 100 rather than dividing by zero"""
+        assert collector.calculate_rsi(list(range(100, 130)), 14) == 100.0
+
     def test_calculate_rsi_insufficient_data(self, collector):
         """Test RSI calculation with insufficient data"""
         prices = [100, 102, 104]  # Only 3 prices, need 15+ for period=14
@@ -294,10 +607,48 @@ class TestHybridBTCCollector:
         with pytest.raises(ValueError, match="Not enough data points for RSI"):
             collector.calculate_rsi(prices, 14)
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
+    def test_polygon_request_retries_after_429(self, mock_get, collector, fake_clock):
+        """Test a 429 from Polygon backs off for Retry-After and retries"""
+        throttled = Mock(status_code=429, headers={'Retry-After': '7'})
+        ok = json_response()
+        ok.raise_for_status.return_value = None
+        ok.json.return_value = {'status': 'OK'}
+        mock_get.side_effect = [throttled, ok]
+
+        assert collector.test_api_connection() is True
+        assert mock_get.call_count == 2
+        # Honors Retry-After at minimum; the drained bucket may add refill time on top
+        assert sum(c[0][0] for c in fake_clock.call_args_list) >= 7
+
+    @patch('asset_data_collector.random.uniform', return_value=1.5)
+    @patch('requests.Session.get')
+    def test_polygon_request_jitters_backoff_without_retry_after(self, mock_get, mock_uniform, collector):
+        """Test a 429 without Retry-After backs off by a full-jitter exponential delay"""
+        throttled = Mock(status_code=429, headers={})
+        ok = json_response({'status': 'OK'})
+        mock_get.side_effect = [throttled, throttled, ok]
+
+        with patch.object(collector._polygon_limiter, 'block_for') as block_for:
+            assert collector.test_api_connection() is True
+
+        assert mock_uniform.call_args_list == [call(0, 1), call(0, 2)]
+        assert block_for.call_args_list == [call(1.5), call(1.5)]
+
+    @patch('requests.Session.get')
+    def test_polygon_request_gives_up_after_max_retries(self, mock_get, collector, fake_clock):
+        """Test persistent 429s are returned to the caller after the retry budget"""
+        throttled = Mock(status_code=429, headers={'Retry-After': '0'})
+        throttled.raise_for_status.side_effect = Exception("429 Too Many Requests")
+        mock_get.return_value = throttled
+
+        assert collector.test_api_connection() is False
+        assert mock_get.call_count == 4
+
+    @patch('requests.Session.get')
     def test_api_connection_test_success(self, mock_get, collector):
         """Test successful API connection test"""
-        mock_response = Mock()
+        mock_response = json_response()
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {'status': 'OK'}
@@ -307,7 +658,16 @@ class TestHybridBTCCollector:
 
         assert result is True
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
+    def test_polygon_requests_have_timeout(self, mock_get, collector):
+        """Test Polygon calls can't hang on a stalled connection"""
+        mock_get.return_value = json_response({'status': 'OK'})
+
+        collector.test_api_connection()
+
+        assert mock_get.call_args.kwargs['timeout'] == (5, 10)
+
+    @patch('requests.Session.get')
     def test_api_connection_test_failure(self, mock_get, collector):
         """Test API connection test failure"""
         mock_get.side_effect = Exception("Connection failed")
@@ -316,10 +676,10 @@ class TestHybridBTCCollector:
 
         assert result is False
 
-    @patch('asset_data_collector.requests.Session.get')
+    @patch('requests.Session.get')
     def test_coingecko_connection_test_success(self, mock_get, collector):
         """Test successful CoinGecko connection test"""
-        mock_response = Mock()
+        mock_response = json_response()
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {
@@ -331,7 +691,31 @@ class TestHybridBTCCollector:
 
         assert result is True
 
-    @patch('asset_data_collector.requests.Session.get')
+    def test_check_connections_probes_concurrently(self, collector):
+        """Test both API probes run at the same time"""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def probe():
+            barrier.wait()  # Breaks unless both probes are in flight together
+            return True
+
+        with patch.object(collector, 'test_api_connection', side_effect=probe), \
+                patch.object(collector, 'test_coingecko_connection', side_effect=probe):
+            assert collector.check_connections() == {'polygon': True, 'coingecko': True}
+
+    def test_check_connections_reuses_recent_result(self, collector):
+        """Test a fresh result is reused and a stale one triggers new probes"""
+        with patch.object(collector, 'test_api_connection', return_value=True) as polygon, \
+                patch.object(collector, 'test_coingecko_connection', return_value=False):
+            collector.check_connections()
+            collector.check_connections()
+            assert polygon.call_count == 1
+
+            collector.check_connections(max_age=0)
+            assert polygon.call_count == 2
+
+    @patch('requests.Session.get')
     def test_coingecko_connection_test_failure(self, mock_get, collector):
         """Test CoinGecko connection test failure"""
         mock_get.side_effect = Exception("Connection failed")
@@ -340,6 +724,145 @@ class TestHybridBTCCollector:
 
         assert result is False
 
+    @pytest.fixture
+    def ccaf_chrome(self):
+        """Patched Chrome whose mining cost element reads $85,000, with the shared driver reset around the test"""
+        HybridBTCCollector._ccaf_driver = None
+        element = Mock(text='$85,000')
+        with patch('asset_data_collector.webdriver.Chrome') as chrome, \
+                patch('asset_data_collector.WebDriverWait') as wait:
+            wait.return_value.until.return_value = element
+            yield chrome
+        HybridBTCCollector._ccaf_driver = None
+
+    def test_mining_cost_waits_for_rendered_value(self, collector, ccaf_chrome):
+        """Test an element that is present but still empty is polled until its number renders"""
+        element = Mock()
+        type(element).text = PropertyMock(side_effect=['', '—', '$85,000', '$85,000'])
+        ccaf_chrome.return_value.find_elements.return_value = [element]
+
+        with patch('asset_data_collector.WebDriverWait', WebDriverWait), \
+                patch('selenium.webdriver.support.wait.time.sleep'):
+            result = collector.get_mining_cost_data()
+
+        assert result['mining_cost'] == 85000.0
+        assert ccaf_chrome.return_value.find_elements.call_count == 3
+
+    def test_mining_cost_empty_value_times_out(self, collector, ccaf_chrome):
+        """Test a value that never renders reports N/A instead of parsing an empty element"""
+        ccaf_chrome.return_value.find_elements.return_value = [Mock(text='')]
+
+        with patch('asset_data_collector.WebDriverWait', WebDriverWait), \
+                patch('asset_data_collector.CCAF_LOAD_TIMEOUT', 0):
+            result = collector.get_mining_cost_data()
+
+        assert result['mining_cost'] == 'N/A'
+        assert result['error'] == 'Element not found'
+
+    def test_mining_cost_reuses_chrome_driver(self, collector, ccaf_chrome):
+        """Test repeated CCAF scrapes start Chrome once and keep it warm"""
+        first = collector.get_mining_cost_data()
+        second = collector.get_mining_cost_data()
+
+        assert first['mining_cost'] == second['mining_cost'] == 85000.0
+        ccaf_chrome.assert_called_once()
+        assert ccaf_chrome.return_value.get.call_count == 2
+        ccaf_chrome.return_value.quit.assert_not_called()
+
+    def test_mining_cost_restarts_driver_after_failure(self, collector, ccaf_chrome):
+        """Test a broken browser is quit and replaced on the next scrape"""
+        ccaf_chrome.return_value.get.side_effect = [Exception("chrome not reachable"), None]
+
+        failed = collector.get_mining_cost_data()
+        recovered = collector.get_mining_cost_data()
+
+        assert failed['mining_cost'] == 'N/A'
+        assert recovered['mining_cost'] == 85000.0
+        assert ccaf_chrome.call_count == 2
+        ccaf_chrome.return_value.quit.assert_called_once()
+
+    @pytest.mark.parametrize('text, expected', [
+        ('$85,000', 85000.0),
+        ('$ 85,123.45', 85123.45),
+        ('$85,000 USD', 85000.0),
+        ('~$92,500/BTC', 92500.0),
+        ('85000.', 85000.0),
+        ('-70000', 70000.0),
+    ])
+    def test_mining_cost_parsing(self, collector, ccaf_chrome, text, expected):
+        """Test the CCAF figure is parsed with or without surrounding text"""
+        with patch('asset_data_collector.WebDriverWait') as wait:
+            wait.return_value.until.return_value = Mock(text=text)
+            result = collector.get_mining_cost_data()
+
+        assert result['mining_cost'] == expected
+
+    @pytest.mark.parametrize('text, error', [
+        ('N/A', 'Could not parse value'),
+        ('nan', 'Could not parse value'),
+        ('inf', 'Could not parse value'),
+        ('50_000', 'Value out of range'),  # Parsed as 50, not float('50_000')
+        ('1e5', 'Value out of range'),  # Parsed as 1, not float('1e5')
+        ('$2,500', 'Value out of range'),
+    ])
+    def test_mining_cost_rejects_bad_values(self, collector, ccaf_chrome, text, error):
+        """Test unparseable or implausible CCAF figures come back as N/A"""
+        with patch('asset_data_collector.WebDriverWait') as wait:
+            wait.return_value.until.return_value = Mock(text=text)
+            result = collector.get_mining_cost_data()
+
+        assert result['mining_cost'] == 'N/A'
+        assert result['error'] == error
+
+    def test_ccaf_chrome_options_built_once(self, collector):
+        """Test CCAF options are memoized and skip waiting on images"""
+        options = HybridBTCCollector._ccaf_chrome_options()
+
+        assert HybridBTCCollector._ccaf_chrome_options() is options
+        assert options.page_load_strategy == 'eager'
+        assert '--blink-settings=imagesEnabled=false' in options.arguments
+
+    def test_close_ccaf_driver(self, collector, ccaf_chrome):
+        """Test closing quits the shared driver exactly once"""
+        collector.get_mining_cost_data()
+
+        HybridBTCCollector.close_ccaf_driver()
+        HybridBTCCollector.close_ccaf_driver()
+
+        ccaf_chrome.return_value.quit.assert_called_once()
+        assert HybridBTCCollector._ccaf_driver is None
+
+
+class TestTokenBucket:
+    """Test suite for the per-host TokenBucket rate limiter"""
+
+    def test_burst_up_to_capacity_without_waiting(self):
+        """Test requests within quota never sleep"""
+        bucket = TokenBucket(5, 60)
+
+        with patch('asset_data_collector.time.sleep') as mock_sleep:
+            for _ in range(5):
+                bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_waits_for_refill_when_empty(self, fake_clock):
+        """Test an empty bucket waits roughly one refill interval"""
+        bucket = TokenBucket(5, 60)
+        for _ in range(6):
+            bucket.acquire()
+
+        fake_clock.assert_called_once()
+        assert fake_clock.call_args[0][0] == pytest.approx(12.0)
+
+    def test_block_for_holds_back_callers(self, fake_clock):
+        """Test block_for delays the next acquire even with tokens available"""
+        bucket = TokenBucket(30, 60)
+        bucket.block_for(10)
+        bucket.acquire()
+
+        assert sum(c[0][0] for c in fake_clock.call_args_list) == pytest.approx(10.0)
+
 
 class TestHybridAssetDataCollector:
     """Test suite for HybridAssetDataCollector class"""
@@ -361,6 +884,41 @@ class TestHybridAssetDataCollector:
         """Test successful initialization of HybridAssetDataCollector"""
         assert asset_collector.btc_collector is not None
 
+    def test_initialization_makes_no_api_calls(self, asset_collector):
+        """Test connectivity probes only run through healthcheck()"""
+        asset_collector.btc_collector.test_api_connection.assert_not_called()
+        asset_collector.btc_collector.test_coingecko_connection.assert_not_called()
+
+    def test_instances_share_btc_collector(self):
+        """Test the BTC collector is built once per process"""
+        with patch('asset_data_collector.HybridBTCCollector') as mock_btc_collector_class:
+            first = HybridAssetDataCollector()
+            second = HybridAssetDataCollector()
+
+        assert first.btc_collector is second.btc_collector
+        mock_btc_collector_class.assert_called_once()
+
+    def test_preflight_runs_healthcheck(self):
+        """Test preflight=True probes both APIs during construction"""
+        with patch('asset_data_collector.HybridBTCCollector') as mock_btc_collector_class:
+            mock_btc_collector_class.return_value.check_connections.return_value = {'polygon': True, 'coingecko': True}
+
+            HybridAssetDataCollector(preflight=True)
+
+        mock_btc_collector_class.return_value.check_connections.assert_called_once()
+
+    def test_healthcheck(self, asset_collector):
+        """Test healthcheck reports each API separately"""
+        asset_collector.btc_collector.check_connections.return_value = {'polygon': True, 'coingecko': False}
+
+        assert asset_collector.healthcheck() == {'polygon': True, 'coingecko': False}
+
+    def test_healthcheck_without_collector(self, asset_collector):
+        """Test healthcheck reports failure when the BTC collector couldn't be built"""
+        asset_collector.btc_collector = None
+
+        assert asset_collector.healthcheck() == {'polygon': False, 'coingecko': False}
+
     def test_initialization_btc_collector_failure(self):
         """Test initialization when BTC collector fails"""
         with patch('asset_data_collector.HybridBTCCollector', side_effect=Exception("Init failed")):
@@ -459,11 +1017,13 @@ class TestIntegrationScenarios:
     """Integration-style tests with multiple components"""
 
     @pytest.fixture
-    def full_collector_setup(self):
+    def full_collector_setup(self, monkeypatch, tmp_path):
         """Set up a complete collector with all mocks"""
+        monkeypatch.chdir(tmp_path)  # Keep the collector's default .cache out of the repo
+
         with patch.dict(os.environ, {'POLYGON_API_KEY': 'test_key'}), \
                 patch('asset_data_collector.MVRVScraper') as mock_mvrv_class, \
-                patch('asset_data_collector.requests.Session') as mock_session_class:
+                patch('asset_data_collector.get_session') as mock_get_session:
             # Mock MVRV scraper
             mock_mvrv = Mock()
             mock_mvrv.get_mvrv_value.return_value = 2.1
@@ -471,7 +1031,7 @@ class TestIntegrationScenarios:
 
             # Mock HTTP session
             mock_session = Mock()
-            mock_session_class.return_value = mock_session
+            mock_get_session.return_value = mock_session
 
             collector = HybridAssetDataCollector()
 
@@ -481,25 +1041,26 @@ class TestIntegrationScenarios:
         """Test complete BTC data collection workflow"""
         collector, mock_session = full_collector_setup
 
-        # Mock successful API responses in sequence
-        mock_responses = [
-            # CoinGecko price response
-            Mock(status_code=200, json=lambda: {
-                'bitcoin': {'usd': 95000.0, 'last_updated_at': int(datetime.now().timestamp())}
-            }),
-            # Polygon daily EMA data
-            Mock(status_code=200, json=lambda: {
-                'status': 'OK',
-                'results': [{'c': 90000.0 + i * 100} for i in range(250)]
-            }),
+        # Fetches run concurrently, so route mock responses by URL rather than call order
+        def route_response(url, *args, **kwargs):
+            if 'coingecko' in url:
+                # CoinGecko price response
+                return json_response({
+                    'bitcoin': {'usd': 95000.0, 'last_updated_at': int(datetime.now().timestamp())}
+                })
+            if '/range/1/day/' in url:
+                # Polygon daily EMA data
+                return json_response({
+                    'status': 'OK',
+                    'results': [{'c': 90000.0 + i * 100} for i in range(250)]
+                })
             # Polygon weekly RSI data
-            Mock(status_code=200, json=lambda: {
+            return json_response({
                 'status': 'OK',
                 'results': [{'c': 90000.0 + i * 500} for i in range(50)]
             })
-        ]
 
-        mock_session.get.side_effect = mock_responses
+        mock_session.get.side_effect = route_response
 
         with patch('asset_data_collector.time.sleep'):  # Speed up test
             result = collector.collect_asset_data('BTC', {})
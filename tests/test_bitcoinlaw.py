@@ -23,7 +23,7 @@ import io
 import os
 import tempfile
 import platform
-from PIL import Image
+from PIL import Image, JpegImagePlugin
 import logging
 
 # Import the module we're testing (from parent directory)
@@ -46,6 +46,21 @@ def safe_cleanup(filepath):
                 raise
 
 
+@pytest.fixture(autouse=True)
+def fresh_shared_driver():
+    """Each test starts without a warm (possibly mocked) Chrome driver left over from another test"""
+    bitcoin_laws_scraper.BitcoinLawsScraper._driver = None
+    yield
+    bitcoin_laws_scraper.BitcoinLawsScraper._driver = None
+
+
+def viewport_or_complete(script):
+    """execute_script stand-in: a 2000x1500 viewport for size queries, "complete" for everything else"""
+    if 'innerWidth' in script:
+        return [2000, 1500]
+    return "complete"
+
+
 class TestBitcoinLawsScraper:
     """Test suite for BitcoinLawsScraper class"""
 
@@ -71,8 +86,8 @@ class TestBitcoinLawsScraper:
         # Setup mocks
         mock_driver = mock.MagicMock()
         mock_chrome.return_value = mock_driver
-        mock_driver.get_screenshot_as_png.return_value = mock_screenshot_bytes
-        mock_driver.execute_script.return_value = "complete"
+        mock_driver.execute_cdp_cmd.return_value = {'data': base64.b64encode(mock_screenshot_bytes).decode()}
+        mock_driver.execute_script.side_effect = viewport_or_complete
 
         mock_wait_instance = mock.MagicMock()
         mock_wait.return_value = mock_wait_instance
@@ -93,7 +108,102 @@ class TestBitcoinLawsScraper:
         # Verify driver was called correctly
         mock_chrome.assert_called_once()
         mock_driver.get.assert_called_once_with("https://bitcoinlaws.io")
+        assert mock_driver.execute_cdp_cmd.call_args[0][0] == 'Page.captureScreenshot'
+        assert mock_driver.execute_cdp_cmd.call_args[0][1]['format'] == 'jpeg'
+        # The browser stays warm for the next capture
+        mock_driver.quit.assert_not_called()
+
+    @mock.patch('bitcoin_laws_scraper.webdriver.Chrome')
+    @mock.patch('bitcoin_laws_scraper.WebDriverWait')
+    @mock.patch('bitcoin_laws_scraper.time.sleep')
+    def test_capture_and_crop_reuses_driver(self, mock_sleep, mock_wait, mock_chrome):
+        """Test repeated captures start Chrome once and reload the page on it"""
+        img_buffer = io.BytesIO()
+        Image.new('RGB', (100, 100), color='red').save(img_buffer, format='JPEG')
+        mock_driver = mock_chrome.return_value
+        mock_driver.execute_cdp_cmd.return_value = {'data': base64.b64encode(img_buffer.getvalue()).decode()}
+        mock_driver.execute_script.side_effect = viewport_or_complete
+
+        first = self.scraper.capture_and_crop((0, 0, 50, 50), output_width=100, output_height=100)
+        second = bitcoin_laws_scraper.BitcoinLawsScraper().capture_and_crop((0, 0, 50, 50),
+                                                                            output_width=100, output_height=100)
+
+        assert first is not None and second is not None
+        mock_chrome.assert_called_once()
+        mock_driver.set_window_size.assert_called_once_with(2000, 1500)
+        assert mock_driver.get.call_count == 2
+
+        bitcoin_laws_scraper.BitcoinLawsScraper.close()
         mock_driver.quit.assert_called_once()
+        assert bitcoin_laws_scraper.BitcoinLawsScraper._driver is None
+
+    @mock.patch('bitcoin_laws_scraper.webdriver.Chrome')
+    @mock.patch('bitcoin_laws_scraper.WebDriverWait')
+    @mock.patch('bitcoin_laws_scraper.time.sleep')
+    def test_capture_and_crop_discards_failed_driver(self, mock_sleep, mock_wait, mock_chrome):
+        """Test a browser that fails mid-capture is quit and replaced next time"""
+        mock_driver = mock_chrome.return_value
+        mock_driver.get.side_effect = Exception("chrome not reachable")
+
+        result = self.scraper.capture_and_crop((0, 0, 100, 100))
+
+        assert result is None
+        mock_driver.quit.assert_called_once()
+        assert bitcoin_laws_scraper.BitcoinLawsScraper._driver is None
+
+    def test_capture_region_clips_to_scaled_crop(self):
+        """Test only the crop region is captured, scaled from the 1200x900 reference to the viewport"""
+        region = Image.new('RGB', (1050, 903), color='red')
+        img_buffer = io.BytesIO()
+        region.save(img_buffer, format='JPEG')
+        driver = mock.MagicMock()
+        driver.execute_script.side_effect = viewport_or_complete
+        driver.execute_cdp_cmd.return_value = {'data': base64.b64encode(img_buffer.getvalue()).decode()}
+
+        result = self.scraper._capture_region(driver, (-60, 0, 630, 540))
+
+        assert result == img_buffer.getvalue()
+        params = driver.execute_cdp_cmd.call_args[0][1]
+        assert params['format'] == 'jpeg'
+        assert params['clip'] == {'x': 0, 'y': 0, 'width': 1050, 'height': 900, 'scale': 1}
+
+    def test_wait_until_settled_returns_once_network_is_quiet(self):
+        """Test the settle wait ends once polls stop finding new resource timings"""
+        driver = mock.MagicMock()
+        new_entries = iter([250, 40, 12])  # A full buffer first, then the rest of the map's requests
+
+        def execute_script(script):
+            if 'fonts' in script:
+                return "loaded"
+            assert 'clearResourceTimings' in script
+            return next(new_entries, 0)  # Nothing new once the map has loaded
+
+        driver.execute_script.side_effect = execute_script
+        self.scraper.QUIET_PERIOD = 0.05
+
+        self.scraper._wait_until_settled(driver)
+
+        resource_polls = [c for c in driver.execute_script.call_args_list if 'resource' in c[0][0]]
+        assert len(resource_polls) >= 4
+
+    @mock.patch('bitcoin_laws_scraper.WebDriverWait')
+    def test_wait_until_settled_gives_up_quietly(self, mock_wait):
+        """Test a page that never goes quiet is still captured"""
+        from selenium.common.exceptions import TimeoutException
+        mock_wait.return_value.until.side_effect = TimeoutException()
+
+        self.scraper._wait_until_settled(mock.MagicMock())  # Must not raise
+
+    @mock.patch('bitcoin_laws_scraper.WebDriverWait')
+    def test_wait_until_settled_waits_for_network_after_font_stall(self, mock_wait):
+        """Test a font timeout still runs the network-quiet wait"""
+        from selenium.common.exceptions import TimeoutException
+        mock_wait.return_value.until.side_effect = [TimeoutException(), True]
+
+        self.scraper._wait_until_settled(mock.MagicMock())
+
+        assert mock_wait.return_value.until.call_count == 2
+        assert mock_wait.call_args_list[1][0][1] == self.scraper.SETTLE_TIMEOUT
 
     @mock.patch('bitcoin_laws_scraper.webdriver.Chrome')
     def test_capture_and_crop_exception(self, mock_chrome):
@@ -131,6 +241,52 @@ class TestBitcoinLawsScraper:
         decoded_image = Image.open(io.BytesIO(decoded_bytes))
         assert decoded_image.size == (100, 100)
 
+    def test_process_image_maps_reference_crop_onto_screenshot(self):
+        """Test crop coordinates on the 1200x900 reference select the same region of a larger screenshot"""
+        # 2000x1500 capture: left half red, right half blue
+        test_image = Image.new('RGB', (2000, 1500), color='blue')
+        test_image.paste((255, 0, 0), (0, 0, 1000, 1500))
+        img_buffer = io.BytesIO()
+        test_image.save(img_buffer, format='PNG')
+
+        result = self.scraper._process_image(
+            screenshot_bytes=img_buffer.getvalue(),
+            crop_coords=(0, 0, 500, 900),  # Inside the red half of the reference
+            output_width=80,
+            output_height=60
+        )
+
+        decoded_image = Image.open(io.BytesIO(base64.b64decode(result)))
+        assert decoded_image.size == (80, 60)
+        red, green, blue = decoded_image.getpixel((40, 30))
+        assert red > 200 and blue < 50
+
+    def test_process_image_drafts_jpeg_without_losing_resolution(self):
+        """Test JPEG screenshots are decoded at reduced scale only while the crop keeps enough pixels"""
+        test_image = Image.new('RGB', (2000, 1500), color='green')
+        img_buffer = io.BytesIO()
+        test_image.save(img_buffer, format='JPEG')
+
+        drafts = []
+        original_draft = JpegImagePlugin.JpegImageFile.draft
+
+        def spy_draft(image, mode, size):
+            result = original_draft(image, mode, size)
+            drafts.append(image.size)
+            return result
+
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, 'draft', spy_draft):
+            result = self.scraper._process_image(
+                screenshot_bytes=img_buffer.getvalue(),
+                crop_coords=(0, 0, 1200, 900),
+                output_width=300,
+                output_height=225
+            )
+
+        assert drafts == [(500, 375)]  # 1/4 scale still covers 300x225
+        decoded_image = Image.open(io.BytesIO(base64.b64decode(result)))
+        assert decoded_image.size == (300, 225)
+
     def test_process_image_rgba_conversion(self):
         """Test RGBA to RGB conversion"""
         # Create an RGBA image
@@ -334,8 +490,8 @@ class TestIntegrationScenarios:
         # Setup mocks
         mock_driver = mock.MagicMock()
         mock_chrome.return_value = mock_driver
-        mock_driver.get_screenshot_as_png.return_value = mock_screenshot_bytes
-        mock_driver.execute_script.return_value = "complete"
+        mock_driver.execute_cdp_cmd.return_value = {'data': base64.b64encode(mock_screenshot_bytes).decode()}
+        mock_driver.execute_script.side_effect = viewport_or_complete
 
         mock_wait_instance = mock.MagicMock()
         mock_wait.return_value = mock_wait_instance
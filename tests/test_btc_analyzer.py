@@ -31,6 +31,7 @@ import os
 # Add the parent directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from azure.common import AzureMissingResourceHttpError
 from btc_analyzer import BTCAnalyzer
 
 
@@ -217,8 +218,10 @@ class TestBTCAnalyzer:
             assert signal_conditions['mvrv']['condition_met'] is False  # MVRV 2.0 < 3.0
             assert signal_conditions['rsi']['condition_met'] is False  # RSI 55 < 70
 
-    def test_analyze_btc_signals_error_handling(self, analyzer_with_storage):
+    def test_analyze_btc_signals_error_handling(self, analyzer_with_storage, mock_storage):
         """Test error handling in analyze_btc_signals"""
+        mock_storage.table_service.get_entity.side_effect = AzureMissingResourceHttpError('Not Found', 404)
+
         # Test graceful handling of empty data (this is actually good behavior)
         empty_data = {}
         result = analyzer_with_storage.analyze_btc_signals(empty_data)
@@ -302,7 +305,7 @@ class TestBTCAnalyzer:
         mock_entity.conditions_failing_since = ''
         mock_entity.last_updated = '2024-01-15'
 
-        mock_storage.table_service.query_entities.return_value = [mock_entity]
+        mock_storage.table_service.get_entity.return_value = mock_entity
 
         with patch.object(analyzer_with_storage, '_calculate_days_active', return_value=5):
             result = analyzer_with_storage._get_signal_state()
@@ -312,6 +315,32 @@ class TestBTCAnalyzer:
         assert result['start_date'] == '2024-01-10'
         assert result['end_date'] == ''
         assert result['days_active'] == 5
+        mock_storage.table_service.get_entity.assert_called_once_with('systemhealth', 'SIGNAL_STATE', 'CURRENT')
+        mock_storage.table_service.query_entities.assert_not_called()
+
+    def test_get_signal_state_cached_within_same_day(self, analyzer_with_storage, mock_storage):
+        """Test signal state is read from storage once per UTC date"""
+        mock_entity = Mock()
+        mock_entity.active = False
+        mock_entity.signal_type = ''
+        mock_entity.start_date = ''
+        mock_entity.end_date = ''
+        mock_entity.conditions_failing_since = ''
+        mock_entity.last_updated = '2024-01-14'
+        mock_storage.table_service.get_entity.return_value = mock_entity
+
+        morning = datetime(2024, 1, 15, 6, 0, 0, tzinfo=timezone.utc)
+        evening = datetime(2024, 1, 15, 18, 0, 0, tzinfo=timezone.utc)
+        next_day = datetime(2024, 1, 16, 6, 0, 0, tzinfo=timezone.utc)
+
+        first = analyzer_with_storage._get_signal_state(morning)
+        second = analyzer_with_storage._get_signal_state(evening)
+        assert first == second
+        assert first is not second
+        assert mock_storage.table_service.get_entity.call_count == 1
+
+        analyzer_with_storage._get_signal_state(next_day)
+        assert mock_storage.table_service.get_entity.call_count == 2
 
     def test_get_signal_state_no_storage(self, analyzer_without_storage):
         """Test signal state retrieval without storage"""
@@ -324,9 +353,9 @@ class TestBTCAnalyzer:
         assert result['end_date'] == ''
         assert result['days_active'] == 0
 
-    def test_get_signal_state_empty_query(self, analyzer_with_storage, mock_storage):
-        """Test signal state retrieval with empty query result"""
-        mock_storage.table_service.query_entities.return_value = []
+    def test_get_signal_state_missing_entity(self, analyzer_with_storage, mock_storage):
+        """Test signal state retrieval when the state row does not exist yet"""
+        mock_storage.table_service.get_entity.side_effect = AzureMissingResourceHttpError('Not Found', 404)
 
         result = analyzer_with_storage._get_signal_state()
 
@@ -393,6 +422,7 @@ class TestBTCAnalyzer:
         assert result['active'] is False
         assert result['end_date'] == '2024-01-15'
         assert result['conditions_failing_since'] == ''
+        assert result['days_active'] == 14
 
     def test_update_signal_state_conditions_restore(self, analyzer_with_storage):
         """Test signal state when failing conditions are restored"""
@@ -413,11 +443,14 @@ class TestBTCAnalyzer:
 
         current_date = '2024-01-15'
 
-        result = analyzer_with_storage._update_signal_state(current_state, signal_conditions, current_date)
+        with patch.object(analyzer_with_storage, '_calculate_days_active') as mock_days_active:
+            result = analyzer_with_storage._update_signal_state(current_state, signal_conditions, current_date)
 
         assert result['active'] is True
         assert result['conditions_failing_since'] == ''  # Cleared
         assert result['end_date'] == ''
+        assert result['days_active'] == 14  # Carried over from the read, not recomputed
+        mock_days_active.assert_not_called()
 
     def test_calculate_days_active_ongoing_signal(self, analyzer_with_storage):
         """Test days active calculation for ongoing signal"""
@@ -445,6 +478,14 @@ class TestBTCAnalyzer:
 
         assert result == 10  # 10 days between Jan 10 and Jan 20
 
+    def test_calculate_days_active_uses_supplied_now(self, analyzer_with_storage):
+        """Test days active calculation against an explicit clock reading"""
+        now = datetime(2024, 2, 1, 23, 59, 0, tzinfo=timezone.utc)
+
+        result = analyzer_with_storage._calculate_days_active('2024-01-10', '', now)
+
+        assert result == 22
+
     def test_calculate_days_active_no_start_date(self, analyzer_with_storage):
         """Test days active calculation with no start date"""
         result = analyzer_with_storage._calculate_days_active('', '')
@@ -463,7 +504,7 @@ class TestBTCAnalyzer:
         }
 
         # Patch the correct Entity import path
-        with patch('azure.cosmosdb.table.models.Entity') as mock_entity_class:
+        with patch('btc_analyzer.Entity') as mock_entity_class:
             mock_entity = Mock()
             mock_entity_class.return_value = mock_entity
 
@@ -475,6 +516,57 @@ class TestBTCAnalyzer:
                 'systemhealth', mock_entity
             )
 
+    def test_save_signal_state_uses_etag_from_read(self, analyzer_with_storage, mock_storage):
+        """Test signal state save is conditional on the ETag returned by the read"""
+        mock_entity = Mock()
+        mock_entity.etag = 'W/"etag-1"'
+        mock_entity.start_date = ''
+        mock_entity.end_date = ''
+        mock_storage.table_service.get_entity.return_value = mock_entity
+        mock_storage.table_service.merge_entity.return_value = 'W/"etag-2"'
+
+        state = analyzer_with_storage._get_signal_state()
+        analyzer_with_storage._save_signal_state(state)
+
+        args, kwargs = mock_storage.table_service.merge_entity.call_args
+        assert args[0] == 'systemhealth'
+        assert kwargs['if_match'] == 'W/"etag-1"'
+        mock_storage.table_service.insert_or_replace_entity.assert_not_called()
+        assert analyzer_with_storage._signal_state_etag == 'W/"etag-2"'
+
+    def test_analyze_btc_signals_skips_save_when_unchanged(self, analyzer_with_storage, sample_btc_data_neutral):
+        """Test that an unchanged signal state is not written back to storage"""
+        mock_signal_state = {
+            'active': False,
+            'signal_type': '',
+            'start_date': '',
+            'end_date': '',
+            'conditions_failing_since': '',
+            'last_updated': '2024-01-15',
+            'days_active': 0
+        }
+
+        with patch.object(analyzer_with_storage, '_get_signal_state', return_value=mock_signal_state), \
+                patch.object(analyzer_with_storage, '_save_signal_state') as mock_save, \
+                patch('btc_analyzer.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+            result = analyzer_with_storage.analyze_btc_signals(sample_btc_data_neutral)
+
+        assert 'error' not in result
+        mock_save.assert_not_called()
+
+    def test_analyze_btc_signals_saves_in_background(self, analyzer_with_storage, sample_btc_data_bull_market):
+        """Test that a changed signal state is written through the background executor"""
+        mock_signal_state = analyzer_with_storage._get_default_signal_state()
+
+        with patch.object(analyzer_with_storage, '_get_signal_state', return_value=mock_signal_state), \
+                patch.object(analyzer_with_storage, '_save_signal_state') as mock_save:
+            result = analyzer_with_storage.analyze_btc_signals(sample_btc_data_bull_market)
+            analyzer_with_storage._pending_save.result(timeout=5)
+
+        mock_save.assert_called_once_with(result['signal_state'])
+
     def test_save_signal_state_no_storage(self, analyzer_without_storage):
         """Test signal state saving without storage"""
         signal_state = {'active': True}
@@ -525,6 +617,32 @@ class TestBTCAnalyzer:
         assert result['emoji'] == '🟡'
         assert 'One parameter no longer met' in result['prediction']
 
+    @pytest.mark.parametrize('conditions_met, status, emoji, prediction', [
+        (True, 'active', '🟢', 'Bottom is likely to be in 4-6 months'),
+        (False, 'weakening', '🟡', 'One parameter no longer met'),
+    ])
+    def test_determine_signal_status_unknown_signal_type(self, analyzer_with_storage, caplog,
+                                                         conditions_met, status, emoji, prediction):
+        """Test an active signal of unexpected type keeps the non-SELL result and logs a warning"""
+        signal_state = {
+            'active': True,
+            'signal_type': 'HOLD',
+            'start_date': '2024-01-10',
+            'end_date': '',
+            'days_active': 5
+        }
+
+        with caplog.at_level(logging.WARNING):
+            result = analyzer_with_storage._determine_signal_status(
+                signal_state, {'both_conditions_met': conditions_met})
+
+        assert result['status'] == status
+        assert result['message'] == f"HOLD SIGNAL {'ACTIVE' if conditions_met else 'WEAKENING'}"
+        assert result['emoji'] == emoji
+        assert prediction in result['prediction']
+        assert result['days_active'] == 5
+        assert 'HOLD' in caplog.text
+
     def test_determine_signal_status_recently_off(self, analyzer_with_storage):
         """Test signal status determination for recently ended signal"""
         signal_state = {
@@ -604,6 +722,29 @@ class TestBTCAnalyzer:
             assert result is True
             mock_save.assert_called_once()
 
+    def test_reset_signal_state_waits_for_pending_save(self, analyzer_with_storage):
+        """Test a background save still in flight lands before the reset, not after it"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        release = threading.Event()
+        saved = []
+
+        def save(state):
+            if state.get('marker') == 'old':
+                release.wait(5)
+            saved.append(state.get('marker', 'reset'))
+
+        with patch.object(analyzer_with_storage, '_save_signal_state', side_effect=save), \
+                ThreadPoolExecutor(max_workers=1) as executor:
+            analyzer_with_storage._pending_save = executor.submit(
+                analyzer_with_storage._save_signal_state, {'marker': 'old'})
+            threading.Timer(0.1, release.set).start()
+
+            assert analyzer_with_storage.reset_signal_state() is True
+
+        assert saved == ['old', 'reset']
+        assert analyzer_with_storage._pending_save is None
+
     def test_reset_signal_state_error(self, analyzer_with_storage):
         """Test signal state reset with error"""
         with patch.object(analyzer_with_storage, '_save_signal_state', side_effect=Exception("Save failed")):
@@ -630,7 +771,7 @@ class TestIntegrationScenarios:
         mock_entity.conditions_failing_since = ''
         mock_entity.last_updated = '2024-01-14'
 
-        mock_storage.table_service.query_entities.return_value = [mock_entity]
+        mock_storage.table_service.get_entity.return_value = mock_entity
 
         return mock_storage
 
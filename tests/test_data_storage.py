@@ -33,7 +33,30 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Add the parent directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from data_storage import DataStorage
+from data_storage import DataStorage, _to_json
+
+
+class TestToJson:
+    """Test suite for the stored-JSON serializer"""
+
+    @pytest.mark.parametrize('orjson_installed', [True, False])
+    def test_non_finite_numbers_stored_as_null(self, orjson_installed):
+        """Test NaN/Infinity become null with or without orjson"""
+        value = {'rsi': float('nan'), 'nested': {'ema': float('inf')}, 'series': [1.5, float('-inf')]}
+
+        if orjson_installed:
+            result = _to_json(value)
+        else:
+            with patch('data_storage.orjson', None):
+                result = _to_json(value)
+
+        assert json.loads(result) == {'rsi': None, 'nested': {'ema': None}, 'series': [1.5, None]}
+
+    def test_finite_values_unchanged(self):
+        """Test ordinary values round-trip untouched"""
+        value = {'price': 95000.0, 'days': 3, 'active': True, 'label': 'BTC', 'none': None}
+
+        assert json.loads(_to_json(value)) == value
 
 
 class TestDataStorageInitialization:
@@ -94,7 +117,7 @@ class TestDataStorageInitialization:
                 assert storage.account_key is None
                 assert storage.table_service is None
 
-        @patch('data_storage.TableService')
+    @patch('data_storage.TableService')
     def test_ensure_tables_exist_success(self, mock_table_service, mock_azure_credentials):
         """Test successful table creation"""
         with patch.dict(os.environ, mock_azure_credentials):
@@ -0,0 +1,410 @@
+"""
+Unit tests for github_market_monitor.py
+
+Covers the report gating logic used by the scheduled GitHub Actions monitor.
+All collectors are bypassed - tests operate on in-memory collected/processed data.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+import sys
+import os
+
+# Add the parent directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import github_market_monitor
+from github_market_monitor import (
+    AssetSpec,
+    _collect_mstr_data,
+    _evaluate_core_components,
+    _format_failure_report,
+    generate_btc_alerts_enhanced,
+    generate_mstr_alerts,
+    is_btc_data_valid,
+    is_mstr_data_valid,
+    process_asset_data_enhanced,
+    run_collection_plan,
+    should_send_daily_report_enhanced,
+    validate_btc_data_quality_enhanced,
+    validate_mstr_data_quality,
+)
+
+
+@pytest.fixture
+def btc_collected():
+    """Successful BTC collection result"""
+    return {
+        'success': True,
+        'type': 'crypto',
+        'price': 95000.0,
+        'indicators': {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 88000.0},
+        'metadata': {'source': 'polygon_api'},
+        'timestamp': '2024-01-15T09:00:00',
+        'pi_cycle': {
+            'success': True,
+            'signal_status': {'proximity_level': 'FAR'},
+            'current_values': {'ma_111': 90000.0, 'ma_350_x2': 140000.0, 'gap_percentage': 35.7}
+        }
+    }
+
+
+@pytest.fixture
+def mstr_collected():
+    """Successful MSTR collection result"""
+    return {
+        'success': True,
+        'type': 'stock',
+        'price': 425.0,
+        'indicators': {'model_price': 400.0, 'deviation_pct': 6.25, 'iv': 55.0},
+        'analysis': {'options_strategy': {'primary_strategy': 'no_preference'}},
+        'timestamp': '2024-01-15T09:00:00',
+        'attempts_made': 1
+    }
+
+
+@pytest.fixture
+def collected_data(btc_collected, mstr_collected):
+    return {'BTC': btc_collected, 'MSTR': mstr_collected}
+
+
+class TestReportGating:
+    """Tests for the daily report send/skip decision"""
+
+    def test_core_components_ready(self, collected_data):
+        processed = process_asset_data_enhanced(collected_data)
+
+        ready, failed = _evaluate_core_components(processed, collected_data, "")
+
+        assert ready is True
+        assert failed == []
+
+    def test_core_components_btc_failed(self, collected_data):
+        collected_data['BTC'] = {'success': False, 'error': 'API down'}
+        processed = process_asset_data_enhanced(collected_data)
+
+        ready, failed = _evaluate_core_components(processed, collected_data, "")
+
+        assert ready is False
+        assert "BTC collection failed" in failed
+        assert "Bitcoin Laws screenshot failed/empty" in failed
+
+    def test_core_components_mstr_quality_issue(self, collected_data):
+        collected_data['MSTR']['indicators']['iv'] = 0
+        processed = process_asset_data_enhanced(collected_data)
+
+        ready, failed = _evaluate_core_components(processed, collected_data, "")
+
+        assert ready is False
+        assert any(item.startswith("MSTR data quality issues") for item in failed)
+
+    def test_should_send_with_full_monetary_data(self, collected_data):
+        processed = process_asset_data_enhanced(collected_data)
+        monetary = {'success': True, 'true_inflation_rate': 7.2, 'm2_20y_growth': 300.0}
+
+        result = should_send_daily_report_enhanced(processed, collected_data, "", monetary)
+
+        assert result['send'] is True
+        assert 'FULL enhanced features + Pi Cycle' in result['reason']
+
+    def test_should_send_without_monetary_data(self, collected_data):
+        processed = process_asset_data_enhanced(collected_data)
+        monetary = {'success': False, 'error': 'FRED unavailable'}
+
+        result = should_send_daily_report_enhanced(processed, collected_data, "", monetary)
+
+        assert result['send'] is True
+        assert 'FRED unavailable' in result['details']
+
+    def test_should_not_send_when_core_fails(self, collected_data):
+        collected_data['MSTR'] = {'success': False, 'error': 'timeout'}
+        processed = process_asset_data_enhanced(collected_data)
+
+        result = should_send_daily_report_enhanced(processed, collected_data, "", {'success': True})
+
+        assert result['send'] is False
+        assert 'MSTR collection failed' in result['details']
+
+
+class TestDataQualityValidation:
+    """Tests for the BTC/MSTR data quality validators"""
+
+    def test_btc_missing_price_stops_early(self):
+        result = validate_btc_data_quality_enhanced({'price': 0, 'indicators': {'mvrv': 0}})
+
+        assert result['is_valid'] is False
+        assert result['issues'] == ["Invalid price: 0"]
+
+    def test_btc_reports_all_indicator_issues(self):
+        result = validate_btc_data_quality_enhanced({'price': 95000.0, 'indicators': None})
+
+        assert result['is_valid'] is False
+        assert len(result['issues']) == 3
+
+    def test_mstr_valid(self, mstr_collected):
+        result = validate_mstr_data_quality(mstr_collected)
+
+        assert result == {'is_valid': True, 'issues': []}
+
+    def test_mstr_missing_deviation(self, mstr_collected):
+        del mstr_collected['indicators']['deviation_pct']
+
+        result = validate_mstr_data_quality(mstr_collected)
+
+        assert result['is_valid'] is False
+        assert "Missing deviation percentage" in result['issues']
+
+
+class TestFastValidators:
+    """The gating validators must agree with the full issue-building validators"""
+
+    @pytest.mark.parametrize('price, indicators, pi_cycle', [
+        (95000.0, {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 88000.0}, None),
+        (5000.0, {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 88000.0}, None),
+        (95000.0, {'mvrv': 12.0, 'weekly_rsi': 65.0, 'ema_200': 88000.0}, None),
+        (95000.0, {'mvrv': 2.1, 'weekly_rsi': None, 'ema_200': 88000.0}, None),
+        (95000.0, {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 600000.0}, None),
+        (95000.0, None, None),
+        (95000.0, {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 88000.0},
+         {'success': True, 'current_values': {'ma_111': 90000.0, 'ma_350_x2': 0, 'gap_percentage': 35.7}}),
+        (95000.0, {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 88000.0},
+         {'success': True, 'current_values': {'ma_111': 90000.0, 'ma_350_x2': 140000.0}}),
+        (95000.0, {'mvrv': 2.1, 'weekly_rsi': 65.0, 'ema_200': 88000.0}, {'success': False, 'error': 'n/a'}),
+    ])
+    def test_btc_matches_full_validator(self, btc_collected, price, indicators, pi_cycle):
+        btc_collected.update(price=price, indicators=indicators)
+        if pi_cycle is not None:
+            btc_collected['pi_cycle'] = pi_cycle
+
+        assert is_btc_data_valid(btc_collected) is validate_btc_data_quality_enhanced(btc_collected)['is_valid']
+
+    def test_btc_error_entry(self):
+        assert is_btc_data_valid({'error': 'API down', 'price': 95000.0}) is False
+
+    @pytest.mark.parametrize('field, value', [
+        ('price', 425.0),
+        ('price', 5.0),
+        ('model_price', 0),
+        ('model_price', 12000.0),
+        ('deviation_pct', None),
+        ('deviation_pct', 250.0),
+        ('iv', 0),
+        ('iv', 600.0),
+    ])
+    def test_mstr_matches_full_validator(self, mstr_collected, field, value):
+        if field == 'price':
+            mstr_collected['price'] = value
+        else:
+            mstr_collected['indicators'][field] = value
+
+        assert is_mstr_data_valid(mstr_collected) is validate_mstr_data_quality(mstr_collected)['is_valid']
+
+    def test_mstr_incomplete_options_strategy(self, mstr_collected):
+        mstr_collected['analysis']['options_strategy'] = {}
+
+        assert is_mstr_data_valid(mstr_collected) is False
+        assert validate_mstr_data_quality(mstr_collected)['is_valid'] is False
+
+
+class TestAlertGeneration:
+    """Tests for the rule-driven BTC/MSTR alerts"""
+
+    def test_btc_sell_side_alerts(self):
+        alerts = generate_btc_alerts_enhanced({'indicators': {'mvrv': 3.5, 'weekly_rsi': 75.0}}, None)
+
+        assert [a['type'] for a in alerts] == ['mvrv_high', 'rsi_overbought']
+        assert alerts[0]['message'] == "BTC MVRV is high at 3.50 - potential sell signal"
+
+    def test_btc_buy_side_alerts(self):
+        alerts = generate_btc_alerts_enhanced({'indicators': {'mvrv': 0.8, 'weekly_rsi': 25.0}}, None)
+
+        assert [a['type'] for a in alerts] == ['mvrv_low', 'rsi_oversold']
+        assert alerts[1]['message'] == "BTC Weekly RSI is oversold at 25.0"
+
+    def test_btc_neutral_no_alerts(self):
+        alerts = generate_btc_alerts_enhanced({'indicators': {'mvrv': 2.0, 'weekly_rsi': 55.0}}, None)
+
+        assert alerts == []
+
+    def test_mstr_undervalued_alert(self):
+        mstr_data = {'price': 300.0, 'indicators': {'model_price': 400.0, 'deviation_pct': -25.0}}
+
+        alerts = generate_mstr_alerts(mstr_data, None)
+
+        assert alerts == [{
+            'type': 'mstr_undervalued',
+            'asset': 'MSTR',
+            'message': "MSTR is 25.0% undervalued ($300.00 vs $400.00)",
+            'severity': 'medium'
+        }]
+
+    def test_mstr_overvalued_alert(self):
+        mstr_data = {'price': 500.0, 'indicators': {'model_price': 400.0, 'deviation_pct': 25.0}}
+
+        alerts = generate_mstr_alerts(mstr_data, None)
+
+        assert alerts[0]['type'] == 'mstr_overvalued'
+        assert alerts[0]['severity'] == 'high'
+
+    def test_mstr_high_confidence_options_alert(self, mstr_collected):
+        mstr_collected['analysis']['options_strategy'] = {
+            'primary_strategy': 'long_puts',
+            'confidence': 'high',
+            'message': 'Buy puts'
+        }
+        mstr_collected['attempts_made'] = 2
+
+        alerts = generate_mstr_alerts(mstr_collected, None)
+
+        assert [a['type'] for a in alerts] == ['mstr_bearish_options', 'mstr_retry']
+        assert alerts[0]['message'] == "High confidence bearish options signal: Buy puts"
+
+    def test_mstr_low_confidence_options_no_alert(self, mstr_collected):
+        mstr_collected['analysis']['options_strategy'] = {'primary_strategy': 'long_calls', 'confidence': 'medium'}
+
+        alerts = generate_mstr_alerts(mstr_collected, None)
+
+        assert alerts == []
+
+
+class TestFailureReport:
+    """Tests for the skipped-report status message"""
+
+    def test_failure_report_lists_component_status(self, collected_data):
+        collected_data['MSTR'] = {'success': False, 'error': 'timeout'}
+        should_send = {'send': False, 'reason': 'Core components failed', 'details': 'MSTR collection failed'}
+        monetary = {'success': True, 'true_inflation_rate': 7.25}
+
+        message = _format_failure_report(should_send, collected_data, "", monetary)
+
+        assert "Reason: Core components failed" in message
+        assert "- BTC: ✅ SUCCESS" in message
+        assert "- MSTR: ❌ FAILED" in message
+        assert "- Bitcoin Laws Screenshot: ❌ FAILED" in message
+        assert "- Monetary Data: ✅ SUCCESS (True Inflation: 7.2%)" in message
+        assert "- Pi Cycle Indicator: ✅ SUCCESS (FAR - 35.7% gap)" in message
+        assert message.rstrip().endswith("MSTR collection failed")
+
+    def test_failure_report_without_monetary_data(self, collected_data):
+        should_send = {'send': False, 'reason': 'Core components failed'}
+
+        message = _format_failure_report(should_send, collected_data, "", {'success': False})
+
+        assert "- True Inflation Rate: ❌ NOT AVAILABLE" in message
+        assert "No additional details" in message
+
+
+class TestProcessAssetData:
+    """Tests for per-asset processing of collected data"""
+
+    def test_btc_and_mstr_entries(self, collected_data):
+        processed = process_asset_data_enhanced(collected_data)
+
+        btc = processed['assets']['BTC']
+        mstr = processed['assets']['MSTR']
+        assert btc['type'] == 'crypto'
+        assert btc['pi_cycle']['success'] is True
+        assert mstr['attempts_made'] == 1
+        assert mstr['has_options_strategy'] is True
+        assert processed['summary']['pi_cycle_available'] is True
+        assert processed['summary']['enhanced_features_available'] is True
+        assert processed['summary']['successful_collections'] == 2
+
+    def test_unknown_asset_gets_base_entry(self):
+        processed = process_asset_data_enhanced({'ETH': {'success': True, 'price': 3000.0}})
+
+        assert processed['assets']['ETH'] == {
+            'type': 'unknown',
+            'price': 3000.0,
+            'indicators': {},
+            'metadata': {},
+            'last_updated': None
+        }
+
+    def test_failed_asset_entry(self, collected_data):
+        collected_data['BTC'] = {'success': False, 'error': 'API down'}
+
+        processed = process_asset_data_enhanced(collected_data)
+
+        btc = processed['assets']['BTC']
+        assert btc['error'] == 'API down'
+        assert btc['last_updated'] == processed['timestamp']
+        assert processed['summary']['failed_collections'] == 1
+
+
+class TestCollectionPlan:
+    """Tests for the dependency-ordered asset collection scheduler"""
+
+    def test_dependent_asset_sees_upstream_result(self):
+        seen = {}
+
+        def collect_mstr(ctx):
+            seen.update(ctx)
+            return {'success': True, 'price': ctx['BTC']['price'] / 200}
+
+        plan = [
+            AssetSpec(name='MSTR', deps=('BTC',), fn=collect_mstr),
+            AssetSpec(name='BTC', deps=(), fn=lambda ctx: {'success': True, 'price': 95000.0}),
+        ]
+
+        collected = run_collection_plan(plan)
+
+        assert list(collected) == ['BTC', 'MSTR']
+        assert seen == {'BTC': {'success': True, 'price': 95000.0}}
+        assert collected['MSTR']['price'] == 475.0
+
+    def test_collector_exception_becomes_failed_entry(self):
+        def broken(ctx):
+            raise RuntimeError('API down')
+
+        collected = run_collection_plan([
+            AssetSpec(name='BTC', deps=(), fn=broken),
+            AssetSpec(name='MSTR', deps=('BTC',), fn=lambda ctx: {'success': not ctx['BTC']['success']}),
+        ])
+
+        assert collected['BTC'] == {'success': False, 'error': 'API down'}
+        assert collected['MSTR'] == {'success': True}
+
+    def test_unresolved_dependency(self):
+        collected = run_collection_plan([AssetSpec(name='MSTR', deps=('ETH',), fn=lambda ctx: {'success': True})])
+
+        assert collected['MSTR']['success'] is False
+        assert "ETH" in collected['MSTR']['error']
+
+    def test_mstr_falls_back_to_default_btc_price(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr('github_market_monitor.collect_mstr_data_with_retry',
+                            lambda price, max_attempts: calls.append((price, max_attempts)) or {'success': True})
+
+        _collect_mstr_data({'BTC': {'success': False, 'error': 'API down'}})
+
+        assert calls == [(95000, 3)]
+
+
+class TestMainStorage:
+    """Background storage is joined however main() exits"""
+
+    def test_storage_failure_logged_when_report_gating_raises(self, monkeypatch, collected_data, caplog):
+        storage = MagicMock()
+        storage.store_daily_data.side_effect = IOError("disk full")
+        monetary = MagicMock()
+        monetary.return_value.get_monetary_analysis.return_value = {'success': False, 'error': 'FRED down'}
+        for name, value in {
+            'setup_logging': lambda: None,
+            'AssetDataCollector': MagicMock(),
+            'EnhancedNotificationHandler': MagicMock(),
+            'DataStorage': lambda: storage,
+            'MonetaryAnalyzer': monetary,
+            'run_collection_plan': lambda plan: collected_data,
+            'process_asset_data_enhanced': lambda data: {'assets': {}},
+        }.items():
+            monkeypatch.setattr(github_market_monitor, name, value)
+
+        def gating_fails(*args):
+            raise RuntimeError("gating bug")
+        monkeypatch.setattr(github_market_monitor, 'should_send_daily_report_enhanced', gating_fails)
+
+        assert github_market_monitor.main() is False
+        storage.store_daily_data.assert_called_once()
+        assert 'Background data storage failed: disk full' in caplog.text
@@ -0,0 +1,87 @@
+import socket
+import threading
+
+import pytest
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+from unittest.mock import patch
+
+import http_client
+from http_client import get_session, KeepAliveAdapter, _json_loads, _json_dumps
+
+
+class TestSharedSession:
+    """Unit tests for the process-wide pooled session"""
+
+    def test_session_is_shared(self):
+        """Test every caller gets the same session"""
+        assert get_session() is get_session()
+
+    def test_session_is_shared_across_threads(self):
+        """Test concurrent first calls still build a single session"""
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(get_session())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(session is sessions[0] for session in sessions)
+
+    def test_default_headers(self):
+        """Test the session identifies the monitor and asks for keep-alive"""
+        headers = get_session().headers
+
+        assert headers['User-Agent'] == 'BTC-Monitor-Hybrid/1.0'
+        assert headers['Connection'] == 'keep-alive'
+
+    def test_accepts_every_decodable_encoding(self):
+        """Test compressed responses are requested in every encoding urllib3 can decode"""
+        accepted = get_session().headers['Accept-Encoding']
+
+        assert 'gzip' in accepted
+        assert accepted == ACCEPT_ENCODING
+
+    @pytest.mark.parametrize('url', [
+        'https://api.polygon.io/v2/aggs',
+        'https://api.coingecko.com/api/v3/simple/price',
+        'https://scanner.tradingview.com/crypto/scan',
+    ])
+    def test_every_https_host_uses_pooled_adapter(self, url):
+        """Test all API hosts go through the pooled keep-alive adapter"""
+        adapter = get_session().get_adapter(url)
+
+        assert isinstance(adapter, KeepAliveAdapter)
+        assert adapter._pool_maxsize == 20
+        assert adapter.max_retries.total == 3
+
+    def test_rate_limits_left_to_callers(self):
+        """Test 429 is not retried by the adapter, so callers' limiters see it"""
+        retries = get_session().get_adapter('https://api.polygon.io').max_retries
+
+        assert 429 not in retries.status_forcelist
+        assert {500, 502, 503, 504} <= set(retries.status_forcelist)
+
+    def test_sockets_keep_nodelay_and_keepalive(self):
+        """Test pooled sockets disable Nagle and enable TCP keepalive"""
+        adapter = get_session().get_adapter('https://api.polygon.io/v2/aggs')
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+class TestJsonHelpers:
+    """The JSON helpers behave the same with and without orjson"""
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_round_trip(self, use_orjson):
+        payload = {"columns": ["name", "close"], "range": [0, 50]}
+
+        with patch.object(http_client, 'orjson', http_client.orjson if use_orjson else None):
+            encoded = _json_dumps(payload)
+            decoded = _json_loads(encoded)
+
+        assert isinstance(encoded, bytes)
+        assert decoded == payload
@@ -1,7 +1,8 @@
 import pytest
+import base64
 import json
 from unittest.mock import Mock, patch, MagicMock, mock_open
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import requests
 
 
@@ -13,10 +14,25 @@ class TestMVRVScraper:
     """Unit tests for MVRVScraper class"""
 
     @pytest.fixture
-    def scraper(self):
+    def scraper(self, tmp_path):
         """Create MVRVScraper instance for testing"""
         from mvrv_scraper import MVRVScraper
-        return MVRVScraper()
+        return MVRVScraper(cache_dir=str(tmp_path))
+
+    @pytest.fixture(autouse=True)
+    def empty_driver_pool(self):
+        """Keep pooled mock drivers from leaking between tests"""
+        from mvrv_scraper import MVRVScraper
+        MVRVScraper._drain_pool()
+        yield
+        MVRVScraper._drain_pool()
+
+    def _assert_pooled(self, driver):
+        """The driver went back to the pool warm and is quit once the pool drains"""
+        from mvrv_scraper import MVRVScraper
+        driver.quit.assert_not_called()
+        MVRVScraper._drain_pool()
+        driver.quit.assert_called_once()
 
     @patch('mvrv_scraper.webdriver.Chrome')
     def test_scrape_mvrv_method1_success(self, mock_chrome, scraper):
@@ -25,29 +41,31 @@ class TestMVRVScraper:
         mock_driver = Mock()
         mock_chrome.return_value = mock_driver
 
-        # Mock element with MVRV data
-        mock_element = Mock()
-        mock_element.text = "MVRV: 2.45"
-        mock_driver.find_elements.return_value = [mock_element]
+        # Mock element text with MVRV data
+        mock_driver.execute_script.return_value = ["Bitcoin", "MVRV: 2.45"]
 
         result = scraper.scrape_mvrv_method1_selenium_wait()
 
         assert result == 2.45
         mock_driver.get.assert_called_once()
-        mock_driver.quit.assert_called_once()
+        self._assert_pooled(mock_driver)
+        # All candidate selectors go out as a single script call
+        mock_driver.execute_script.assert_called_once()
+        assert mock_driver.execute_script.call_args[0][1].count(', ') == 6
+        mock_driver.find_elements.assert_not_called()
 
     @patch('mvrv_scraper.webdriver.Chrome')
     def test_scrape_mvrv_method1_no_data(self, mock_chrome, scraper):
         """Test Method 1 when no MVRV data is found"""
         mock_driver = Mock()
         mock_chrome.return_value = mock_driver
-        mock_driver.find_elements.return_value = []
+        mock_driver.execute_script.return_value = []
         mock_driver.page_source = "<html>No MVRV data</html>"
 
         result = scraper.scrape_mvrv_method1_selenium_wait()
 
         assert result is None
-        mock_driver.quit.assert_called_once()
+        self._assert_pooled(mock_driver)
 
     @patch('mvrv_scraper.webdriver.Chrome')
     def test_scrape_mvrv_method1_driver_exception(self, mock_chrome, scraper):
@@ -58,28 +76,147 @@ class TestMVRVScraper:
 
         assert result is None
 
-    @patch('mvrv_scraper.requests.get')
-    def test_scrape_mvrv_method3_success(self, mock_get, scraper):
+    def test_scrape_mvrv_method3_success(self, scraper):
         """Test successful API-based scraping with Method 3"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": [{"mvrv": 3.15}]}
-        mock_get.return_value = mock_response
+        mock_response.content = b'{"data": [{"mvrv": 3.15}]}'
 
         # Mock the _extract_mvrv_from_json method to return the value
-        with patch.object(scraper, '_extract_mvrv_from_json', return_value=3.15):
+        with patch.object(scraper.session, 'post', return_value=mock_response) as mock_post, \
+                patch.object(scraper, '_extract_mvrv_from_json', return_value=3.15) as mock_extract:
             result = scraper.scrape_mvrv_method3_direct_api()
 
         assert result == 3.15
+        assert mock_post.call_args[0][0] == 'https://scanner.tradingview.com/crypto/scan'
+        assert json.loads(mock_post.call_args.kwargs['data'])['markets'] == ['crypto']
+        assert mock_post.call_args.kwargs['headers']['Referer'] == 'https://www.tradingview.com/'
+        mock_extract.assert_called_once_with({"data": [{"mvrv": 3.15}]})
 
-    @patch('mvrv_scraper.requests.post')
-    def test_scrape_mvrv_method3_api_failure(self, mock_post, scraper):
+    def test_scrape_mvrv_method3_api_failure(self, scraper):
         """Test Method 3 handling API failures"""
-        mock_post.side_effect = requests.exceptions.RequestException("API failed")
+        with patch.object(scraper.session, 'post', side_effect=requests.exceptions.RequestException("API failed")):
+            result = scraper.scrape_mvrv_method3_direct_api()
+
+        assert result is None
+
+    def test_user_agents_drawn_once(self, tmp_path):
+        """Test that user agents come from a pool built at construction"""
+        from mvrv_scraper import MVRVScraper
+        with patch('mvrv_scraper.UserAgent') as mock_ua_cls:
+            type(mock_ua_cls.return_value).random = property(lambda self: 'UA-test')
+            scraper = MVRVScraper(cache_dir=str(tmp_path))
+
+        assert scraper._ua_pool == ['UA-test'] * 20
+        assert scraper.headers['User-Agent'] == 'UA-test'
+
+    def test_user_agent_fallback(self, tmp_path):
+        """Test that a failing fake_useragent falls back to a fixed user agent"""
+        from mvrv_scraper import MVRVScraper, _FALLBACK_USER_AGENT
+        with patch('mvrv_scraper.UserAgent', side_effect=Exception("no data")):
+            scraper = MVRVScraper(cache_dir=str(tmp_path))
+
+        assert scraper._ua_pool == [_FALLBACK_USER_AGENT]
+
+    def test_session_reuses_pooled_connections(self, scraper):
+        """Test that HTTP calls go through the process-wide pooled, retrying session"""
+        from http_client import get_session
+        adapter = scraper.session.get_adapter('https://scanner.tradingview.com/crypto/scan')
+
+        assert scraper.session is get_session()
+        assert adapter._pool_maxsize == 20
+        assert adapter.max_retries.total == 3
+        assert scraper.headers['Referer'] == 'https://www.tradingview.com/'
+
+    def test_injected_session_is_used(self, tmp_path):
+        """Test a caller-supplied session replaces the default pooled one"""
+        from mvrv_scraper import MVRVScraper
+        session = Mock()
+
+        scraper = MVRVScraper(cache_dir=str(tmp_path), session=session)
+
+        assert scraper.session is session
+
+    def _perf_log_entry(self, url, request_id='1', mime_type='application/json'):
+        """Build a performance log entry for a received network response"""
+        return {'message': json.dumps({'message': {
+            'method': 'Network.responseReceived',
+            'params': {'requestId': request_id, 'response': {'url': url, 'mimeType': mime_type}}
+        }})}
+
+    def test_extract_via_perf_log_reads_response_bodies(self, scraper):
+        """Test that Method 2 polls the network log and reads the API payload from Chrome"""
+        mock_driver = Mock()
+        mock_driver.current_url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
+        mock_driver.get_log.side_effect = [
+            [self._perf_log_entry('https://www.tradingview.com/static/chart.js', '7', 'application/javascript')],
+            [self._perf_log_entry('https://api.tradingview.com/chart/data', '9')],
+        ]
+        mock_driver.execute_cdp_cmd.return_value = {'body': '{"mvrv": 2.31}', 'base64Encoded': False}
+
+        with patch.object(scraper.session, 'get') as mock_get:
+            result = scraper._extract_via_perf_log(mock_driver)
+
+        assert result == 2.31
+        mock_driver.execute_cdp_cmd.assert_called_once_with('Network.getResponseBody', {'requestId': '9'})
+        mock_get.assert_not_called()
+
+    def test_extract_via_perf_log_skips_other_events(self, scraper):
+        """Test that Method 2 only decodes responseReceived entries"""
+        mock_driver = Mock()
+        mock_driver.current_url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
+        mock_driver.get_log.side_effect = [[
+            {'message': '{"message": {"method": "Network.dataReceived", truncated'},
+            self._perf_log_entry('https://api.tradingview.com/chart/data'),
+        ], []]
+        mock_driver.execute_cdp_cmd.return_value = {'body': '{"mvrv": 2.31}'}
+
+        assert scraper._extract_via_perf_log(mock_driver) == 2.31
+
+    def test_extract_via_perf_log_base64_body(self, scraper):
+        """Test that Method 2 decodes base64-encoded response bodies"""
+        mock_driver = Mock()
+        mock_driver.current_url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
+        mock_driver.get_log.side_effect = [[self._perf_log_entry('https://api.tradingview.com/quote/BTC')], []]
+        mock_driver.execute_cdp_cmd.return_value = {
+            'body': base64.b64encode(b'{"last": 1.64}').decode(), 'base64Encoded': True
+        }
 
-        result = scraper.scrape_mvrv_method3_direct_api()
+        assert scraper._extract_via_perf_log(mock_driver) == 1.64
+
+    def test_extract_via_perf_log_stops_when_network_quiet(self, scraper):
+        """Test that Method 2 gives up once the network log stops growing"""
+        mock_driver = Mock()
+        mock_driver.current_url = 'https://www.tradingview.com/chart/?symbol=BTC_MVRV'
+        mock_driver.get_log.side_effect = [
+            [self._perf_log_entry('https://www.tradingview.com/static/app.js')],
+            [],
+        ]
+
+        result = scraper._extract_via_perf_log(mock_driver)
 
         assert result is None
+        assert mock_driver.get_log.call_count == 2
+
+    def test_extract_via_js_waits_for_document(self, scraper):
+        """Test that Method 4 waits for the document before probing it"""
+        mock_driver = Mock()
+        mock_driver.execute_script.side_effect = lambda js: (
+            'complete' if js == 'return document.readyState' else "MVRV 1.87"
+        )
+
+        result = scraper._extract_via_js(mock_driver)
+
+        assert result == 1.87
+
+    def test_extract_via_js_skips_out_of_range_numbers(self, scraper):
+        """Test that Method 4 keeps scanning past prices in a probe's text"""
+        mock_driver = Mock()
+        mock_driver.execute_script.side_effect = lambda js: (
+            'complete' if js == 'return document.readyState' else ["BTC 97250.50 MVRV 2.12"]
+        )
+
+        assert scraper._extract_via_js(mock_driver) == 2.12
 
     def test_extract_mvrv_from_json_success(self, scraper):
         """Test extracting MVRV value from JSON data"""
@@ -89,6 +226,53 @@ class TestMVRVScraper:
 
         assert result == 2.67
 
+    def test_extract_mvrv_from_json_skips_out_of_range(self, scraper):
+        """Test that out-of-range matches are skipped in favour of a later valid one"""
+        test_data = {"mvrv": 15.0, "value": 45000.5, "last": 1.95}
+
+        result = scraper._extract_mvrv_from_json(test_data)
+
+        assert result == 1.95
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_scrape_mvrv_method1_page_source(self, mock_chrome, scraper):
+        """Test Method 1 falling back to the page source"""
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+        mock_driver.execute_script.return_value = []
+        mock_driver.page_source = '<script>{"last": 98000.12, "close": 2.38}</script>'
+
+        result = scraper.scrape_mvrv_method1_selenium_wait()
+
+        assert result == 2.38
+
+    def test_extract_from_page_nodes(self, scraper):
+        """Test reading the MVRV value from the legend nodes of the page HTML"""
+        page_source = (
+            '<html><body><div class="price-axis last-value">97250.50</div>'
+            '<div data-name="legend-source-item"><span>MVRV</span> <span>2.27</span></div>'
+            '<script>{"close": 1.11}</script></body></html>'
+        )
+
+        assert scraper._extract_from_page_nodes(page_source) == 2.27
+
+    def test_extract_from_page_nodes_empty_source(self, scraper):
+        """Test that an empty page source yields no value"""
+        assert scraper._extract_from_page_nodes('') is None
+
+    def test_extract_mvrv_from_json_nested(self, scraper):
+        """Test extracting MVRV from nested structures and text leaves"""
+        assert scraper._extract_mvrv_from_json({"data": [{"s": "BTC", "d": {"last": 2.04}}]}) == 2.04
+        assert scraper._extract_mvrv_from_json([{"note": "BTC MVRV ratio 1.76"}]) == 1.76
+        assert scraper._extract_mvrv_from_json({"MVRV": "2.5x", "flag": True}) == 2.5
+
+    def test_extract_mvrv_from_json_prefers_mvrv_key(self, scraper):
+        """Test an mvrv key anywhere wins over generic value/last keys that come earlier"""
+        assert scraper._extract_mvrv_from_json({"value": 0.5, "mvrv": 2.3}) == 2.3
+        assert scraper._extract_mvrv_from_json({"last": 0.7, "data": [{"value": 0.5}, {"MVRV": {"v": 2.3}}]}) == 2.3
+        assert scraper._extract_mvrv_from_json({"last": 0.7, "value": 0.5}) == 0.5
+        assert scraper._extract_mvrv_from_json({"close": 2.04}) is None
+
     def test_extract_mvrv_from_json_no_mvrv(self, scraper):
         """Test extracting MVRV when no valid data exists"""
         test_data = {"price": 45000, "volume": 1000000}
@@ -107,17 +291,162 @@ class TestMVRVScraper:
 
     def test_get_mvrv_value_fallback(self, scraper):
         """Test that get_mvrv_value returns fallback when all methods fail"""
-        with patch.object(scraper, 'scrape_mvrv_method1_selenium_wait', return_value=None), \
-                patch.object(scraper, 'scrape_mvrv_method2_api_intercept', return_value=None), \
-                patch.object(scraper, 'scrape_mvrv_method3_direct_api', return_value=None), \
-                patch.object(scraper, 'scrape_mvrv_method4_execute_js', return_value=None):
+        with patch.object(scraper, 'scrape_mvrv_method3_direct_api', return_value=None), \
+                patch.object(scraper, '_scrape_browser_methods', return_value=None):
             result = scraper.get_mvrv_value()
 
             assert result == 2.1  # Fallback value
 
-    def test_get_mvrv_value_first_method_success(self, scraper):
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_get_mvrv_value_first_method_success(self, mock_chrome, scraper):
         """Test that get_mvrv_value returns from first successful method"""
-        with patch.object(scraper, 'scrape_mvrv_method1_selenium_wait', return_value=2.89):
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+
+        with patch.object(scraper, 'scrape_mvrv_method3_direct_api', return_value=None), \
+                patch.object(scraper, '_extract_via_css', return_value=2.89), \
+                patch.object(scraper, '_extract_via_perf_log') as mock_perf_log:
             result = scraper.get_mvrv_value()
 
             assert result == 2.89
+            mock_perf_log.assert_not_called()
+            self._assert_pooled(mock_driver)
+
+    def test_get_mvrv_value_direct_api_skips_browser(self, scraper):
+        """Test that a Direct API hit never starts the Selenium methods"""
+        with patch.object(scraper, 'scrape_mvrv_method3_direct_api', return_value=2.45), \
+                patch.object(scraper, '_scrape_browser_methods') as mock_browser:
+            result = scraper.get_mvrv_value()
+
+        assert result == 2.45
+        mock_browser.assert_not_called()
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_browser_methods_share_one_driver(self, mock_chrome, scraper):
+        """Test that all browser extractions run against a single page load"""
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+
+        with patch.object(scraper, '_extract_via_css', return_value=None), \
+                patch.object(scraper, '_extract_via_perf_log', side_effect=RuntimeError("boom")), \
+                patch.object(scraper, '_extract_via_js', return_value=2.45) as mock_js:
+            result = scraper._scrape_browser_methods()
+
+        assert result == 2.45
+        mock_chrome.assert_called_once()
+        mock_driver.get.assert_called_once()
+        mock_js.assert_called_once_with(mock_driver)
+        self._assert_pooled(mock_driver)
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_pooled_driver_reused_across_scrapes(self, mock_chrome, scraper):
+        """Test that a second scrape reuses the warm driver instead of starting Chrome"""
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+
+        with patch.object(scraper, '_extract_via_css', return_value=2.45):
+            scraper._scrape_browser_methods()
+            scraper._scrape_browser_methods()
+
+        mock_chrome.assert_called_once()
+        assert mock_driver.get.call_count == 2
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_dead_pooled_driver_replaced(self, mock_chrome, scraper):
+        """Test that a pooled driver whose browser died is discarded"""
+        dead_driver = Mock()
+        dead_driver.get_log.side_effect = Exception("chrome not reachable")
+        scraper._release_driver(dead_driver)
+        fresh_driver = Mock()
+        mock_chrome.return_value = fresh_driver
+
+        assert scraper._acquire_driver() is fresh_driver
+        dead_driver.quit.assert_called_once()
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_driver_quit_when_page_load_fails(self, mock_chrome, scraper):
+        """Test that a driver that failed mid-use is quit rather than pooled"""
+        mock_driver = Mock()
+        mock_driver.get.side_effect = Exception("net::ERR_CONNECTION_RESET")
+        mock_chrome.return_value = mock_driver
+
+        assert scraper.scrape_mvrv_method1_selenium_wait() is None
+        mock_driver.quit.assert_called_once()
+        assert scraper._driver_pool.empty()
+
+    def test_full_pool_quits_extra_drivers(self, scraper):
+        """Test that drivers beyond the pool size are quit on release"""
+        drivers = [Mock(), Mock(), Mock()]
+        for driver in drivers:
+            scraper._release_driver(driver)
+
+        drivers[0].quit.assert_not_called()
+        drivers[1].quit.assert_not_called()
+        drivers[2].quit.assert_called_once()
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_driver_skips_heavy_resources(self, mock_chrome, scraper):
+        """Test that the chart is loaded eagerly without images or stylesheets"""
+        with scraper._get_driver():
+            pass
+
+        options = mock_chrome.call_args.kwargs['options']
+        assert options.page_load_strategy == 'eager'
+        assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+        assert '--blink-settings=imagesEnabled=false' in options.arguments
+
+    @patch('mvrv_scraper.webdriver.Chrome')
+    def test_browser_methods_chrome_failure(self, mock_chrome, scraper):
+        """Test that a browser that fails to start yields None"""
+        mock_chrome.side_effect = Exception("WebDriver failed")
+
+        assert scraper._scrape_browser_methods() is None
+
+    def test_get_mvrv_value_uses_cache(self, scraper):
+        """Test that a value scraped earlier is served from the cache"""
+        with patch.object(scraper, 'scrape_mvrv_method3_direct_api', return_value=2.89):
+            scraper.get_mvrv_value()
+
+        with patch.object(scraper, 'scrape_mvrv_method3_direct_api') as mock_method3:
+            result = scraper.get_mvrv_value()
+
+        assert result == 2.89
+        mock_method3.assert_not_called()
+
+    def test_get_mvrv_value_fallback_not_cached(self, scraper):
+        """Test that the fallback value is never written to the cache"""
+        with patch.object(scraper, 'scrape_mvrv_method3_direct_api', return_value=None), \
+                patch.object(scraper, '_scrape_browser_methods', return_value=None):
+            scraper.get_mvrv_value()
+
+        assert scraper._cache.get("mvrv") is None
+
+
+class TestFileCache:
+    """Unit tests for the MVRV FileCache"""
+
+    def test_round_trip(self, tmp_path):
+        from mvrv_scraper import FileCache
+        cache = FileCache(str(tmp_path), timedelta(hours=12))
+
+        cache.set("mvrv", 2.45)
+
+        assert cache.get("mvrv") == 2.45
+        assert len(list(tmp_path.glob("mvrv_*.json"))) == 1
+
+    def test_expired_entry(self, tmp_path):
+        from mvrv_scraper import FileCache
+        cache = FileCache(str(tmp_path), timedelta(hours=12))
+        now = datetime.now().timestamp()
+        with open(cache._path("mvrv", now), 'w') as f:
+            json.dump({'value': 2.45, 'ts': now - 13 * 3600}, f)
+
+        assert cache.get("mvrv") is None
+
+    def test_unreadable_entry(self, tmp_path):
+        from mvrv_scraper import FileCache
+        cache = FileCache(str(tmp_path), timedelta(hours=12))
+        with open(cache._path("mvrv", datetime.now().timestamp()), 'w') as f:
+            f.write("not json")
+
+        assert cache.get("mvrv") is None